@@ -12,23 +12,30 @@ from tools.validation_tools import (
 )
 from source_profiles import SourceProfileRegistry, SourceProfile
 from safeguards import validate_source_text_not_fixture
+from result_cache import ExtractionResultCache, make_cache_key
 from rich.console import Console
 from rich.panel import Panel
 from rich.json import JSON
 from rich.table import Table
 from pathlib import Path
 from typing import Optional, List, Dict, Any
+import copy
 import json
 import logging
 import time
 from uuid import uuid4
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Import learning system
 try:
-    from learning_system import ExtractionLearner
+    from learning_system import ExtractionLearner, count_candidate_examples
     LEARNING_AVAILABLE = True
 except ImportError:
     LEARNING_AVAILABLE = False
@@ -97,7 +104,12 @@ class ConversationPrinter:
                             tool_name = block.get("name", "unknown")
                             tool_input = block.get("input", {})
                             console.print(f"  [yellow]Using tool: {tool_name}[/yellow]")
-                            tool_input_str = json.dumps(tool_input, indent=2, ensure_ascii=False)
+                            if orjson is not None:
+                                tool_input_str = orjson.dumps(
+                                    tool_input, option=orjson.OPT_INDENT_2
+                                ).decode('utf-8')
+                            else:
+                                tool_input_str = json.dumps(tool_input, indent=2, ensure_ascii=False)
                             if len(tool_input_str) > 300:
                                 console.print(f"    [dim]Input: {tool_input_str[:300]}...[/dim]")
                             else:
@@ -315,18 +327,25 @@ class PLAgentSDK:
 
         if self.use_few_shot:
             try:
-                self.learner = ExtractionLearner()
-                stats = self.learner.get_statistics()
-                if stats['total_examples'] >= 5:
-                    logger.info(
-                        f"Few-shot learning enabled: {stats['total_examples']} examples "
-                        f"(avg confidence: {stats['avg_confidence']:.2f})"
-                    )
-                else:
-                    logger.info(
-                        f"Few-shot learning: insufficient examples ({stats['total_examples']}/5)"
-                    )
+                # Cheap byte scan first: if there cannot be enough examples,
+                # skip parsing the output directory entirely
+                candidates = count_candidate_examples(limit=5)
+                if candidates < 5:
+                    logger.info(f"Few-shot learning: insufficient examples ({candidates}/5)")
                     self.use_few_shot = False
+                else:
+                    self.learner = ExtractionLearner()
+                    stats = self.learner.get_statistics()
+                    if stats['total_examples'] >= 5:
+                        logger.info(
+                            f"Few-shot learning enabled: {stats['total_examples']} examples "
+                            f"(avg confidence: {stats['avg_confidence']:.2f})"
+                        )
+                    else:
+                        logger.info(
+                            f"Few-shot learning: insufficient examples ({stats['total_examples']}/5)"
+                        )
+                        self.use_few_shot = False
             except Exception as e:
                 logger.warning(f"Failed to initialize learning system: {e}")
                 self.use_few_shot = False
@@ -334,6 +353,39 @@ class PLAgentSDK:
 
         logger.info(f"PLAgentSDK initialized successfully (mode={self.extraction_mode})")
 
+    def spawn_worker(self) -> "PLAgentSDK":
+        """
+        Create an SDK for another thread that reuses this one's setup.
+
+        The Anthropic client (thread-safe, with its own connection pool),
+        tools, source profiles and few-shot learner are shared read-only;
+        only the per-extraction tracking state (token counters, conversation
+        turns, last messages) is fresh, so the instances can extract
+        concurrently without re-running initialization.
+
+        Returns:
+            New PLAgentSDK sharing this instance's client and learner
+        """
+        worker = copy.copy(self)
+        worker.total_input_tokens = 0
+        worker.total_output_tokens = 0
+        worker.conversation_turns = 0
+        worker._last_messages = []
+        return worker
+
+    def get_anthropic_client(self) -> Anthropic:
+        """
+        Return the SDK's Anthropic client.
+
+        Callers that need ad-hoc API access (e.g. connection checks) should
+        use this rather than constructing their own client, so they share
+        the SDK's HTTP connection pool instead of opening a new TLS session.
+
+        Returns:
+            The Anthropic client used for extractions
+        """
+        return self.client
+
     def _create_single_pass_system_prompt(self, profile: SourceProfile) -> str:
         """Create compact system prompt for single-pass extraction."""
         del profile  # Universal prompt for now.
@@ -365,10 +417,37 @@ class PLAgentSDK:
     def extract_bio_agentic(
         self,
         source_text: str,
-        source_url: str
+        source_url: str,
+        use_cache: bool = False
     ) -> AgentExtractionResult:
-        """Extract officer biography using single-pass mode."""
-        return self._extract_single_pass(source_text=source_text, source_url=source_url)
+        """
+        Extract officer biography using single-pass mode.
+
+        Args:
+            source_text: Biographical source text
+            source_url: URL the text came from
+            use_cache: If True, return a cached result for the same model,
+                URL and text when one exists (see CONFIG.EXTRACTION_CACHE_DIR),
+                and cache successful results. Cache hits skip the API call and
+                its side effects (e.g. saving the bio).
+
+        Returns:
+            AgentExtractionResult
+        """
+        if not use_cache:
+            return self._extract_single_pass(source_text=source_text, source_url=source_url)
+
+        cache = ExtractionResultCache(CONFIG.EXTRACTION_CACHE_DIR, CONFIG.EXTRACTION_CACHE_TTL_SECONDS)
+        key = make_cache_key(self.model, source_url, source_text)
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info("Returning cached extraction result")
+            return cached
+
+        result = self._extract_single_pass(source_text=source_text, source_url=source_url)
+        if result.success:
+            cache.set(key, result)
+        return result
 
     def _extract_single_pass(self, source_text: str, source_url: str) -> AgentExtractionResult:
         """Single-pass extraction with local validation and gated verification."""
@@ -398,8 +477,7 @@ class PLAgentSDK:
                 tools_override=[]
             )
             self._last_messages.append({"role": "assistant", "content": response.content})
-            self.total_input_tokens += response.usage.input_tokens
-            self.total_output_tokens += response.usage.output_tokens
+            self._record_usage(response)
 
             payload = self._extract_json_payload(response.content)
             if not payload:
@@ -564,10 +642,25 @@ class PLAgentSDK:
             tools_override=[]
         )
         self._last_messages.append({"role": "assistant", "content": response.content})
-        self.total_input_tokens += response.usage.input_tokens
-        self.total_output_tokens += response.usage.output_tokens
+        self._record_usage(response)
         return self._extract_json_payload(response.content)
 
+    def _record_usage(self, response: Any) -> None:
+        """
+        Add a response's token usage to the running totals.
+
+        With prompt caching, usage.input_tokens only counts the uncached
+        part of the prompt; cache writes and reads are reported separately
+        and are added back so total_input_tokens stays the full prompt size.
+        """
+        usage = response.usage
+        self.total_input_tokens += (
+            usage.input_tokens
+            + (getattr(usage, "cache_creation_input_tokens", 0) or 0)
+            + (getattr(usage, "cache_read_input_tokens", 0) or 0)
+        )
+        self.total_output_tokens += usage.output_tokens
+
     def _call_api_with_retry(
         self,
         messages: List[Dict[str, Any]],
@@ -595,7 +688,13 @@ class PLAgentSDK:
                 response = self.client.messages.create(
                     model=self.model,
                     max_tokens=max_tokens,
-                    system=system_prompt,
+                    # Cache breakpoint after the static prefix (tools, then
+                    # system prompt); the source text only appears in messages
+                    system=[{
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }],
                     tools=self.tools if tools_override is None else tools_override,
                     messages=messages
                 )
@@ -707,26 +806,37 @@ class PLAgentSDK:
             Confidence score (0.0-1.0)
         """
         # Deterministic score from extraction completeness and tool outcomes.
-        bio_dict = officer_bio.to_dict(exclude_none=True)
         key_fields = [
             'pinyin_name', 'hometown', 'birth_date', 'enlistment_date',
             'party_membership_date', 'promotions', 'notable_positions'
         ]
-        populated = sum(1 for field in key_fields if field in bio_dict)
+        populated = sum(1 for field in key_fields if getattr(officer_bio, field) is not None)
         completeness_score = populated / len(key_fields) if key_fields else 0.0
 
-        date_validation_score = 1.0 if any(
-            tc.tool_name == "validate_dates" and tc.success for tc in tool_calls
-        ) else 0.0
-
-        verify_calls = [tc for tc in tool_calls if tc.tool_name == "verify_information_present"]
-        if verify_calls:
-            verification_score = sum(1 for tc in verify_calls if tc.success) / len(verify_calls)
+        # Tally every tool-call counter in a single pass
+        dates_validated = False
+        verify_total = 0
+        verify_successes = 0
+        tool_successes = 0
+        for tc in tool_calls:
+            if tc.success:
+                tool_successes += 1
+            if tc.tool_name == "validate_dates":
+                dates_validated = dates_validated or tc.success
+            elif tc.tool_name == "verify_information_present":
+                verify_total += 1
+                if tc.success:
+                    verify_successes += 1
+
+        date_validation_score = 1.0 if dates_validated else 0.0
+
+        if verify_total:
+            verification_score = verify_successes / verify_total
         else:
             verification_score = 0.5
 
         if tool_calls:
-            tool_success_ratio = sum(1 for tc in tool_calls if tc.success) / len(tool_calls)
+            tool_success_ratio = tool_successes / len(tool_calls)
         else:
             tool_success_ratio = 0.0
 
@@ -770,14 +880,15 @@ class PLAgentSDK:
 
         output_file = output_dir / filename
 
-        # Save with proper UTF-8 encoding
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(
-                result.to_dict(exclude_none=True),
-                f,
-                ensure_ascii=False,
-                indent=2
-            )
+        # Save with proper UTF-8 encoding. orjson emits UTF-8 bytes with the
+        # same 2-space layout as json.dump(ensure_ascii=False, indent=2), so
+        # the byte-level checks in learning_system still match
+        result_dict = result.to_dict(exclude_none=True)
+        if orjson is not None:
+            output_file.write_bytes(orjson.dumps(result_dict, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(result_dict, f, ensure_ascii=False, indent=2)
 
         logger.info(f"Result saved to {output_file}")
         console.print(f"[green]✓ Result saved to {output_file}[/green]")
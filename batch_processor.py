@@ -6,15 +6,17 @@ import logging
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from threading import Lock
+from threading import Lock, local
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from collections import Counter
+from uuid import uuid4
 import json
 
 try:
     from tqdm import tqdm
 except ImportError:
     class _NoopTqdm:
-        def __init__(self, total=None, desc="", unit=""):
+        def __init__(self, total=None, desc="", unit="", mininterval=0.1):
             self.total = total
             self.desc = desc
             self.unit = unit
@@ -25,7 +27,7 @@ except ImportError:
         def __exit__(self, exc_type, exc, tb):
             return False
 
-        def set_description(self, _desc):
+        def set_description(self, _desc, refresh=True):
             return None
 
         def update(self, _n=1):
@@ -33,7 +35,7 @@ except ImportError:
 
     def tqdm(*args, **kwargs):
         return _NoopTqdm(*args, **kwargs)
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
@@ -48,6 +50,9 @@ from safeguards import validate_source_text_not_fixture
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Minimum seconds between progress bar redraws (~4 refreshes per second)
+PROGRESS_MIN_INTERVAL_SECONDS = 0.25
+
 
 class BatchProcessor:
     """Batch processor for extracting officer biographies from multiple obituaries."""
@@ -74,6 +79,9 @@ class BatchProcessor:
             logger.error(f"Failed to initialize PLAgentSDK: {e}")
             raise
 
+        self.require_db = require_db
+        self._worker_state = local()
+
         # Rate limiting configuration
         self.rate_limit_seconds = rate_limit_seconds
         self.last_request_time = 0
@@ -84,6 +92,7 @@ class BatchProcessor:
         self.total_successful = 0
         self.total_failed = 0
         self.total_flagged_for_review = 0
+        self.total_tokens = 0
 
         # Output directories
         self.output_dir = Path("output")
@@ -138,8 +147,10 @@ class BatchProcessor:
             else:
                 officer_name = "unknown"
 
+            # The uuid suffix keeps concurrent workers saving the same
+            # officer within one second from overwriting each other
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{officer_name}_{timestamp}.json"
+            filename = f"{officer_name}_{timestamp}_{uuid4().hex[:8]}.json"
             filepath = self.output_dir / filename
 
             # Create output dictionary
@@ -172,7 +183,7 @@ class BatchProcessor:
                 officer_name = "unknown"
 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"REVIEW_{officer_name}_{timestamp}.json"
+            filename = f"REVIEW_{officer_name}_{timestamp}_{uuid4().hex[:8]}.json"
             filepath = self.review_dir / filename
 
             # Create review data
@@ -190,99 +201,222 @@ class BatchProcessor:
         except Exception as e:
             logger.error(f"Failed to flag result for review: {e}")
 
-    def process_urls(self, urls: List[str], save_to_db: bool = False) -> List[AgentExtractionResult]:
+    def _get_worker_sdk(self) -> PLAgentSDK:
+        """
+        Get the calling thread's own PLAgentSDK.
+
+        The SDK keeps per-extraction state (token counters, conversation
+        turns, last messages) on the instance, so concurrent workers each
+        need a separate one. Workers are spawned from self.sdk and share its
+        Anthropic client and few-shot learner instead of building their own.
+
+        Returns:
+            PLAgentSDK instance bound to the current thread
+        """
+        sdk = getattr(self._worker_state, 'sdk', None)
+        if sdk is None:
+            sdk = self.sdk.spawn_worker()
+            self._worker_state.sdk = sdk
+        return sdk
+
+    def _extract_from_url(
+        self,
+        url: str,
+        source_text: Optional[str],
+        sdk: PLAgentSDK,
+        apply_rate_limit: bool = True
+    ) -> Optional[AgentExtractionResult]:
+        """
+        Run one extraction for an already-fetched source.
+
+        Args:
+            url: Source URL
+            source_text: Fetched source text (None if the fetch failed)
+            sdk: SDK instance to extract with
+            apply_rate_limit: Whether to wait for the rate limiter first
+
+        Returns:
+            Extraction result, or None if the fetch failed
+        """
+        if apply_rate_limit:
+            self._rate_limit()
+
+        if not source_text:
+            logger.error(f"Failed to fetch source from {url}")
+            return None
+
+        validate_source_text_not_fixture(source_text, url, Path(__file__).parent)
+        return sdk.extract_bio_agentic(
+            source_text=source_text,
+            source_url=url
+        )
+
+    def _handle_result(
+        self,
+        result: Optional[AgentExtractionResult],
+        url: str,
+        save_to_db: bool,
+        review_threshold: float
+    ) -> AgentExtractionResult:
+        """
+        Record, save, and route one extraction result.
+
+        Updates counters, saves the result file, and either flags it for
+        review or (optionally) saves it to the database. Always called from
+        the thread driving the batch, so counters need no locking.
+
+        Args:
+            result: Extraction result, or None if the source fetch failed
+            url: Source URL
+            save_to_db: Whether to save high-confidence results to database
+            review_threshold: Confidence below which results are flagged
+
+        Returns:
+            The result to report for this URL
+        """
+        # Fetch failures are counted but not saved or flagged
+        if result is None:
+            self.total_failed += 1
+            return AgentExtractionResult(
+                officer_bio=None,
+                success=False,
+                error_message="Failed to fetch source content"
+            )
+
+        # Update counters
+        if result.success:
+            self.total_successful += 1
+        else:
+            self.total_failed += 1
+        self.total_tokens += result.get_total_tokens()
+
+        # Save result to file
+        self._save_result_to_file(result, url)
+
+        # Check confidence and flag for review if needed
+        if result.success and result.officer_bio:
+            confidence = result.officer_bio.confidence_score
+
+            if confidence < review_threshold:
+                # Low confidence - flag for review
+                self.flag_for_review(
+                    result,
+                    url,
+                    f"Low confidence score: {confidence:.2f} (threshold: {review_threshold:.2f})"
+                )
+            elif save_to_db:
+                # High confidence - save to database if requested
+                try:
+                    db_result = save_officer_bio_to_database(result.officer_bio)
+                    if db_result:
+                        logger.info(f"✓ Saved to database: {result.officer_bio.name}")
+                    else:
+                        logger.warning(f"⚠ Database save failed for: {result.officer_bio.name}")
+                except Exception as e:
+                    logger.error(f"Database error for {result.officer_bio.name}: {e}")
+        else:
+            # Extraction failed - flag for review
+            self.flag_for_review(
+                result,
+                url,
+                f"Extraction failed: {result.error_message}"
+            )
+
+        return result
+
+    def process_urls(
+        self,
+        urls: List[str],
+        save_to_db: bool = False,
+        max_workers: int = 1
+    ) -> List[AgentExtractionResult]:
         """
         Process multiple URLs and extract officer biographies.
 
         Args:
             urls: List of source URLs to process
             save_to_db: Whether to save high-confidence results to database
+            max_workers: Number of extractions to run concurrently. Each
+                source is network-bound (fetch + API round-trips), so
+                several can overlap; request starts are still spaced by
+                the rate limiter.
         Returns:
-            List of extraction results
+            List of extraction results, in the same order as urls
         """
-        results = []
         profile_registry = SourceProfileRegistry()
         profile = profile_registry.get("universal")
         review_threshold = profile.min_confidence_threshold
 
         console.print(f"\n[bold cyan]Processing {len(urls)} sources...[/bold cyan]\n")
 
-        # Process each URL with progress bar
-        with tqdm(total=len(urls), desc="Processing sources", unit="source") as pbar:
-            for i, url in enumerate(urls):
-                pbar.set_description(f"Processing {i+1}/{len(urls)}")
+        if max_workers > 1 and len(urls) > 1:
+            results = self._process_urls_concurrently(urls, save_to_db, max_workers, review_threshold)
+        else:
+            results = self._process_urls_sequentially(urls, save_to_db, review_threshold)
 
-                try:
-                    self.total_processed += 1
+        console.print(f"\n[bold green]✓ Completed processing {self.total_processed} sources[/bold green]\n")
+        return results
 
-                    # Apply rate limiting
-                    if i > 0:  # Skip rate limit for first request
-                        self._rate_limit()
+    def _process_urls_sequentially(
+        self,
+        urls: List[str],
+        save_to_db: bool,
+        review_threshold: float
+    ) -> List[AgentExtractionResult]:
+        """
+        Process URLs one at a time, prefetching the next source.
 
-                    # Fetch source text
-                    source_text = self._fetch_source(url)
-                    if not source_text:
-                        logger.error(f"Failed to fetch source from {url}")
-                        self.total_failed += 1
+        Args:
+            urls: List of source URLs to process
+            save_to_db: Whether to save high-confidence results to database
+            review_threshold: Confidence below which results are flagged
 
-                        results.append(AgentExtractionResult(
-                            officer_bio=None,
-                            success=False,
-                            error_message="Failed to fetch source content"
-                        ))
-                        continue
+        Returns:
+            List of extraction results
+        """
+        results = []
 
-                    # Extract biography using agent
-                    validate_source_text_not_fixture(source_text, url, Path(__file__).parent)
-                    logger.info(f"Extracting biography for URL {i+1}/{len(urls)}")
-                    result = self.sdk.extract_bio_agentic(
-                        source_text=source_text,
-                        source_url=url
-                    )
+        # Process each URL with progress bar; redraws are throttled to a few
+        # per second instead of forcing one on every description change.
+        # The next source is fetched on a background thread while the
+        # current one is being extracted, so network I/O overlaps API calls.
+        with ThreadPoolExecutor(max_workers=1) as prefetcher, tqdm(
+            total=len(urls),
+            desc="Processing sources",
+            unit="source",
+            mininterval=PROGRESS_MIN_INTERVAL_SECONDS
+        ) as pbar:
+            next_fetch = prefetcher.submit(self._fetch_source, urls[0]) if urls else None
 
-                    # Update counters
-                    if result.success:
-                        self.total_successful += 1
-                    else:
-                        self.total_failed += 1
+            for i, url in enumerate(urls):
+                pbar.set_description(f"Processing {i+1}/{len(urls)}", refresh=False)
 
-                    # Save result to file
-                    self._save_result_to_file(result, url)
-
-                    # Check confidence and flag for review if needed
-                    if result.success and result.officer_bio:
-                        confidence = result.officer_bio.confidence_score
-
-                        if confidence < review_threshold:
-                            # Low confidence - flag for review
-                            self.flag_for_review(
-                                result,
-                                url,
-                                f"Low confidence score: {confidence:.2f} (threshold: {review_threshold:.2f})"
-                            )
-                        elif save_to_db:
-                            # High confidence - save to database if requested
-                            try:
-                                db_result = save_officer_bio_to_database(result.officer_bio)
-                                if db_result:
-                                    logger.info(f"✓ Saved to database: {result.officer_bio.name}")
-                                else:
-                                    logger.warning(f"⚠ Database save failed for: {result.officer_bio.name}")
-                            except Exception as e:
-                                logger.error(f"Database error for {result.officer_bio.name}: {e}")
-                    else:
-                        # Extraction failed - flag for review
-                        self.flag_for_review(
-                            result,
-                            url,
-                            f"Extraction failed: {result.error_message}"
-                        )
+                current_fetch = next_fetch
+                next_fetch = (
+                    prefetcher.submit(self._fetch_source, urls[i + 1])
+                    if i + 1 < len(urls) else None
+                )
 
-                    results.append(result)
+                try:
+                    self.total_processed += 1
+
+                    # Fetch source text (already in flight from the prefetcher)
+                    # and extract; skip rate limit for first request
+                    logger.info(f"Extracting biography for URL {i+1}/{len(urls)}")
+                    result = self._extract_from_url(
+                        url,
+                        current_fetch.result(),
+                        self.sdk,
+                        apply_rate_limit=i > 0
+                    )
+
+                    results.append(self._handle_result(result, url, save_to_db, review_threshold))
 
                 except KeyboardInterrupt:
                     logger.warning("Processing interrupted by user")
                     console.print("\n[yellow]⚠ Processing interrupted by user[/yellow]")
+                    if next_fetch is not None:
+                        next_fetch.cancel()
                     break
 
                 except Exception as e:
@@ -297,16 +431,86 @@ class BatchProcessor:
                 finally:
                     pbar.update(1)
 
-        console.print(f"\n[bold green]✓ Completed processing {self.total_processed} sources[/bold green]\n")
         return results
 
-    def process_from_file(self, filepath: str, save_to_db: bool = False) -> List[AgentExtractionResult]:
+    def _process_urls_concurrently(
+        self,
+        urls: List[str],
+        save_to_db: bool,
+        max_workers: int,
+        review_threshold: float
+    ) -> List[AgentExtractionResult]:
+        """
+        Process URLs on a thread pool, handling results as they complete.
+
+        Workers fetch and extract (each with its own SDK); saving, flagging
+        and counter updates happen on this thread as results arrive.
+
+        Args:
+            urls: List of source URLs to process
+            save_to_db: Whether to save high-confidence results to database
+            max_workers: Number of concurrent extractions
+            review_threshold: Confidence below which results are flagged
+
+        Returns:
+            List of extraction results, in the same order as urls
+        """
+        def work(url: str) -> Optional[AgentExtractionResult]:
+            return self._extract_from_url(url, self._fetch_source(url), self._get_worker_sdk())
+
+        results: List[Optional[AgentExtractionResult]] = [None] * len(urls)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            with tqdm(
+                total=len(urls),
+                desc=f"Processing sources ({max_workers} workers)",
+                unit="source",
+                mininterval=PROGRESS_MIN_INTERVAL_SECONDS
+            ) as pbar:
+                futures = {executor.submit(work, url): i for i, url in enumerate(urls)}
+
+                for future in as_completed(futures):
+                    i = futures[future]
+                    url = urls[i]
+                    self.total_processed += 1
+
+                    try:
+                        result = self._handle_result(future.result(), url, save_to_db, review_threshold)
+                    except Exception as e:
+                        logger.error(f"Unexpected error processing {url}: {e}", exc_info=True)
+                        self.total_failed += 1
+                        result = AgentExtractionResult(
+                            officer_bio=None,
+                            success=False,
+                            error_message=f"Unexpected processing error: {e}"
+                        )
+
+                    results[i] = result
+                    pbar.update(1)
+
+        except KeyboardInterrupt:
+            logger.warning("Processing interrupted by user")
+            console.print("\n[yellow]⚠ Processing interrupted by user[/yellow]")
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return [result for result in results if result is not None]
+
+    def process_from_file(
+        self,
+        filepath: str,
+        save_to_db: bool = False,
+        max_workers: int = 1
+    ) -> List[AgentExtractionResult]:
         """
         Process URLs from a text file (one URL per line).
 
         Args:
             filepath: Path to file containing URLs
             save_to_db: Whether to save high-confidence results to database
+            max_workers: Number of extractions to run concurrently
         Returns:
             List of extraction results
         """
@@ -319,7 +523,7 @@ class BatchProcessor:
             logger.info(f"Found {len(urls)} URLs in file")
             console.print(f"[cyan]Found {len(urls)} URLs in {filepath}[/cyan]")
 
-            return self.process_urls(urls, save_to_db=save_to_db)
+            return self.process_urls(urls, save_to_db=save_to_db, max_workers=max_workers)
 
         except FileNotFoundError:
             logger.error(f"File not found: {filepath}")
@@ -343,40 +547,63 @@ class BatchProcessor:
 
         logger.info("Generating batch report...")
 
-        # Calculate statistics
+        # Calculate statistics in a single pass over the results
         total_count = len(results)
-        successful_count = sum(1 for r in results if r.success)
+        successful_count = 0
+        confidence_count = 0
+        confidence_sum = 0.0
+        min_confidence = None
+        max_confidence = None
+        total_input_tokens = 0
+        total_output_tokens = 0
+        total_tool_calls = 0
+        total_turns = 0
+        error_counter = Counter()
+        tool_counter = Counter()
+        tool_successes = Counter()
+
+        for r in results:
+            total_input_tokens += r.total_input_tokens
+            total_output_tokens += r.total_output_tokens
+            total_tool_calls += len(r.tool_calls)
+            total_turns += r.conversation_turns
+
+            if r.success:
+                successful_count += 1
+                # Confidence scores (only for successful extractions)
+                if r.officer_bio:
+                    confidence = r.officer_bio.confidence_score
+                    confidence_count += 1
+                    confidence_sum += confidence
+                    if min_confidence is None or confidence < min_confidence:
+                        min_confidence = confidence
+                    if max_confidence is None or confidence > max_confidence:
+                        max_confidence = confidence
+            elif r.error_message:
+                error_counter[r.error_message] += 1
+
+            for tool in r.tool_calls:
+                tool_counter[tool.tool_name] += 1
+                if tool.success:
+                    tool_successes[tool.tool_name] += 1
+
         failed_count = total_count - successful_count
         overall_success_rate = (successful_count / total_count * 100) if total_count > 0 else 0
-
-        # Confidence scores (only for successful extractions)
-        confidence_scores = [r.officer_bio.confidence_score for r in results if r.success and r.officer_bio]
-        avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0
+        avg_confidence = confidence_sum / confidence_count if confidence_count else 0
 
         # Token usage
-        total_input_tokens = sum(r.total_input_tokens for r in results)
-        total_output_tokens = sum(r.total_output_tokens for r in results)
-        total_tokens = sum(r.get_total_tokens() for r in results)
+        total_tokens = total_input_tokens + total_output_tokens
         avg_tokens = total_tokens / total_count if total_count > 0 else 0
 
         # Tool usage
-        total_tool_calls = sum(len(r.tool_calls) for r in results)
         avg_tool_calls = total_tool_calls / total_count if total_count > 0 else 0
 
         # Conversation turns
-        total_turns = sum(r.conversation_turns for r in results)
         avg_turns = total_turns / total_count if total_count > 0 else 0
 
         # Failure patterns
-        error_messages = [r.error_message for r in results if not r.success and r.error_message]
-        error_counter = Counter(error_messages)
         common_errors = error_counter.most_common(5)
 
-        # Tool success rates
-        all_tools = [tool.tool_name for r in results for tool in r.tool_calls]
-        tool_counter = Counter(all_tools)
-        tool_successes = Counter([tool.tool_name for r in results for tool in r.tool_calls if tool.success])
-
         # Generate report text
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_path = self.output_dir / f"batch_report_{timestamp}.txt"
@@ -400,8 +627,8 @@ class BatchProcessor:
             "QUALITY METRICS",
             "=" * 80,
             f"Average Confidence Score:  {avg_confidence:.3f}",
-            f"Min Confidence:            {min(confidence_scores) if confidence_scores else 0:.3f}",
-            f"Max Confidence:            {max(confidence_scores) if confidence_scores else 0:.3f}",
+            f"Min Confidence:            {min_confidence or 0:.3f}",
+            f"Max Confidence:            {max_confidence or 0:.3f}",
             "",
             "=" * 80,
             "PERFORMANCE METRICS",
@@ -447,12 +674,12 @@ class BatchProcessor:
 
         logger.info(f"✓ Report saved to: {report_path}")
 
-        # Print summary to console with Rich
-        console.print("\n" + "=" * 80 + "\n")
-        console.print(Panel.fit(
+        # Print summary to console with Rich, composed into one renderable
+        # so the whole report is measured and written in a single print
+        header = Panel.fit(
             "[bold magenta]Batch Processing Report[/bold magenta]",
             border_style="magenta"
-        ))
+        )
 
         # Summary table
         summary_table = Table(show_header=True, header_style="bold cyan", box=box.ROUNDED)
@@ -469,10 +696,7 @@ class BatchProcessor:
         summary_table.add_row("Average Tool Calls", f"{avg_tool_calls:.1f}")
         summary_table.add_row("Average Turns", f"{avg_turns:.1f}")
 
-        console.print(summary_table)
-
         # Tool usage table
-        console.print("\n[bold cyan]Tool Usage:[/bold cyan]")
         tool_table = Table(show_header=True, header_style="bold magenta", box=box.ROUNDED)
         tool_table.add_column("Tool", style="cyan", width=30)
         tool_table.add_column("Calls", style="white", width=10)
@@ -483,9 +707,14 @@ class BatchProcessor:
             tool_success_rate = (success_count / count * 100) if count > 0 else 0
             tool_table.add_row(tool_name, str(count), f"{tool_success_rate:.1f}%")
 
-        console.print(tool_table)
-
-        console.print(f"\n[green]✓ Full report saved to: {report_path}[/green]\n")
+        console.print(Group(
+            "\n" + "=" * 80 + "\n",
+            header,
+            summary_table,
+            "\n[bold cyan]Tool Usage:[/bold cyan]",
+            tool_table,
+            f"\n[green]✓ Full report saved to: {report_path}[/green]\n",
+        ))
 
 
 def main():
@@ -547,6 +776,12 @@ Examples:
         default=1.0,
         help='Seconds to wait between requests (default: 1.0)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of sources to process concurrently (default: 1)'
+    )
 
     args = parser.parse_args()
 
@@ -570,10 +805,18 @@ Examples:
     try:
         if args.urls:
             # Process URLs from command line
-            results = processor.process_urls(args.urls, save_to_db=args.save_to_db)
+            results = processor.process_urls(
+                args.urls,
+                save_to_db=args.save_to_db,
+                max_workers=args.workers
+            )
         else:
             # Process URLs from file
-            results = processor.process_from_file(args.input_file, save_to_db=args.save_to_db)
+            results = processor.process_from_file(
+                args.input_file,
+                save_to_db=args.save_to_db,
+                max_workers=args.workers
+            )
 
         # Generate report
         if results:
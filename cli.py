@@ -4,26 +4,91 @@ PLA Agent SDK - Command Line Interface
 
 Full-featured CLI for extracting PLA officer biographies from obituaries.
 """
+import os
 import sys
+import re
+import time
+import atexit
+import glob
+import mmap
 import argparse
 import json
 import logging
+import subprocess
+import importlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich import box
 from rich.logging import RichHandler
 from rich.prompt import Prompt
+from rich.text import Text
 
-from agent import PLAgentSDK, ConversationPrinter
-from batch_processor import BatchProcessor
-from schema import OfficerBio
-from tools.extraction_tools import extract_text_from_file
+if TYPE_CHECKING:
+    from schema import OfficerBio
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 console = Console()
 
+# Heavy modules (the Anthropic SDK, the fetch/batch stack, the database
+# driver, the pydantic schema) are imported on first use and cached here,
+# so `validate`, `--help` and REPL commands that don't need them skip the
+# import cost entirely
+_LAZY_MODULES: Dict[str, Any] = {}
+
+
+def _lazy_import(module_name: str) -> Any:
+    """
+    Import a module on first use and cache it for later commands.
+
+    Args:
+        module_name: Dotted module name (e.g. 'agent', 'psycopg2')
+
+    Returns:
+        The imported module
+
+    Raises:
+        ImportError: If the module is not installed
+    """
+    module = _LAZY_MODULES.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+        _LAZY_MODULES[module_name] = module
+    return module
+
+
+# Accepted extraction date formats: YYYY or YYYY-MM-DD
+DATE_FORMAT_RE = re.compile(r'^\d{4}(?:-\d{2}-\d{2})?$')
+
+# Interactive-mode command history, persisted across sessions via readline
+HISTORY_FILE = Path.home() / ".plagent_history"
+HISTORY_LENGTH = 1000
+
+# Concurrent extractions for the interactive `batch` command
+INTERACTIVE_BATCH_WORKERS = 4
+
+# How long a successful `api-check` result is reused before calling the API again
+API_CHECK_CACHE_SECONDS = 60
+
+# Characters decoded per read when a search needs decoded text
+SEARCH_CHUNK_CHARS = 1 << 20
+
+# Spinner redraw rate; Rich's default (12.5/s) mostly competes with the
+# fetch/API call it is decorating for the GIL and the terminal
+STATUS_REFRESH_PER_SECOND = 4
+
 
 def setup_logging(verbose: bool = False, debug: bool = False):
     """
@@ -70,6 +135,61 @@ def print_warning(message: str):
     console.print(f"[bold yellow]⚠[/bold yellow] {message}")
 
 
+def status_spinner(message: str):
+    """
+    Show a spinner while a blocking call runs.
+
+    When output is not a terminal (piped or redirected), the message is
+    printed once instead of starting Rich's background refresh thread.
+
+    Args:
+        message: Rich markup status text
+
+    Returns:
+        Context manager wrapping the blocking call
+    """
+    if not console.is_terminal:
+        console.print(message)
+        return nullcontext()
+    return console.status(message, spinner="dots", refresh_per_second=STATUS_REFRESH_PER_SECOND)
+
+
+@lru_cache(maxsize=32)
+def _load_extraction_cached(path_str: str, mtime_ns: int) -> Tuple[Dict[str, Any], Optional["OfficerBio"]]:
+    """Parse and validate a saved extraction; keyed on mtime so edits invalidate."""
+    with open(path_str, 'rb') as f:
+        raw = f.read()
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # handle both parsers the same way
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    officer_data = data.get('officer_bio')
+    OfficerBio = _lazy_import("schema").OfficerBio
+    officer = OfficerBio(**officer_data) if officer_data else None
+    return data, officer
+
+
+def load_extraction(json_path: Path) -> Tuple[Dict[str, Any], Optional["OfficerBio"]]:
+    """
+    Load a saved extraction result and its validated officer bio.
+
+    Results are memoized per (path, modification time), so validating the
+    same file repeatedly in one session skips JSON parsing and Pydantic
+    validation until the file changes on disk.
+
+    Args:
+        json_path: Path to an extraction JSON file
+
+    Returns:
+        Tuple of (raw result dict, OfficerBio or None if the file has no bio)
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+        pydantic.ValidationError: If the officer bio fails schema validation
+    """
+    return _load_extraction_cached(str(json_path), json_path.stat().st_mtime_ns)
+
+
 # ============================================================================
 # Command: extract
 # ============================================================================
@@ -88,13 +208,12 @@ def cmd_extract(args):
     try:
         # Initialize SDK
         console.print("\n[cyan]Initializing SDK...[/cyan]")
-        sdk = PLAgentSDK(require_db=args.save_db)
+        sdk = _lazy_import("agent").PLAgentSDK(require_db=args.save_db)
         print_success("SDK initialized")
 
         # Fetch source content
         console.print(f"\n[cyan]Fetching content from URL...[/cyan]")
-        from fetch_source import fetch_source_content
-        source_text = fetch_source_content(args.url)
+        source_text = _lazy_import("fetch_source").fetch_source_content(args.url)
 
         if not source_text:
             print_error("Failed to fetch content from URL")
@@ -158,8 +277,8 @@ def cmd_extract(args):
         # Save to database if requested
         if args.save_db and officer.confidence_score >= 0.8:
             try:
-                from tools.database_tools import save_officer_bio_to_database
-                db_result = save_officer_bio_to_database(officer)
+                database_tools = _lazy_import("tools.database_tools")
+                db_result = database_tools.save_officer_bio_to_database(officer)
                 if db_result:
                     print_success(f"Saved to database")
                 else:
@@ -172,7 +291,7 @@ def cmd_extract(args):
             console.print("\n[bold cyan]Conversation Detail:[/bold cyan]\n")
             # Get messages from SDK's last conversation
             if hasattr(sdk, '_last_messages'):
-                ConversationPrinter.print_conversation(sdk._last_messages)
+                _lazy_import("agent").ConversationPrinter.print_conversation(sdk._last_messages)
             else:
                 print_warning("No conversation details available")
 
@@ -210,14 +329,18 @@ def cmd_batch(args):
 
         # Initialize processor
         console.print("\n[cyan]Initializing BatchProcessor...[/cyan]")
-        processor = BatchProcessor(
+        processor = _lazy_import("batch_processor").BatchProcessor(
             require_db=args.save_db,
             rate_limit_seconds=args.rate_limit
         )
         print_success("Processor initialized")
 
         # Process URLs
-        results = processor.process_from_file(args.file, save_to_db=args.save_db)
+        results = processor.process_from_file(
+            args.file,
+            save_to_db=args.save_db,
+            max_workers=args.workers
+        )
 
         if not results:
             print_warning("No results to process")
@@ -226,8 +349,8 @@ def cmd_batch(args):
         # Generate report
         processor.generate_batch_report(results)
 
-        # Show summary
-        successful = sum(1 for r in results if r.success)
+        # Show summary (the processor already tallied outcomes while running)
+        successful = processor.total_successful
         console.print(f"\n[bold green]✓ Processed {len(results)} URLs[/bold green]")
         console.print(f"  Successful: {successful}")
         console.print(f"  Failed: {len(results) - successful}")
@@ -267,15 +390,13 @@ def cmd_validate(args):
             return 1
 
         console.print(f"\n[cyan]Loading extraction from {json_path}...[/cyan]")
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        _, officer = load_extraction(json_path)
 
         # Parse officer bio
-        if 'officer_bio' not in data:
+        if officer is None:
             print_error("Invalid extraction file: missing 'officer_bio'")
             return 1
 
-        officer = OfficerBio(**data['officer_bio'])
         print_success(f"Loaded extraction for: {officer.name}")
 
         # Re-run validation
@@ -300,8 +421,7 @@ def cmd_validate(args):
         for field_name, date_value in date_fields:
             if date_value:
                 # Check format (YYYY or YYYY-MM-DD)
-                import re
-                if not (re.match(r'^\d{4}$', date_value) or re.match(r'^\d{4}-\d{2}-\d{2}$', date_value)):
+                if not DATE_FORMAT_RE.match(date_value):
                     valid_dates = False
                     invalid_dates.append(f"{field_name}={date_value}")
 
@@ -369,6 +489,981 @@ def cmd_validate(args):
 # Command: interactive
 # ============================================================================
 
+@lru_cache(maxsize=None)
+def _enable_persistent_history() -> bool:
+    """
+    Load readline history from HISTORY_FILE and save it again on exit.
+
+    Cached so repeated interactive sessions in one process register the
+    exit hook only once.
+
+    Returns:
+        True if readline is available and history is enabled
+    """
+    try:
+        import readline  # pyreadline3 provides this module on Windows
+    except ImportError:
+        return False
+
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass  # First run or unreadable file; start with empty history
+    readline.set_history_length(HISTORY_LENGTH)
+
+    def save_history():
+        try:
+            readline.write_history_file(HISTORY_FILE)
+        except OSError as e:
+            logging.getLogger(__name__).debug(f"Could not save history: {e}")
+
+    atexit.register(save_history)
+    return True
+
+
+@lru_cache(maxsize=None)
+def _interactive_welcome() -> Text:
+    """
+    Build the interactive-mode welcome banner.
+
+    Markup is parsed once and the result cached, so re-entering interactive
+    mode reuses the same renderable.
+
+    Returns:
+        Pre-rendered welcome text
+    """
+    return Text.from_markup("\n".join([
+        "\n[bold cyan]📋 Extraction Commands:[/bold cyan]",
+        "  [yellow]extract <url>[/yellow]     - Extract from URL",
+        "  [yellow]paste[/yellow]              - Paste source text",
+        "  [yellow]test[/yellow]               - Run test extraction",
+        "  [yellow]batch <file>[/yellow]       - Batch process URLs",
+        "\n[bold cyan]🔍 Analysis Commands:[/bold cyan]",
+        "  [yellow]validate <file>[/yellow]    - Validate saved extraction",
+        "  [yellow]search <query>[/yellow]     - Search output files",
+        "\n[bold cyan]🛠️  System Commands:[/bold cyan]",
+        "  [yellow]run-tests[/yellow]          - Run test suite",
+        "  [yellow]demo[/yellow]               - Run presentation demo",
+        "  [yellow]config[/yellow]             - Show configuration",
+        "  [yellow]stats[/yellow]              - Session statistics",
+        "  [yellow]api-check[/yellow]          - Check API connection",
+        "  [yellow]db-check[/yellow]           - Check database connection",
+        "\n[bold cyan]💡 Utility Commands:[/bold cyan]",
+        "  [yellow]history[/yellow]            - Show command history",
+        "  [yellow]clear[/yellow]              - Clear screen",
+        "  [yellow]help[/yellow]               - Show this help",
+        "  [yellow]exit[/yellow], [yellow]quit[/yellow], [yellow]q[/yellow]       - Exit interactive mode",
+        "\n[dim]Type command name for usage. Example: extract https://...[/dim]\n",
+    ]))
+
+
+def _command_table(rows) -> Table:
+    """
+    Build a borderless two-column command/description table.
+
+    Args:
+        rows: Iterable of (command, description) pairs
+
+    Returns:
+        Populated Rich table
+    """
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    table.add_column("Command", style="yellow", width=20)
+    table.add_column("Description", style="white", width=50)
+    for command, description in rows:
+        table.add_row(command, description)
+    return table
+
+
+@lru_cache(maxsize=None)
+def _interactive_help() -> Group:
+    """
+    Build the interactive-mode help screen.
+
+    Tables are constructed once and cached; Rich renderables are not mutated
+    by printing, so every `help` command reuses the same Group.
+
+    Returns:
+        Group containing the full help screen
+    """
+    return Group(
+        Text.from_markup("\n[bold cyan]Interactive Mode Commands:[/bold cyan]\n"),
+
+        # Extraction commands
+        Text.from_markup("[bold magenta]📋 Extraction:[/bold magenta]"),
+        _command_table([
+            ("extract <url>", "Extract biography from URL"),
+            ("paste", "Paste obituary text (multi-line)"),
+            ("test", "Run test extraction on sample data"),
+            ("batch <file>", "Batch process URLs from file"),
+        ]),
+
+        # Analysis commands
+        Text.from_markup("\n[bold magenta]🔍 Analysis:[/bold magenta]"),
+        _command_table([
+            ("validate <file>", "Re-validate saved extraction"),
+            ("search <query>", "Search output files by name"),
+        ]),
+
+        # System commands
+        Text.from_markup("\n[bold magenta]🛠️  System:[/bold magenta]"),
+        _command_table([
+            ("run-tests", "Run comprehensive test suite"),
+            ("demo", "Run full presentation demo"),
+            ("config", "Show current configuration"),
+            ("stats", "Show session statistics"),
+            ("api-check", "Check Anthropic API connection"),
+            ("db-check", "Check database connection"),
+        ]),
+
+        # Utility commands
+        Text.from_markup("\n[bold magenta]💡 Utility:[/bold magenta]"),
+        _command_table([
+            ("history", "Show command history"),
+            ("clear", "Clear screen"),
+            ("help", "Show this help"),
+            ("exit, quit, q", "Exit interactive mode"),
+        ]),
+
+        Text.from_markup("\n".join([
+            "\n[dim]Examples:[/dim]",
+            "  [dim]extract https://www.news.cn/obituary.html[/dim]",
+            "  [dim]validate output/林炳尧_20260212.json[/dim]",
+            "  [dim]batch urls.txt[/dim]",
+            "  [dim]run-tests --fast[/dim]",
+        ])),
+    )
+
+
+class SessionStats:
+    """Running extraction totals for one interactive session."""
+    __slots__ = ("extractions", "successful", "failed", "total_tokens")
+
+    def __init__(self):
+        self.extractions = 0
+        self.successful = 0
+        self.failed = 0
+        self.total_tokens = 0
+
+    def record(self, result) -> None:
+        """Add a single extraction result to the totals."""
+        self.extractions += 1
+        if result.success:
+            self.successful += 1
+        else:
+            self.failed += 1
+        self.total_tokens += result.get_total_tokens()
+
+
+class _InteractiveSession:
+    """
+    Per-session state shared by the interactive command handlers.
+
+    Holds the background SDK initialization future, running extraction
+    statistics, and the command history for the current REPL session.
+    """
+
+    def __init__(self, sdk_future):
+        self._sdk_future = sdk_future
+        self.stats = SessionStats()
+        # Bounded like the readline history, so long sessions don't grow it forever
+        self.command_history = deque(maxlen=HISTORY_LENGTH)
+        self.logger = logging.getLogger(__name__)
+        # (model name, monotonic timestamp, response text) of last api-check
+        self.last_api_check = None
+
+    def get_sdk(self):
+        """Return the session SDK, waiting for background init if still running."""
+        if not self._sdk_future.done():
+            with status_spinner("[cyan]Waiting for SDK initialization...[/cyan]"):
+                return self._sdk_future.result()
+        return self._sdk_future.result()
+
+
+def _run_script_in_process(module_name: str, argv=()) -> Optional[int]:
+    """
+    Run a project script's main() inside the REPL's interpreter.
+
+    Only for scripts that leave the session's modules alone (the demo); the
+    test suite imports and monkeypatches those modules, so it keeps running
+    in a subprocess.
+
+    Avoids a fresh Python start-up (and re-importing the SDK stack) per
+    invocation. sys.argv and the working directory are set as if the script
+    had been launched from the project root, and restored afterwards.
+
+    Args:
+        module_name: Importable module path (e.g. 'scripts.demo')
+        argv: Command-line arguments to pass to the script
+
+    Returns:
+        The script's exit code, or None if it could not be imported
+    """
+    try:
+        module = _lazy_import(module_name)
+    except (ImportError, SystemExit) as e:
+        logging.getLogger(__name__).debug(f"Cannot import {module_name} in-process: {e}")
+        return None
+
+    saved_argv, saved_cwd = sys.argv, os.getcwd()
+    sys.argv = [module.__file__, *argv]
+    os.chdir(Path(__file__).parent)
+    try:
+        exit_code = module.main()
+    except SystemExit as e:
+        exit_code = e.code
+    finally:
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
+
+    if exit_code is None:
+        return 0
+    return exit_code if isinstance(exit_code, int) else 1
+
+
+def _render_result(result, output_file, suggest_actions: bool = False) -> Group:
+    """
+    Build the summary shown after a successful interactive extraction.
+
+    Args:
+        result: Successful AgentExtractionResult with an officer_bio
+        output_file: Path the result was saved to
+        suggest_actions: If True, append next-step suggestions
+
+    Returns:
+        Group ready for a single console.print
+    """
+    officer = result.officer_bio
+
+    summary_table = Table(show_header=False, box=box.SIMPLE)
+    summary_table.add_column("Field", style="cyan", width=20)
+    summary_table.add_column("Value", style="white", width=50)
+
+    summary_table.add_row("Name", officer.name)
+    if officer.pinyin_name:
+        summary_table.add_row("Pinyin", officer.pinyin_name)
+    if officer.hometown:
+        summary_table.add_row("Hometown", officer.hometown)
+    summary_table.add_row("Confidence", f"{officer.confidence_score:.2f}")
+    summary_table.add_row("Tokens Used", f"{result.get_total_tokens():,}")
+    summary_table.add_row("Tool Calls", str(len(result.tool_calls)))
+
+    renderables = [
+        Text.from_markup("\n[bold green]✓ Extraction Successful![/bold green]\n"),
+        summary_table,
+        Text(f"\nSaved to: {output_file}", style="dim"),
+    ]
+
+    if suggest_actions:
+        if officer.confidence_score >= 0.8:
+            confidence_action = "  [green]• High confidence - Ready for database[/green]"
+        else:
+            confidence_action = "  [yellow]• Low confidence - Review recommended[/yellow]"
+        renderables += [
+            Text.from_markup("\n[bold cyan]Suggested Actions:[/bold cyan]"),
+            Text.from_markup(confidence_action),
+            Text(f"  • Validate: python cli.py validate --json {output_file}", style="cyan"),
+        ]
+
+    return Group(*renderables)
+
+
+def _repl_help(session, args_str):
+    console.print(_interactive_help())
+
+
+def _repl_extract(session, args_str):
+    if not args_str:
+        print_error("Usage: extract <url>")
+        return
+
+    url = args_str.strip()
+
+    console.print(f"\n[cyan]Extracting from URL...[/cyan]")
+
+    try:
+        # Fetch source content
+        fetch_source_content = _lazy_import("fetch_source").fetch_source_content
+        with status_spinner("[cyan]Fetching content...[/cyan]"):
+            source_text = fetch_source_content(url)
+
+        if not source_text:
+            print_error("Failed to fetch content")
+            return
+
+        print_success(f"Fetched {len(source_text)} characters")
+        console.print("[dim]Claude will identify source type and adapt expectations[/dim]")
+        console.print("\n[cyan]Extracting biography (watch tool calls)...[/cyan]\n")
+
+        sdk = session.get_sdk()
+        result = sdk.extract_bio_agentic(
+            source_text=source_text,
+            source_url=url
+        )
+        session.stats.record(result)
+
+        # Show results
+        if result.success and result.officer_bio:
+            output_file = sdk.save_result_to_file(result)
+            console.print(_render_result(result, output_file, suggest_actions=True))
+
+        else:
+            print_error(f"Extraction failed: {result.error_message}")
+
+    except Exception as e:
+        print_error(f"Extraction error: {e}")
+        session.logger.exception("Interactive extraction error")
+        session.stats.failed += 1
+
+
+def _repl_paste(session, args_str):
+    console.print("\n[cyan]Paste source text (press Ctrl+D or Ctrl+Z when done):[/cyan]")
+    console.print("[dim]Tip: You can paste multiple lines[/dim]\n")
+
+    try:
+        # Read the whole paste up to EOF in one call rather than
+        # one input() (and one readline history entry) per line
+        source_text = sys.stdin.read()
+
+        if not source_text.strip():
+            print_warning("No text entered")
+            return
+
+        print_success(f"Received {len(source_text)} characters")
+
+        # Extract
+        console.print("\n[cyan]Extracting biography...[/cyan]")
+        console.print("[dim]Claude will identify source type and adapt expectations[/dim]\n")
+
+        sdk = session.get_sdk()
+        result = sdk.extract_bio_agentic(
+            source_text=source_text,
+            source_url="https://interactive/paste"
+        )
+        session.stats.record(result)
+
+        # Show results (same as extract)
+        if result.success and result.officer_bio:
+            output_file = sdk.save_result_to_file(result)
+            console.print(_render_result(result, output_file))
+
+        else:
+            print_error(f"Extraction failed: {result.error_message}")
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Paste cancelled[/yellow]")
+
+
+def _repl_test(session, args_str):
+    console.print("\n[cyan]Running test extraction...[/cyan]")
+
+    try:
+        test_file = Path("data/test_obituary.txt")
+        if not test_file.exists():
+            print_error("Test file not found: data/test_obituary.txt")
+            return
+
+        extraction_tools = _lazy_import("tools.extraction_tools")
+        source_text = extraction_tools.extract_text_from_file(str(test_file))
+        print_success(f"Loaded {len(source_text)} characters")
+
+        console.print("[cyan]Extracting...[/cyan]")
+
+        sdk = session.get_sdk()
+        result = sdk.extract_bio_agentic(
+            source_text=source_text,
+            source_url="https://interactive/test"
+        )
+        session.stats.record(result)
+
+        # Show results
+        if result.success:
+            officer = result.officer_bio
+            console.print(Group(
+                Text.from_markup("[bold green]✓[/bold green] ").append(f"Test passed: {officer.name}"),
+                Text(f"  Confidence: {officer.confidence_score:.2f}"),
+                Text(f"  Tokens: {result.get_total_tokens():,}"),
+            ))
+        else:
+            print_error(f"Test failed: {result.error_message}")
+
+    except Exception as e:
+        print_error(f"Test error: {e}")
+        session.stats.failed += 1
+
+
+def _repl_stats(session, args_str):
+    session_stats = session.stats
+    console.print("\n[bold cyan]Session Statistics:[/bold cyan]\n")
+
+    stats_table = Table(show_header=True, header_style="bold cyan", box=box.ROUNDED)
+    stats_table.add_column("Metric", style="cyan", width=30)
+    stats_table.add_column("Value", style="white", width=20)
+
+    stats_table.add_row("Total Extractions", str(session_stats.extractions))
+    stats_table.add_row("Successful", str(session_stats.successful))
+    stats_table.add_row("Failed", str(session_stats.failed))
+
+    if session_stats.extractions > 0:
+        success_rate = session_stats.successful / session_stats.extractions * 100
+        stats_table.add_row("Success Rate", f"{success_rate:.1f}%")
+
+    stats_table.add_row("Total Tokens", f"{session_stats.total_tokens:,}")
+
+    if session_stats.extractions > 0:
+        avg_tokens = session_stats.total_tokens / session_stats.extractions
+        stats_table.add_row("Avg Tokens/Extraction", f"{avg_tokens:,.0f}")
+
+    console.print(stats_table)
+
+
+def _repl_demo(session, args_str):
+    console.print("\n[bold cyan]Starting Presentation Demo...[/bold cyan]")
+    console.print("[dim]This will run the full team presentation (2-3 minutes)[/dim]")
+    console.print("[yellow]Tip: Increase terminal font size for better visibility[/yellow]\n")
+
+    try:
+        # Run scripts/demo.py in this interpreter, reusing the already
+        # imported SDK stack; fall back to a subprocess if it can't be imported
+        returncode = _run_script_in_process("scripts.demo")
+        if returncode is None:
+            returncode = subprocess.run(
+                [sys.executable, "scripts/demo.py"],
+                cwd=Path(__file__).parent,
+                check=False
+            ).returncode
+
+        if returncode == 0:
+            console.print("\n[green]✓ Demo completed successfully[/green]")
+        else:
+            console.print(f"\n[yellow]Demo exited with code {returncode}[/yellow]")
+
+    except FileNotFoundError:
+        print_error("scripts/demo.py not found in current directory")
+        console.print("[dim]Make sure you're in the pla-agent-sdk directory[/dim]")
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Demo interrupted by user[/yellow]")
+    except Exception as e:
+        print_error(f"Demo error: {e}")
+
+    console.print("\n[cyan]Press Enter to continue...[/cyan]")
+    input()
+
+
+def _repl_run_tests(session, args_str):
+    console.print("\n[bold cyan]Running Test Suite...[/bold cyan]")
+
+    # Parse optional flags
+    test_args = args_str.split() if args_str else []
+
+    try:
+        # Build command
+        test_cmd = [sys.executable, "run_all_tests.py"]
+        test_cmd.extend(test_args)
+
+        console.print(f"[dim]Command: {' '.join(test_cmd)}[/dim]\n")
+
+        # Always a fresh interpreter: pytest.main() in this process would
+        # reuse stale test modules and patch the cli/agent/config modules
+        # the REPL itself is using
+        returncode = subprocess.run(
+            test_cmd,
+            cwd=Path(__file__).parent,
+            check=False
+        ).returncode
+
+        console.print()
+        if returncode == 0:
+            console.print("[green]✓ All tests passed![/green]")
+            console.print("[dim]View detailed results: open output/reports/test_results.html[/dim]")
+        else:
+            console.print("[yellow]⚠ Some tests failed[/yellow]")
+            console.print("[dim]Check output/reports/test_results.html for details[/dim]")
+
+    except FileNotFoundError:
+        print_error("run_all_tests.py not found")
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Tests interrupted[/yellow]")
+    except Exception as e:
+        print_error(f"Test error: {e}")
+
+    console.print("\n[cyan]Press Enter to continue...[/cyan]")
+    input()
+
+
+def _repl_validate(session, args_str):
+    if not args_str:
+        print_error("Usage: validate <json_file>")
+        console.print("[dim]Example: validate output/林炳尧_20260212.json[/dim]")
+        return
+
+    json_file = Path(args_str.strip())
+
+    if not json_file.exists():
+        print_error(f"File not found: {json_file}")
+        return
+
+    console.print(f"\n[cyan]Validating: {json_file.name}[/cyan]\n")
+
+    try:
+        # Load extraction result and validate using schema
+        _, officer = load_extraction(json_file)
+
+        if officer is None:
+            print_error("No officer_bio found in file")
+            return
+
+        # Show validation results
+        console.print("[green]✓ Schema Validation: PASSED[/green]")
+        console.print(f"  Officer: {officer.name}")
+        console.print(f"  Confidence: {officer.confidence_score:.2f}")
+
+        # Check date logic
+        validation_checks = []
+
+        if officer.birth_date and officer.death_date:
+            birth_year = int(officer.birth_date[:4])
+            death_year = int(officer.death_date[:4])
+            if death_year > birth_year:
+                validation_checks.append(("Date Logic", "✓", "green"))
+            else:
+                validation_checks.append(("Date Logic", "✗", "red"))
+
+        if officer.promotions:
+            validation_checks.append((f"Promotions ({len(officer.promotions)})", "✓", "green"))
+
+        if officer.notable_positions:
+            validation_checks.append((f"Positions ({len(officer.notable_positions)})", "✓", "green"))
+
+        console.print()
+        for check_name, status, color in validation_checks:
+            console.print(f"  [{color}]{status}[/{color}] {check_name}")
+
+        console.print()
+        print_success("Validation complete")
+
+    except json.JSONDecodeError:
+        print_error("Invalid JSON file")
+    except Exception as e:
+        print_error(f"Validation failed: {e}")
+
+
+def _repl_batch(session, args_str):
+    if not args_str:
+        print_error("Usage: batch <url_file>")
+        console.print("[dim]Example: batch urls.txt[/dim]")
+        return
+
+    url_file = Path(args_str.strip())
+
+    if not url_file.exists():
+        print_error(f"File not found: {url_file}")
+        return
+
+    console.print(f"\n[bold cyan]Starting Batch Processing...[/bold cyan]")
+    console.print(f"[dim]File: {url_file}[/dim]")
+    console.print("[yellow]Note: This will use API credits[/yellow]\n")
+
+    # Ask for confirmation
+    confirm = Prompt.ask("Continue? [y/N]", default="n")
+    if confirm.lower() != 'y':
+        console.print("[yellow]Batch processing cancelled[/yellow]")
+        return
+
+    try:
+        processor = _lazy_import("batch_processor").BatchProcessor(require_db=False)
+        results = processor.process_from_file(
+            str(url_file),
+            save_to_db=False,
+            max_workers=INTERACTIVE_BATCH_WORKERS
+        )
+
+        # Update session stats from the processor's running totals
+        session_stats = session.stats
+        session_stats.extractions += len(results)
+        session_stats.successful += processor.total_successful
+        session_stats.failed += len(results) - processor.total_successful
+        session_stats.total_tokens += processor.total_tokens
+
+        console.print()
+        print_success(f"Batch complete: {len(results)} processed")
+
+    except FileNotFoundError as e:
+        print_error(f"Import error: {e}")
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Batch processing interrupted[/yellow]")
+    except Exception as e:
+        print_error(f"Batch error: {e}")
+
+
+def _repl_config(session, args_str):
+    console.print("\n[bold cyan]Current Configuration:[/bold cyan]\n")
+
+    CONFIG = _lazy_import("config").CONFIG
+
+    config_table = Table(show_header=False, box=box.SIMPLE)
+    config_table.add_column("Setting", style="cyan", width=30)
+    config_table.add_column("Value", style="white", width=50)
+
+    # API settings
+    api_key = CONFIG.ANTHROPIC_API_KEY
+    api_display = f"{api_key[:12]}...{api_key[-4:]}" if api_key else "[red]Not set[/red]"
+    config_table.add_row("ANTHROPIC_API_KEY", api_display)
+    config_table.add_row("MODEL_NAME", CONFIG.MODEL_NAME)
+
+    # Database settings
+    if CONFIG.DATABASE_URL:
+        db_display = f"{CONFIG.DATABASE_URL[:20]}..."
+        config_table.add_row("DATABASE_URL", db_display)
+    elif CONFIG.DB_USER:
+        config_table.add_row("DB_HOST", CONFIG.DB_HOST)
+        config_table.add_row("DB_NAME", CONFIG.DB_NAME)
+        config_table.add_row("DB_USER", CONFIG.DB_USER)
+        config_table.add_row("DB_PASSWORD", "[dim]***[/dim]")
+    else:
+        config_table.add_row("DATABASE", "[yellow]Not configured[/yellow]")
+
+    console.print(config_table)
+
+
+def _repl_api_check(session, args_str):
+    console.print("\n[cyan]Checking Anthropic API connection...[/cyan]\n")
+
+    try:
+        CONFIG = _lazy_import("config").CONFIG
+
+        # Back-to-back checks reuse the last successful response instead of
+        # spending tokens on another round trip
+        cached = session.last_api_check
+        if (cached and cached[0] == CONFIG.MODEL_NAME
+                and time.monotonic() - cached[1] < API_CHECK_CACHE_SECONDS):
+            response_text = cached[2]
+            console.print("[dim]Using result from a check in the last minute[/dim]")
+        else:
+            # Reuse the SDK's client and its open connection to the API
+            client = session.get_sdk().get_anthropic_client()
+
+            with status_spinner("[cyan]Testing API...[/cyan]"):
+                # Simple test call
+                response = client.messages.create(
+                    model=CONFIG.MODEL_NAME,
+                    max_tokens=10,
+                    messages=[{"role": "user", "content": "Hi"}]
+                )
+
+            response_text = response.content[0].text if response.content else 'No text'
+            session.last_api_check = (CONFIG.MODEL_NAME, time.monotonic(), response_text)
+
+        console.print("[green]✓ API Connection: SUCCESS[/green]")
+        console.print(f"  Model: {CONFIG.MODEL_NAME}")
+        console.print(f"  Response: {response_text}")
+
+    except Exception as e:
+        console.print(f"[red]✗ API Connection: FAILED[/red]")
+        console.print(f"  Error: {str(e)[:100]}")
+
+
+def _repl_db_check(session, args_str):
+    console.print("\n[cyan]Checking database connection...[/cyan]\n")
+
+    try:
+        CONFIG = _lazy_import("config").CONFIG
+
+        if not CONFIG.DB_USER and not CONFIG.DATABASE_URL:
+            console.print("[yellow]⚠ Database not configured[/yellow]")
+            console.print("[dim]Add DATABASE_URL to .env to enable database features[/dim]")
+            return
+
+        # Borrow from the shared pool the database tools use, so repeated
+        # checks (and later DB commands) skip the connect/auth handshake
+        database_tools = _lazy_import("tools.database_tools")
+
+        with status_spinner("[cyan]Testing connection...[/cyan]"):
+            with database_tools.pooled_connection() as conn, conn.cursor() as cursor:
+                cursor.execute("SELECT version();")
+                version = cursor.fetchone()[0]
+
+        console.print("[green]✓ Database Connection: SUCCESS[/green]")
+        console.print(f"  PostgreSQL: {version[:50]}")
+
+    except ImportError:
+        console.print("[red]✗ psycopg2 not installed[/red]")
+        console.print("[dim]Run: pip install psycopg2-binary[/dim]")
+    except Exception as e:
+        console.print(f"[red]✗ Database Connection: FAILED[/red]")
+        console.print(f"  Error: {str(e)[:100]}")
+
+
+def _search_pattern(query: str) -> "re.Pattern":
+    """
+    Compile the case-insensitive pattern used to scan files for a query.
+
+    Compiled once per search and reused for every file. Byte-level
+    IGNORECASE only folds ASCII letters, which covers pinyin and English
+    queries (Chinese characters have no case), so those get a bytes pattern
+    that runs directly over the mapped file. Queries with other cased
+    letters get a str pattern, matched on decoded text with Unicode case
+    folding instead of lowercasing a copy of every file.
+
+    Args:
+        query: Search text
+
+    Returns:
+        Compiled bytes or str pattern
+    """
+    if any(not ch.isascii() and ch.lower() != ch.upper() for ch in query):
+        return re.compile(re.escape(query), re.IGNORECASE)
+    return re.compile(re.escape(query.encode('utf-8')), re.IGNORECASE)
+
+
+def _file_contains(path: str, size: int, query: str, pattern: "re.Pattern") -> bool:
+    """
+    Check whether a file contains the query, ignoring case.
+
+    With a bytes pattern the file is memory-mapped and scanned in place, so
+    no decoded copy of the file is created; otherwise it is decoded and
+    scanned in fixed-size chunks, so memory use doesn't grow with file size.
+
+    Args:
+        path: File to search
+        size: File size in bytes (from the directory scan)
+        query: Search text
+        pattern: Result of _search_pattern(query)
+
+    Returns:
+        True if the file contains the query
+    """
+    if size < len(query):
+        return False  # Too small to match; also skips empty files, which mmap rejects
+
+    if isinstance(pattern.pattern, str):
+        # Decode in bounded chunks, carrying the last len(query) - 1
+        # characters over so matches spanning a chunk boundary are found
+        overlap = len(query) - 1
+        tail = ""
+        with open(path, 'r', encoding='utf-8') as f:
+            while True:
+                chunk = f.read(SEARCH_CHUNK_CHARS)
+                if not chunk:
+                    return False
+                window = tail + chunk
+                if pattern.search(window):
+                    return True
+                tail = window[-overlap:] if overlap else ""
+
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if query.lower() == query.upper():
+                # No cased letters (e.g. a Chinese name or a date): a plain
+                # byte search is several times faster than the regex engine
+                return mm.find(query.encode('utf-8')) != -1
+            return pattern.search(mm) is not None
+
+
+def _repl_search(session, args_str):
+    if not args_str:
+        print_error("Usage: search <query>")
+        console.print("[dim]Example: search 林炳尧[/dim]")
+        return
+
+    query = args_str.strip()
+    console.print(f"\n[cyan]Searching for: {query}[/cyan]\n")
+
+    try:
+        output_dir = Path("output")
+        if not output_dir.exists():
+            console.print("[yellow]No output directory found[/yellow]")
+            return
+
+        search_index = _lazy_import("search_index")
+
+        # Narrow the candidates with the incremental full-text index when
+        # possible; its hits are re-checked below since it keeps no text
+        indexed = None
+        try:
+            with search_index.SearchIndex(str(output_dir)) as index:
+                index.refresh()
+                indexed = index.search(query)
+        except Exception as e:
+            session.logger.debug(f"Search index unavailable, scanning files: {e}")
+
+        # Short queries (or no index): scan every JSON file, newest first
+        paths = search_index.list_json_files(output_dir) if indexed is None else indexed
+        candidates = []
+        for path in paths:
+            try:
+                candidates.append((os.stat(path), str(path)))
+            except OSError:
+                pass
+        if indexed is None:
+            candidates.sort(key=lambda item: item[0].st_mtime_ns, reverse=True)
+
+        pattern = _search_pattern(query)
+
+        def check(candidate):
+            stat, path = candidate
+            try:
+                return _file_contains(path, stat.st_size, query, pattern)
+            except (OSError, ValueError, UnicodeDecodeError):
+                return False  # Removed, unreadable or not valid UTF-8
+
+        # Files are scanned on a thread pool; results keep newest-first order
+        found = search_index.map_files(check, candidates)
+        matches = [Path(path) for (_, path), hit in zip(candidates, found) if hit]
+
+        if matches:
+            # One print for the whole list rather than a render + write per line
+            lines = [f"[green]Found {len(matches)} match(es):[/green]\n"]
+            lines.extend(f"  • {match.relative_to(output_dir)}" for match in matches[:10])
+            if len(matches) > 10:
+                lines.append(f"  [dim]... and {len(matches) - 10} more[/dim]")
+            console.print("\n".join(lines))
+        else:
+            console.print("[yellow]No matches found[/yellow]")
+
+    except Exception as e:
+        print_error(f"Search error: {e}")
+
+
+def _repl_history(session, args_str):
+    command_history = session.command_history
+    console.print("\n[bold cyan]Command History:[/bold cyan]\n")
+
+    if not command_history:
+        console.print("[dim]No commands in history yet[/dim]")
+    else:
+        recent = islice(command_history, max(0, len(command_history) - 20), None)
+        lines = [f"  {idx}. {hist_cmd}" for idx, hist_cmd in enumerate(recent, 1)]
+
+        if len(command_history) > 20:
+            lines.append(f"\n[dim]Showing last 20 of {len(command_history)} commands[/dim]")
+        console.print("\n".join(lines))
+
+
+def _repl_clear(session, args_str):
+    console.clear()
+
+
+# Command name -> handler(session, args_str); looked up once per command
+# instead of walking an if/elif chain
+REPL_COMMANDS = {
+    'help': _repl_help,
+    'extract': _repl_extract,
+    'paste': _repl_paste,
+    'test': _repl_test,
+    'stats': _repl_stats,
+    'demo': _repl_demo,
+    'run-tests': _repl_run_tests,
+    'validate': _repl_validate,
+    'batch': _repl_batch,
+    'config': _repl_config,
+    'api-check': _repl_api_check,
+    'db-check': _repl_db_check,
+    'search': _repl_search,
+    'history': _repl_history,
+    'clear': _repl_clear,
+}
+REPL_EXIT_COMMANDS = frozenset({'exit', 'quit', 'q'})
+
+
+# Commands whose argument is a local file path / a previously used URL
+REPL_PATH_COMMANDS = frozenset({'validate', 'batch'})
+REPL_URL_COMMANDS = frozenset({'extract'})
+
+
+def _complete_repl_input(line: str, text: str, past_commands) -> list:
+    """
+    Compute tab-completion candidates for the interactive prompt.
+
+    The first word completes to a command name; arguments complete to file
+    paths for `validate`/`batch` and to URLs from earlier `extract`
+    commands (newest first).
+
+    Args:
+        line: Full input line typed so far
+        text: Word being completed
+        past_commands: Previously entered command lines, oldest first
+
+    Returns:
+        Matching completion candidates
+    """
+    head, sep, _ = line.lstrip().partition(' ')
+    if not sep:
+        return [name for name in sorted(set(REPL_COMMANDS) | REPL_EXIT_COMMANDS)
+                if name.startswith(text)]
+
+    cmd = head.lower()
+    if cmd in REPL_PATH_COMMANDS:
+        return [path + os.sep if os.path.isdir(path) else path
+                for path in sorted(glob.glob(glob.escape(text) + '*'))]
+
+    if cmd in REPL_URL_COMMANDS:
+        urls = []
+        for past in reversed(past_commands):
+            past_head, _, past_arg = past.partition(' ')
+            past_arg = past_arg.strip()
+            if (past_head.lower() in REPL_URL_COMMANDS and past_arg.startswith('http')
+                    and past_arg.startswith(text) and past_arg not in urls):
+                urls.append(past_arg)
+        return urls
+
+    return []
+
+
+def _enable_command_completion() -> bool:
+    """
+    Tab-complete interactive commands, file paths and past URLs via readline.
+
+    Returns:
+        True if readline is available and completion is enabled
+    """
+    try:
+        import readline
+    except ImportError:
+        return False
+
+    matches = []
+
+    def complete(text, state):
+        # readline calls with state 0, 1, 2, ... until None; compute once
+        if state == 0:
+            past_commands = [
+                readline.get_history_item(i)
+                for i in range(1, readline.get_current_history_length() + 1)
+            ]
+            matches[:] = _complete_repl_input(
+                readline.get_line_buffer(), text, [c for c in past_commands if c]
+            )
+        return matches[state] if state < len(matches) else None
+
+    # Only whitespace separates words, so paths and URLs complete whole
+    readline.set_completer_delims(' \t\n')
+    readline.set_completer(complete)
+    readline.parse_and_bind("tab: complete")
+    return True
+
+
+def _repl_prompt(readline_active: bool) -> str:
+    """
+    Build the interactive prompt string passed to input().
+
+    The prompt must go through input() itself so readline knows its width
+    when it redraws the line (history recall, Ctrl-L, wrapped lines). Colour
+    codes are wrapped in \\001/\\002 so readline doesn't count them as
+    visible characters.
+
+    Args:
+        readline_active: Whether input() goes through readline
+
+    Returns:
+        Prompt string
+    """
+    if console.color_system is None or not console.is_terminal:
+        return "plAgent> "
+    start, end = ("\001", "\002") if readline_active else ("", "")
+    return f"{start}\033[1;36m{end}plAgent>{start}\033[0m{end} "
+
+
 def cmd_interactive(args):
     """
     Interactive REPL-style interface.
@@ -378,653 +1473,59 @@ def cmd_interactive(args):
     """
     print_header("Interactive Mode", "REPL-style interface for quick testing")
 
-    logger = logging.getLogger(__name__)
-
-    # Initialize SDK once for session
-    try:
-        console.print("\n[cyan]Initializing SDK...[/cyan]")
-        sdk = PLAgentSDK(require_db=False)
-        print_success("SDK initialized - Ready for commands")
-    except Exception as e:
-        print_error(f"Failed to initialize SDK: {e}")
-        return 1
+    # Initialize SDK once for session, in the background: importing the
+    # Anthropic client and building the SDK overlaps with the welcome banner
+    # and the first prompt instead of blocking the REPL from appearing
+    console.print("\n[cyan]Initializing SDK in background...[/cyan]")
+    sdk_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sdk-init")
+    sdk_future = sdk_executor.submit(
+        lambda: _lazy_import("agent").PLAgentSDK(require_db=False)
+    )
+    sdk_executor.shutdown(wait=False)
 
     # Session statistics and history
-    session_stats = {
-        'extractions': 0,
-        'successful': 0,
-        'failed': 0,
-        'total_tokens': 0
-    }
-    command_history = []
-    last_result = None
+    session = _InteractiveSession(sdk_future)
+    session_stats = session.stats
+
+    # Arrow-key recall of commands from previous sessions
+    readline_active = _enable_persistent_history()
+    readline_active = _enable_command_completion() or readline_active
+    prompt = _repl_prompt(readline_active)
 
     # Show welcome message
-    console.print("\n[bold cyan]📋 Extraction Commands:[/bold cyan]")
-    console.print("  [yellow]extract <url>[/yellow]     - Extract from URL")
-    console.print("  [yellow]paste[/yellow]              - Paste source text")
-    console.print("  [yellow]test[/yellow]               - Run test extraction")
-    console.print("  [yellow]batch <file>[/yellow]       - Batch process URLs")
-    console.print("\n[bold cyan]🔍 Analysis Commands:[/bold cyan]")
-    console.print("  [yellow]validate <file>[/yellow]    - Validate saved extraction")
-    console.print("  [yellow]search <query>[/yellow]     - Search output files")
-    console.print("\n[bold cyan]🛠️  System Commands:[/bold cyan]")
-    console.print("  [yellow]run-tests[/yellow]          - Run test suite")
-    console.print("  [yellow]demo[/yellow]               - Run presentation demo")
-    console.print("  [yellow]config[/yellow]             - Show configuration")
-    console.print("  [yellow]stats[/yellow]              - Session statistics")
-    console.print("  [yellow]api-check[/yellow]          - Check API connection")
-    console.print("  [yellow]db-check[/yellow]           - Check database connection")
-    console.print("\n[bold cyan]💡 Utility Commands:[/bold cyan]")
-    console.print("  [yellow]history[/yellow]            - Show command history")
-    console.print("  [yellow]clear[/yellow]              - Clear screen")
-    console.print("  [yellow]help[/yellow]               - Show this help")
-    console.print("  [yellow]exit[/yellow], [yellow]quit[/yellow], [yellow]q[/yellow]       - Exit interactive mode")
-    console.print("\n[dim]Type command name for usage. Example: extract https://...[/dim]\n")
+    console.print(_interactive_welcome())
 
     # REPL loop
     while True:
         try:
-            # Get command
-            command = Prompt.ask("\n[bold cyan]plAgent>[/bold cyan]").strip()
+            # Get command: plain blocking input() so the process sleeps in
+            # read() while idle, without Prompt's choice/validation wrapper
+            console.print()
+            command = input(prompt).strip()
 
             if not command:
                 continue
 
-            # Parse command
-            parts = command.split(maxsplit=1)
-            cmd = parts[0].lower()
-            args_str = parts[1] if len(parts) > 1 else ""
+            # Parse command: partition stops at the first space, and the
+            # usual lowercase spelling is matched before paying for .lower()
+            head, _, rest = command.partition(' ')
+            cmd = head if head in REPL_COMMANDS or head in REPL_EXIT_COMMANDS else head.lower()
+            args_str = rest.strip()
 
             # Add to history
-            command_history.append(command)
+            session.command_history.append(command)
 
             # Handle commands
-            if cmd in ['exit', 'quit', 'q']:
+            if cmd in REPL_EXIT_COMMANDS:
                 console.print("\n[yellow]Exiting interactive mode...[/yellow]")
                 break
 
-            elif cmd == 'help':
-                console.print("\n[bold cyan]Interactive Mode Commands:[/bold cyan]\n")
-
-                # Extraction commands
-                console.print("[bold magenta]📋 Extraction:[/bold magenta]")
-                extract_table = Table(show_header=False, box=None, padding=(0, 2))
-                extract_table.add_column("Command", style="yellow", width=20)
-                extract_table.add_column("Description", style="white", width=50)
-                extract_table.add_row("extract <url>", "Extract biography from URL")
-                extract_table.add_row("paste", "Paste obituary text (multi-line)")
-                extract_table.add_row("test", "Run test extraction on sample data")
-                extract_table.add_row("batch <file>", "Batch process URLs from file")
-                console.print(extract_table)
-
-                # Analysis commands
-                console.print("\n[bold magenta]🔍 Analysis:[/bold magenta]")
-                analysis_table = Table(show_header=False, box=None, padding=(0, 2))
-                analysis_table.add_column("Command", style="yellow", width=20)
-                analysis_table.add_column("Description", style="white", width=50)
-                analysis_table.add_row("validate <file>", "Re-validate saved extraction")
-                analysis_table.add_row("search <query>", "Search output files by name")
-                console.print(analysis_table)
-
-                # System commands
-                console.print("\n[bold magenta]🛠️  System:[/bold magenta]")
-                system_table = Table(show_header=False, box=None, padding=(0, 2))
-                system_table.add_column("Command", style="yellow", width=20)
-                system_table.add_column("Description", style="white", width=50)
-                system_table.add_row("run-tests", "Run comprehensive test suite")
-                system_table.add_row("demo", "Run full presentation demo")
-                system_table.add_row("config", "Show current configuration")
-                system_table.add_row("stats", "Show session statistics")
-                system_table.add_row("api-check", "Check Anthropic API connection")
-                system_table.add_row("db-check", "Check database connection")
-                console.print(system_table)
-
-                # Utility commands
-                console.print("\n[bold magenta]💡 Utility:[/bold magenta]")
-                utility_table = Table(show_header=False, box=None, padding=(0, 2))
-                utility_table.add_column("Command", style="yellow", width=20)
-                utility_table.add_column("Description", style="white", width=50)
-                utility_table.add_row("history", "Show command history")
-                utility_table.add_row("clear", "Clear screen")
-                utility_table.add_row("help", "Show this help")
-                utility_table.add_row("exit, quit, q", "Exit interactive mode")
-                console.print(utility_table)
-
-                console.print("\n[dim]Examples:[/dim]")
-                console.print("  [dim]extract https://www.news.cn/obituary.html[/dim]")
-                console.print("  [dim]validate output/林炳尧_20260212.json[/dim]")
-                console.print("  [dim]batch urls.txt[/dim]")
-                console.print("  [dim]run-tests --fast[/dim]")
-
-            elif cmd == 'extract':
-                if not args_str:
-                    print_error("Usage: extract <url>")
-                    continue
-
-                url = args_str.strip()
-
-                console.print(f"\n[cyan]Extracting from URL...[/cyan]")
-
-                try:
-                    # Fetch source content
-                    from fetch_source import fetch_source_content
-                    with console.status("[cyan]Fetching content...[/cyan]", spinner="dots"):
-                        source_text = fetch_source_content(url)
-
-                    if not source_text:
-                        print_error("Failed to fetch content")
-                        continue
-
-                    print_success(f"Fetched {len(source_text)} characters")
-                    console.print("[dim]Claude will identify source type and adapt expectations[/dim]")
-                    console.print("\n[cyan]Extracting biography (watch tool calls)...[/cyan]\n")
-
-                    result = sdk.extract_bio_agentic(
-                        source_text=source_text,
-                        source_url=url
-                    )
-
-                    # Update stats
-                    session_stats['extractions'] += 1
-                    if result.success:
-                        session_stats['successful'] += 1
-                    else:
-                        session_stats['failed'] += 1
-                    session_stats['total_tokens'] += result.get_total_tokens()
-
-                    # Show results
-                    if result.success and result.officer_bio:
-                        officer = result.officer_bio
-
-                        console.print("\n[bold green]✓ Extraction Successful![/bold green]\n")
-
-                        # Quick summary
-                        summary_table = Table(show_header=False, box=box.SIMPLE)
-                        summary_table.add_column("Field", style="cyan", width=20)
-                        summary_table.add_column("Value", style="white", width=50)
-
-                        summary_table.add_row("Name", officer.name)
-                        if officer.pinyin_name:
-                            summary_table.add_row("Pinyin", officer.pinyin_name)
-                        if officer.hometown:
-                            summary_table.add_row("Hometown", officer.hometown)
-                        summary_table.add_row("Confidence", f"{officer.confidence_score:.2f}")
-                        summary_table.add_row("Tokens Used", f"{result.get_total_tokens():,}")
-                        summary_table.add_row("Tool Calls", str(len(result.tool_calls)))
-
-                        console.print(summary_table)
-
-                        # Save result
-                        output_file = sdk.save_result_to_file(result)
-                        console.print(f"\n[dim]Saved to: {output_file}[/dim]")
-
-                        # Suggest next actions
-                        console.print("\n[bold cyan]Suggested Actions:[/bold cyan]")
-                        if officer.confidence_score >= 0.8:
-                            console.print("  [green]• High confidence - Ready for database[/green]")
-                        else:
-                            console.print("  [yellow]• Low confidence - Review recommended[/yellow]")
-                        console.print(f"  [cyan]• Validate: python cli.py validate --json {output_file}[/cyan]")
-
-                    else:
-                        print_error(f"Extraction failed: {result.error_message}")
-
-                except Exception as e:
-                    print_error(f"Extraction error: {e}")
-                    logger.exception("Interactive extraction error")
-                    session_stats['failed'] += 1
-
-            elif cmd == 'paste':
-                console.print("\n[cyan]Paste source text (press Ctrl+D or Ctrl+Z when done):[/cyan]")
-                console.print("[dim]Tip: You can paste multiple lines[/dim]\n")
-
-                try:
-                    lines = []
-                    while True:
-                        try:
-                            line = input()
-                            lines.append(line)
-                        except EOFError:
-                            break
-
-                    source_text = '\n'.join(lines)
-
-                    if not source_text.strip():
-                        print_warning("No text entered")
-                        continue
-
-                    print_success(f"Received {len(source_text)} characters")
-
-                    # Extract
-                    console.print("\n[cyan]Extracting biography...[/cyan]")
-                    console.print("[dim]Claude will identify source type and adapt expectations[/dim]\n")
-
-                    result = sdk.extract_bio_agentic(
-                        source_text=source_text,
-                        source_url="https://interactive/paste"
-                    )
-
-                    # Update stats
-                    session_stats['extractions'] += 1
-                    if result.success:
-                        session_stats['successful'] += 1
-                    else:
-                        session_stats['failed'] += 1
-                    session_stats['total_tokens'] += result.get_total_tokens()
-
-                    # Show results (same as extract)
-                    if result.success and result.officer_bio:
-                        officer = result.officer_bio
-
-                        console.print("\n[bold green]✓ Extraction Successful![/bold green]\n")
-
-                        summary_table = Table(show_header=False, box=box.SIMPLE)
-                        summary_table.add_column("Field", style="cyan", width=20)
-                        summary_table.add_column("Value", style="white", width=50)
-
-                        summary_table.add_row("Name", officer.name)
-                        if officer.pinyin_name:
-                            summary_table.add_row("Pinyin", officer.pinyin_name)
-                        summary_table.add_row("Confidence", f"{officer.confidence_score:.2f}")
-                        summary_table.add_row("Tokens Used", f"{result.get_total_tokens():,}")
-
-                        console.print(summary_table)
-
-                        output_file = sdk.save_result_to_file(result)
-                        console.print(f"\n[dim]Saved to: {output_file}[/dim]")
-
-                    else:
-                        print_error(f"Extraction failed: {result.error_message}")
-
-                except KeyboardInterrupt:
-                    console.print("\n[yellow]Paste cancelled[/yellow]")
-
-            elif cmd == 'test':
-                console.print("\n[cyan]Running test extraction...[/cyan]")
-
-                try:
-                    test_file = Path("data/test_obituary.txt")
-                    if not test_file.exists():
-                        print_error("Test file not found: data/test_obituary.txt")
-                        continue
-
-                    source_text = extract_text_from_file(str(test_file))
-                    print_success(f"Loaded {len(source_text)} characters")
-
-                    console.print("[cyan]Extracting...[/cyan]")
-
-                    result = sdk.extract_bio_agentic(
-                        source_text=source_text,
-                        source_url="https://interactive/test"
-        )
-
-                    # Update stats
-                    session_stats['extractions'] += 1
-                    if result.success:
-                        session_stats['successful'] += 1
-                    else:
-                        session_stats['failed'] += 1
-                    session_stats['total_tokens'] += result.get_total_tokens()
-
-                    # Show results
-                    if result.success:
-                        officer = result.officer_bio
-                        print_success(f"Test passed: {officer.name}")
-                        console.print(f"  Confidence: {officer.confidence_score:.2f}")
-                        console.print(f"  Tokens: {result.get_total_tokens():,}")
-                    else:
-                        print_error(f"Test failed: {result.error_message}")
-
-                except Exception as e:
-                    print_error(f"Test error: {e}")
-                    session_stats['failed'] += 1
-
-            elif cmd == 'stats':
-                console.print("\n[bold cyan]Session Statistics:[/bold cyan]\n")
-
-                stats_table = Table(show_header=True, header_style="bold cyan", box=box.ROUNDED)
-                stats_table.add_column("Metric", style="cyan", width=30)
-                stats_table.add_column("Value", style="white", width=20)
-
-                stats_table.add_row("Total Extractions", str(session_stats['extractions']))
-                stats_table.add_row("Successful", str(session_stats['successful']))
-                stats_table.add_row("Failed", str(session_stats['failed']))
-
-                if session_stats['extractions'] > 0:
-                    success_rate = session_stats['successful'] / session_stats['extractions'] * 100
-                    stats_table.add_row("Success Rate", f"{success_rate:.1f}%")
-
-                stats_table.add_row("Total Tokens", f"{session_stats['total_tokens']:,}")
-
-                if session_stats['extractions'] > 0:
-                    avg_tokens = session_stats['total_tokens'] / session_stats['extractions']
-                    stats_table.add_row("Avg Tokens/Extraction", f"{avg_tokens:,.0f}")
-
-                console.print(stats_table)
-
-            elif cmd == 'demo':
-                console.print("\n[bold cyan]Starting Presentation Demo...[/bold cyan]")
-                console.print("[dim]This will run the full team presentation (2-3 minutes)[/dim]")
-                console.print("[yellow]Tip: Increase terminal font size for better visibility[/yellow]\n")
-
-                try:
-                    import subprocess
-                    import sys
-
-                    # Run scripts/demo.py in same Python environment
-                    result = subprocess.run(
-                        [sys.executable, "scripts/demo.py"],
-                        cwd=Path(__file__).parent,
-                        check=False
-                    )
-
-                    if result.returncode == 0:
-                        console.print("\n[green]✓ Demo completed successfully[/green]")
-                    else:
-                        console.print(f"\n[yellow]Demo exited with code {result.returncode}[/yellow]")
-
-                except FileNotFoundError:
-                    print_error("scripts/demo.py not found in current directory")
-                    console.print("[dim]Make sure you're in the pla-agent-sdk directory[/dim]")
-                except KeyboardInterrupt:
-                    console.print("\n[yellow]Demo interrupted by user[/yellow]")
-                except Exception as e:
-                    print_error(f"Demo error: {e}")
-
-                console.print("\n[cyan]Press Enter to continue...[/cyan]")
-                input()
-
-            elif cmd == 'run-tests':
-                console.print("\n[bold cyan]Running Test Suite...[/bold cyan]")
-
-                # Parse optional flags
-                test_args = args_str.split() if args_str else []
-
-                try:
-                    import subprocess
-                    import sys
-
-                    # Build command
-                    test_cmd = [sys.executable, "run_all_tests.py"]
-                    test_cmd.extend(test_args)
-
-                    console.print(f"[dim]Command: {' '.join(test_cmd)}[/dim]\n")
-
-                    # Run tests
-                    result = subprocess.run(
-                        test_cmd,
-                        cwd=Path(__file__).parent,
-                        check=False
-                    )
-
-                    console.print()
-                    if result.returncode == 0:
-                        console.print("[green]✓ All tests passed![/green]")
-                        console.print("[dim]View detailed results: open output/reports/test_results.html[/dim]")
-                    else:
-                        console.print("[yellow]⚠ Some tests failed[/yellow]")
-                        console.print("[dim]Check output/reports/test_results.html for details[/dim]")
-
-                except FileNotFoundError:
-                    print_error("run_all_tests.py not found")
-                except KeyboardInterrupt:
-                    console.print("\n[yellow]Tests interrupted[/yellow]")
-                except Exception as e:
-                    print_error(f"Test error: {e}")
-
-                console.print("\n[cyan]Press Enter to continue...[/cyan]")
-                input()
-
-            elif cmd == 'validate':
-                if not args_str:
-                    print_error("Usage: validate <json_file>")
-                    console.print("[dim]Example: validate output/林炳尧_20260212.json[/dim]")
-                    continue
-
-                json_file = Path(args_str.strip())
-
-                if not json_file.exists():
-                    print_error(f"File not found: {json_file}")
-                    continue
-
-                console.print(f"\n[cyan]Validating: {json_file.name}[/cyan]\n")
-
-                try:
-                    # Load extraction result
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-
-                    officer_data = data.get('officer_bio')
-                    if not officer_data:
-                        print_error("No officer_bio found in file")
-                        continue
-
-                    # Validate using schema
-                    from schema import OfficerBio
-                    officer = OfficerBio(**officer_data)
-
-                    # Show validation results
-                    console.print("[green]✓ Schema Validation: PASSED[/green]")
-                    console.print(f"  Officer: {officer.name}")
-                    console.print(f"  Confidence: {officer.confidence_score:.2f}")
-
-                    # Check date logic
-                    validation_checks = []
-
-                    if officer.birth_date and officer.death_date:
-                        birth_year = int(officer.birth_date[:4])
-                        death_year = int(officer.death_date[:4])
-                        if death_year > birth_year:
-                            validation_checks.append(("Date Logic", "✓", "green"))
-                        else:
-                            validation_checks.append(("Date Logic", "✗", "red"))
-
-                    if officer.promotions:
-                        validation_checks.append((f"Promotions ({len(officer.promotions)})", "✓", "green"))
-
-                    if officer.notable_positions:
-                        validation_checks.append((f"Positions ({len(officer.notable_positions)})", "✓", "green"))
-
-                    console.print()
-                    for check_name, status, color in validation_checks:
-                        console.print(f"  [{color}]{status}[/{color}] {check_name}")
-
-                    console.print()
-                    print_success("Validation complete")
-
-                except json.JSONDecodeError:
-                    print_error("Invalid JSON file")
-                except Exception as e:
-                    print_error(f"Validation failed: {e}")
-
-            elif cmd == 'batch':
-                if not args_str:
-                    print_error("Usage: batch <url_file>")
-                    console.print("[dim]Example: batch urls.txt[/dim]")
-                    continue
-
-                url_file = Path(args_str.strip())
-
-                if not url_file.exists():
-                    print_error(f"File not found: {url_file}")
-                    continue
-
-                console.print(f"\n[bold cyan]Starting Batch Processing...[/bold cyan]")
-                console.print(f"[dim]File: {url_file}[/dim]")
-                console.print("[yellow]Note: This will use API credits[/yellow]\n")
-
-                # Ask for confirmation
-                confirm = Prompt.ask("Continue? [y/N]", default="n")
-                if confirm.lower() != 'y':
-                    console.print("[yellow]Batch processing cancelled[/yellow]")
-                    continue
-
-                try:
-                    from batch_processor import BatchProcessor
-
-                    processor = BatchProcessor(require_db=False)
-                    results = processor.process_from_file(str(url_file), save_to_db=False)
-
-                    # Update session stats
-                    for result in results:
-                        session_stats['extractions'] += 1
-                        if result.success:
-                            session_stats['successful'] += 1
-                        else:
-                            session_stats['failed'] += 1
-                        session_stats['total_tokens'] += result.get_total_tokens()
-
-                    console.print()
-                    print_success(f"Batch complete: {len(results)} processed")
-
-                except FileNotFoundError as e:
-                    print_error(f"Import error: {e}")
-                except KeyboardInterrupt:
-                    console.print("\n[yellow]Batch processing interrupted[/yellow]")
-                except Exception as e:
-                    print_error(f"Batch error: {e}")
-
-            elif cmd == 'config':
-                console.print("\n[bold cyan]Current Configuration:[/bold cyan]\n")
-
-                from config import CONFIG
-
-                config_table = Table(show_header=False, box=box.SIMPLE)
-                config_table.add_column("Setting", style="cyan", width=30)
-                config_table.add_column("Value", style="white", width=50)
-
-                # API settings
-                api_key = CONFIG.ANTHROPIC_API_KEY
-                api_display = f"{api_key[:12]}...{api_key[-4:]}" if api_key else "[red]Not set[/red]"
-                config_table.add_row("ANTHROPIC_API_KEY", api_display)
-                config_table.add_row("MODEL_NAME", CONFIG.MODEL_NAME)
-
-                # Database settings
-                if CONFIG.DATABASE_URL:
-                    db_display = f"{CONFIG.DATABASE_URL[:20]}..."
-                    config_table.add_row("DATABASE_URL", db_display)
-                elif CONFIG.DB_USER:
-                    config_table.add_row("DB_HOST", CONFIG.DB_HOST)
-                    config_table.add_row("DB_NAME", CONFIG.DB_NAME)
-                    config_table.add_row("DB_USER", CONFIG.DB_USER)
-                    config_table.add_row("DB_PASSWORD", "[dim]***[/dim]")
-                else:
-                    config_table.add_row("DATABASE", "[yellow]Not configured[/yellow]")
-
-                console.print(config_table)
-
-            elif cmd == 'api-check':
-                console.print("\n[cyan]Checking Anthropic API connection...[/cyan]\n")
-
-                try:
-                    from anthropic import Anthropic
-                    from config import CONFIG
-
-                    with console.status("[cyan]Testing API...[/cyan]", spinner="dots"):
-                        client = Anthropic(api_key=CONFIG.ANTHROPIC_API_KEY)
-
-                        # Simple test call
-                        response = client.messages.create(
-                            model=CONFIG.MODEL_NAME,
-                            max_tokens=10,
-                            messages=[{"role": "user", "content": "Hi"}]
-                        )
-
-                    console.print("[green]✓ API Connection: SUCCESS[/green]")
-                    console.print(f"  Model: {CONFIG.MODEL_NAME}")
-                    console.print(f"  Response: {response.content[0].text if response.content else 'No text'}")
-
-                except Exception as e:
-                    console.print(f"[red]✗ API Connection: FAILED[/red]")
-                    console.print(f"  Error: {str(e)[:100]}")
-
-            elif cmd == 'db-check':
-                console.print("\n[cyan]Checking database connection...[/cyan]\n")
-
-                try:
-                    from config import CONFIG
-                    import psycopg2
-
-                    if not CONFIG.DB_USER and not CONFIG.DATABASE_URL:
-                        console.print("[yellow]⚠ Database not configured[/yellow]")
-                        console.print("[dim]Add DATABASE_URL to .env to enable database features[/dim]")
-                        continue
-
-                    with console.status("[cyan]Testing connection...[/cyan]", spinner="dots"):
-                        conn_str = CONFIG.get_db_connection_string()
-                        conn = psycopg2.connect(conn_str)
-                        cursor = conn.cursor()
-                        cursor.execute("SELECT version();")
-                        version = cursor.fetchone()[0]
-                        conn.close()
-
-                    console.print("[green]✓ Database Connection: SUCCESS[/green]")
-                    console.print(f"  PostgreSQL: {version[:50]}")
-
-                except ImportError:
-                    console.print("[red]✗ psycopg2 not installed[/red]")
-                    console.print("[dim]Run: pip install psycopg2-binary[/dim]")
-                except Exception as e:
-                    console.print(f"[red]✗ Database Connection: FAILED[/red]")
-                    console.print(f"  Error: {str(e)[:100]}")
-
-            elif cmd == 'search':
-                if not args_str:
-                    print_error("Usage: search <query>")
-                    console.print("[dim]Example: search 林炳尧[/dim]")
-                    continue
-
-                query = args_str.strip()
-                console.print(f"\n[cyan]Searching for: {query}[/cyan]\n")
-
-                try:
-                    output_dir = Path("output")
-                    if not output_dir.exists():
-                        console.print("[yellow]No output directory found[/yellow]")
-                        continue
-
-                    # Search JSON files
-                    matches = []
-                    for json_file in output_dir.glob("**/*.json"):
-                        try:
-                            with open(json_file, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                if query.lower() in content.lower():
-                                    matches.append(json_file)
-                        except:
-                            pass
-
-                    if matches:
-                        console.print(f"[green]Found {len(matches)} match(es):[/green]\n")
-                        for match in matches[:10]:
-                            console.print(f"  • {match.relative_to(output_dir)}")
-                        if len(matches) > 10:
-                            console.print(f"  [dim]... and {len(matches) - 10} more[/dim]")
-                    else:
-                        console.print("[yellow]No matches found[/yellow]")
-
-                except Exception as e:
-                    print_error(f"Search error: {e}")
-
-            elif cmd == 'history':
-                console.print("\n[bold cyan]Command History:[/bold cyan]\n")
-
-                if not command_history:
-                    console.print("[dim]No commands in history yet[/dim]")
-                else:
-                    for idx, hist_cmd in enumerate(command_history[-20:], 1):
-                        console.print(f"  {idx}. {hist_cmd}")
-
-                    if len(command_history) > 20:
-                        console.print(f"\n[dim]Showing last 20 of {len(command_history)} commands[/dim]")
-
-            elif cmd == 'clear':
-                console.clear()
-
-            else:
+            handler = REPL_COMMANDS.get(cmd)
+            if handler is None:
                 print_error(f"Unknown command: {cmd}")
                 console.print("[dim]Type 'help' for available commands[/dim]")
+            else:
+                handler(session, args_str)
 
         except KeyboardInterrupt:
             console.print("\n[yellow]Use 'exit' to quit[/yellow]")
@@ -1034,14 +1535,14 @@ def cmd_interactive(args):
             break
         except Exception as e:
             print_error(f"Error: {e}")
-            logger.exception("Interactive mode error")
+            session.logger.exception("Interactive mode error")
 
     # Show final session stats
-    if session_stats['extractions'] > 0:
+    if session_stats.extractions > 0:
         console.print("\n[bold cyan]Session Summary:[/bold cyan]")
-        console.print(f"  Extractions: {session_stats['extractions']}")
-        console.print(f"  Successful: {session_stats['successful']}")
-        console.print(f"  Total Tokens: {session_stats['total_tokens']:,}")
+        console.print(f"  Extractions: {session_stats.extractions}")
+        console.print(f"  Successful: {session_stats.successful}")
+        console.print(f"  Total Tokens: {session_stats.total_tokens:,}")
 
     console.print("\n[green]Goodbye![/green]\n")
     return 0
@@ -1136,6 +1637,12 @@ For more information, see README.md and docs/ in this repository.
         default=1.0,
         help='Seconds between requests (default: 1.0)'
     )
+    parser_batch.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of URLs to process concurrently (default: 1)'
+    )
     parser_batch.set_defaults(func=cmd_batch)
 
     # Command: validate
@@ -18,6 +18,7 @@ class Config(BaseSettings):
     DB_USER: Optional[str] = Field(None, description="Database user")
     DB_PASSWORD: Optional[str] = Field(None, description="Database password")
     DB_PORT: int = Field(5432, description="Database port")
+    DB_MAX_POOL: int = Field(10, description="Maximum pooled database connections")
 
     # Agent configuration
     MODEL_NAME: str = Field("claude-sonnet-4-6", description="Claude model to use")
@@ -30,6 +31,14 @@ class Config(BaseSettings):
         False,
         description="Enable few-shot examples in single_pass mode"
     )
+    EXTRACTION_CACHE_DIR: str = Field(
+        "~/.plagent/result_cache",
+        description="Directory for cached extraction results (used when use_cache=True)"
+    )
+    EXTRACTION_CACHE_TTL_SECONDS: int = Field(
+        86400,
+        description="How long cached extraction results stay valid"
+    )
     TOKEN_BUDGET_TARGET_AVG: int = Field(
         15000,
         description="Target average tokens per extraction (monitoring guidance)"
@@ -11,15 +11,63 @@ Consolidates earlier source-specific fetch logic into one module.
 """
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Union
+
 import requests
 from bs4 import BeautifulSoup
-from pathlib import Path
+from requests.adapters import HTTPAdapter
 from rich.console import Console
-from typing import Optional
+from urllib3.util.retry import Retry
+
+try:
+    import lxml  # noqa: F401  (only checked for availability)
+except ImportError:
+    lxml = None
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Browser-like headers; some news sites reject the default requests User-Agent
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+def _make_session() -> requests.Session:
+    """
+    Build the shared HTTP session.
+
+    Reusing one session keeps connections alive between fetches from the
+    same host, skipping a TCP and TLS handshake per request. Transient
+    gateway errors are retried with backoff; other HTTP errors still
+    surface through raise_for_status().
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(_HEADERS)
+    return session
+
+
+_SESSION = _make_session()
+
+# lxml is an optional extra, not in requirements.txt: libxml2-backed parsing
+# is several times faster on large pages (Wikipedia articles run past 1 MB),
+# but the stdlib parser handles the same pages when lxml isn't installed
+_HTML_PARSER = "lxml" if lxml is not None else "html.parser"
+
 
 def detect_source_type(url: str) -> str:
     """
@@ -99,6 +147,36 @@ def fetch_source_content(url: str) -> str:
     return content
 
 
+def _fetch_or_error(url: str) -> Union[str, Exception]:
+    """Fetch one URL, returning the exception instead of raising it."""
+    try:
+        return fetch_source_content(url)
+    except Exception as e:
+        return e
+
+
+def fetch_source_content_many(urls: List[str], max_workers: int = 4) -> List[Union[str, Exception]]:
+    """
+    Fetch several URLs concurrently.
+
+    Fetching is network-bound, so running fetch_source_content() on a small
+    thread pool overlaps the round-trips instead of paying them one after
+    another.
+
+    Args:
+        urls: Source URLs
+        max_workers: Maximum number of requests in flight
+
+    Returns:
+        One entry per URL, in order: the cleaned text, or the exception
+        raised while fetching that URL (so one bad URL doesn't lose the rest)
+    """
+    if len(urls) <= 1 or max_workers <= 1:
+        return [_fetch_or_error(url) for url in urls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(_fetch_or_error, urls))
+
+
 def fetch_xinhua_article(url: str) -> str:
     """
     Fetch and extract article text from Xinhua-style news sources.
@@ -118,29 +196,22 @@ def fetch_xinhua_article(url: str) -> str:
         requests.RequestException: If request fails
         ValueError: If article content cannot be found
     """
-    # Set headers to mimic a browser
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
         logger.debug(f"Sending GET request to: {url}")
 
         # Fetch the webpage
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         response.raise_for_status()
 
-        # Auto-detect encoding if needed
-        response.encoding = response.apparent_encoding
-
         logger.debug(f"Response status: {response.status_code}")
-        logger.debug(f"Response encoding: {response.encoding}")
-        logger.debug(f"Response content length: {len(response.text)} chars")
+        logger.debug(f"Response content length: {len(response.content)} bytes")
 
         console.print("[bold green]✓ Page fetched successfully[/bold green]")
 
-        # Parse HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Parse the raw bytes: the parser sniffs the encoding from the
+        # page's own charset declaration instead of a separate detection pass
+        soup = BeautifulSoup(response.content, _HTML_PARSER)
+        logger.debug(f"Detected encoding: {soup.original_encoding}")
 
         # Try common Xinhua/Chinese news article content selectors
         article_text = None
@@ -226,18 +297,12 @@ def fetch_wikipedia_article(url: str) -> str:
         requests.RequestException: If request fails
         ValueError: If article content cannot be found
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         response.raise_for_status()
-        response.encoding = response.apparent_encoding
-
         console.print("[bold green]✓ Wikipedia page fetched[/bold green]")
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.content, _HTML_PARSER)
 
         text_parts = []
 
@@ -295,18 +360,12 @@ def fetch_generic_html(url: str) -> str:
         requests.RequestException: If request fails
         ValueError: If no content could be extracted
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
     try:
         console.print("[yellow]⚠ Using generic HTML extractor[/yellow]")
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         response.raise_for_status()
-        response.encoding = response.apparent_encoding
-
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.content, _HTML_PARSER)
 
         # Remove script, style, nav, footer
         for element in soup(['script', 'style', 'nav', 'footer', 'header']):
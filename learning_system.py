@@ -7,14 +7,195 @@ as examples to improve consistency and quality.
 """
 import json
 import logging
+import mmap
+import multiprocessing
+import os
+import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+from uuid import uuid4
 from collections import defaultdict
 
-from schema import AgentExtractionResult, OfficerBio
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from schema import OfficerBio
 
 logger = logging.getLogger(__name__)
 
+# Files below this size are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD_BYTES = 5 * 1024 * 1024
+
+# Below this many files, process startup costs more than parallel parsing saves
+PARALLEL_PARSE_MIN_FILES = 64
+
+# Files handed to a parse worker at a time
+PARSE_CHUNK_SIZE = 32
+
+# Sidecar cache of per-file parse results, keyed by file name, size and mtime
+PARSE_CACHE_FILENAME = ".learner_cache.json"
+PARSE_CACHE_VERSION = 1
+
+# Result files are written with indent=2, so a top-level failure appears as
+# a two-space-indented key (tool call "success" keys are nested deeper)
+FAILED_RESULT_RE = re.compile(rb'^  "success": false', re.MULTILINE)
+
+# Sequential read-ahead hints; unavailable on Windows and some other platforms
+_MADV_SEQUENTIAL = getattr(mmap, 'MADV_SEQUENTIAL', None)
+_HAS_FADVISE = hasattr(os, 'posix_fadvise') and hasattr(os, 'POSIX_FADV_SEQUENTIAL')
+
+
+def _read_json(path: Path, size: int, skip_pattern: Optional[re.Pattern] = None) -> Any:
+    """
+    Load a JSON file, choosing mmap or a buffered read based on its size.
+
+    Small files are mapped and handed straight to orjson (which accepts any
+    bytes-like object), avoiding an extra userland copy. Larger files, empty
+    files, and environments without orjson fall back to a plain read.
+
+    Args:
+        path: Path to the JSON file
+        size: File size in bytes (from a prior stat call)
+        skip_pattern: Optional bytes regex; if it matches the raw file
+            contents, the file is not decoded at all
+
+    Returns:
+        Decoded JSON value, or None if skip_pattern matched
+    """
+    with open(path, 'rb') as f:
+        if orjson is not None and 0 < size < MMAP_THRESHOLD_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _MADV_SEQUENTIAL is not None:
+                    mm.madvise(_MADV_SEQUENTIAL)
+                if skip_pattern is not None and skip_pattern.search(mm):
+                    return None
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        if _HAS_FADVISE and size > 0:
+            try:
+                os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        raw = f.read()
+
+    if skip_pattern is not None and skip_pattern.search(raw):
+        return None
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _scan_example_entries(examples_dir: Path) -> List[os.DirEntry]:
+    """
+    List candidate extraction result files in one directory pass.
+
+    Review files, batch reports and hidden files (such as the learner's own
+    parse cache) are excluded. scandir entries carry their stat info, so no
+    Path objects are built here.
+
+    Args:
+        examples_dir: Directory containing past extraction results
+
+    Returns:
+        Directory entries for candidate JSON files
+    """
+    with os.scandir(examples_dir) as it:
+        return [
+            entry for entry in it
+            if entry.name.endswith(".json")
+            and not entry.name.startswith(("REVIEW_", "batch_report", "."))
+            and entry.is_file()
+        ]
+
+
+def count_candidate_examples(examples_dir: str = "output/", limit: Optional[int] = None) -> int:
+    """
+    Count result files that are not known failures, without decoding JSON.
+
+    Each file is only scanned for a top-level "success": false, so the
+    count is an upper bound on the examples ExtractionLearner would load.
+    Use it to decide cheaply whether loading examples is worthwhile.
+
+    Args:
+        examples_dir: Directory containing past extraction results
+        limit: Stop scanning once this many candidates have been found
+
+    Returns:
+        Number of candidate files (capped at limit if given)
+    """
+    examples_dir = Path(examples_dir)
+    if not examples_dir.exists():
+        return 0
+
+    count = 0
+    for entry in _scan_example_entries(examples_dir):
+        try:
+            with open(entry.path, 'rb') as f:
+                if FAILED_RESULT_RE.search(f.read()):
+                    continue
+        except OSError:
+            continue
+
+        count += 1
+        if limit is not None and count >= limit:
+            break
+
+    return count
+
+
+def _parse_example_file(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse one extraction result file into a few-shot example.
+
+    Kept at module level so it can be shipped to worker processes.
+
+    Args:
+        path: Path to the extraction result JSON
+
+    Returns:
+        Example dictionary, or None if the file is not a usable example
+        (failed extraction, missing bio, low confidence, or unparseable)
+    """
+    json_file = Path(path)
+    try:
+        data = _read_json(json_file, json_file.stat().st_size, skip_pattern=FAILED_RESULT_RE)
+
+        # Check if it's a valid extraction result (known failures are
+        # rejected by the byte scan above without being decoded)
+        if not data or not data.get('success'):
+            return None
+
+        # Check if officer_bio exists
+        if 'officer_bio' not in data:
+            return None
+
+        officer_bio = data['officer_bio']
+
+        # Check confidence threshold
+        confidence = officer_bio.get('confidence_score', 0.0)
+        if confidence < 0.7:
+            return None
+
+        # Only the bio is used downstream, so validate just that model;
+        # tool call and token counts are read straight from the raw dict
+        officer = OfficerBio.model_validate(officer_bio)
+
+        return {
+            'file': json_file.name,
+            'officer_bio': officer,
+            'confidence': confidence,
+            'tool_calls': len(data.get('tool_calls') or []),
+            'tokens': data.get('total_input_tokens', 0) + data.get('total_output_tokens', 0),
+        }
+
+    except Exception as e:
+        logger.debug(f"Skipping {json_file.name}: {e}")
+        return None
+
 
 class ExtractionLearner:
     """
@@ -24,17 +205,65 @@ class ExtractionLearner:
     and including them as examples in the system prompt.
     """
 
-    def __init__(self, examples_dir: str = "output/"):
+    def __init__(self, examples_dir: str = "output/", use_parse_cache: bool = True):
         """
         Initialize the learning system.
 
         Args:
             examples_dir: Directory containing past extraction results
+            use_parse_cache: Reuse parse results for unchanged files from the
+                sidecar cache in examples_dir
         """
         self.examples_dir = Path(examples_dir)
+        self.use_parse_cache = use_parse_cache
+        self.parse_cache_path = self.examples_dir / PARSE_CACHE_FILENAME
         self.examples_cache = []
         self.load_successful_extractions()
 
+    def _load_parse_cache(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the per-file parse cache.
+
+        Returns:
+            Mapping of file name to cached size, mtime and example summary
+            (empty if caching is disabled or the cache is missing/corrupt)
+        """
+        if not self.use_parse_cache or not self.parse_cache_path.exists():
+            return {}
+
+        try:
+            cache = _read_json(self.parse_cache_path, self.parse_cache_path.stat().st_size)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable parse cache: {e}")
+            return {}
+
+        if not isinstance(cache, dict) or cache.get('version') != PARSE_CACHE_VERSION:
+            return {}
+        return cache.get('files', {})
+
+    def _save_parse_cache(self, files: Dict[str, Dict[str, Any]]):
+        """
+        Atomically write the per-file parse cache.
+
+        Args:
+            files: Mapping of file name to cached size, mtime and example summary
+        """
+        if not self.use_parse_cache:
+            return
+
+        payload = {'version': PARSE_CACHE_VERSION, 'files': files}
+        # Unique temp name: concurrent batch workers each own a learner and
+        # may save at the same time; the last os.replace wins intact
+        cache_path = self.parse_cache_path
+        tmp_path = cache_path.with_name(f".{cache_path.name}.{uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write parse cache: {e}")
+            tmp_path.unlink(missing_ok=True)
+
     def load_successful_extractions(self):
         """
         Load successful extractions from the examples directory.
@@ -50,57 +279,77 @@ class ExtractionLearner:
             logger.warning(f"Examples directory not found: {self.examples_dir}")
             return
 
-        # Find all JSON files (exclude review and batch reports)
-        json_files = list(self.examples_dir.glob("*.json"))
-        json_files = [
-            f for f in json_files
-            if not f.name.startswith("REVIEW_")
-            and not f.name.startswith("batch_report")
-        ]
+        json_files = _scan_example_entries(self.examples_dir)
 
         logger.debug(f"Found {len(json_files)} potential example files")
 
-        # Load and filter examples
-        successful_examples = []
-
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                # Check if it's a valid extraction result
-                if not data.get('success'):
-                    continue
-
-                # Check if officer_bio exists
-                if 'officer_bio' not in data:
-                    continue
-
-                officer_bio = data['officer_bio']
-
-                # Check confidence threshold
-                confidence = officer_bio.get('confidence_score', 0.0)
-                if confidence < 0.7:
-                    continue
-
-                # Parse into AgentExtractionResult
-                result = AgentExtractionResult(**data)
+        # Reuse cached parse results for files whose size and mtime are
+        # unchanged; only new or modified files are parsed again
+        parse_cache = self._load_parse_cache()
+        fresh_cache = {}
+        pending = []
+        for entry in json_files:
+            st = entry.stat()
+            cached = parse_cache.get(entry.name)
+            if (
+                cached is not None
+                and cached.get('size') == st.st_size
+                and cached.get('mtime_ns') == st.st_mtime_ns
+            ):
+                fresh_cache[entry.name] = cached
+            else:
+                fresh_cache[entry.name] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+                pending.append(entry.path)
+
+        logger.debug(f"{len(json_files) - len(pending)} examples cached, {len(pending)} to parse")
+
+        # Load and filter examples; large directories are parsed in parallel
+        # since each file is independent and parsing is CPU-bound. Workers
+        # are spawned, not forked: the learner is often built on a background
+        # thread (SDK init futures, batch workers), and forking a process
+        # with live threads can deadlock the child.
+        if len(pending) >= PARALLEL_PARSE_MIN_FILES:
+            n_chunks = -(-len(pending) // PARSE_CHUNK_SIZE)
+            with ProcessPoolExecutor(
+                max_workers=min(os.cpu_count() or 1, n_chunks),
+                mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                parsed = list(executor.map(_parse_example_file, pending, chunksize=PARSE_CHUNK_SIZE))
+        else:
+            parsed = [_parse_example_file(path) for path in pending]
+
+        parsed_by_name = {}
+        for path, example in zip(pending, parsed):
+            name = os.path.basename(path)
+            parsed_by_name[name] = example
+            fresh_cache[name]['example'] = None if example is None else {
+                'officer_bio': example['officer_bio'].model_dump(mode='json'),
+                'confidence': example['confidence'],
+                'tool_calls': example['tool_calls'],
+                'tokens': example['tokens'],
+            }
 
-                # Store as example
+        successful_examples = []
+        for name, entry in fresh_cache.items():
+            if name in parsed_by_name:
+                example = parsed_by_name[name]
+            elif entry.get('example') is not None:
+                cached = entry['example']
                 example = {
-                    'file': json_file.name,
-                    'officer_bio': result.officer_bio,
-                    'confidence': confidence,
-                    'tool_calls': len(result.tool_calls),
-                    'tokens': result.get_total_tokens(),
-                    'result': result
+                    'file': name,
+                    'officer_bio': OfficerBio.model_validate(cached['officer_bio']),
+                    'confidence': cached['confidence'],
+                    'tool_calls': cached['tool_calls'],
+                    'tokens': cached['tokens'],
                 }
+            else:
+                example = None
 
+            if example is not None:
                 successful_examples.append(example)
 
-            except Exception as e:
-                logger.debug(f"Skipping {json_file.name}: {e}")
-                continue
+        if pending or len(fresh_cache) != len(parse_cache):
+            self._save_parse_cache(fresh_cache)
 
         # Sort by confidence (highest first)
         successful_examples.sort(key=lambda x: x['confidence'], reverse=True)
@@ -374,15 +623,19 @@ class ExtractionLearner:
                 'max_confidence': 0.0
             }
 
-        confidences = [ex['confidence'] for ex in self.examples_cache]
+        # examples_cache is sorted by confidence (highest first) at load time,
+        # so the extremes are its endpoints and the threshold counts are
+        # found by binary search instead of extra scans
+        ascending = [ex['confidence'] for ex in reversed(self.examples_cache)]
+        total = len(ascending)
 
         return {
-            'total_examples': len(self.examples_cache),
-            'avg_confidence': sum(confidences) / len(confidences),
-            'min_confidence': min(confidences),
-            'max_confidence': max(confidences),
-            'examples_above_0.8': sum(1 for c in confidences if c >= 0.8),
-            'examples_above_0.9': sum(1 for c in confidences if c >= 0.9),
+            'total_examples': total,
+            'avg_confidence': sum(ascending) / total,
+            'min_confidence': ascending[0],
+            'max_confidence': ascending[-1],
+            'examples_above_0.8': total - bisect_left(ascending, 0.8),
+            'examples_above_0.9': total - bisect_left(ascending, 0.9),
         }
 
     def should_use_few_shot(self, min_examples: int = 5) -> bool:
@@ -0,0 +1,103 @@
+"""
+On-disk cache of extraction results.
+
+Re-extracting the same source text (e.g. re-running the demo, or retrying a
+batch) repeats a full model call for an answer that is already known. This
+cache stores successful AgentExtractionResult objects as JSON files keyed on
+a hash of the model, source URL and source text, so such repeats return
+immediately. Entries expire after a TTL so prompt or model changes are picked
+up without manual clearing.
+"""
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+from uuid import uuid4
+
+from pydantic import ValidationError
+
+from schema import AgentExtractionResult
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(model: str, source_url: str, source_text: str) -> str:
+    """
+    Build the cache key for one extraction request.
+
+    Args:
+        model: Model name used for the extraction
+        source_url: Source URL (stored in the result, so part of the key)
+        source_text: Source text
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for part in (model, source_url, source_text):
+        digest.update(part.encode('utf-8'))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ExtractionResultCache:
+    """Directory of cached extraction results, one JSON file per key."""
+
+    def __init__(self, cache_dir: str, ttl_seconds: int = 86400):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cached results (created on first write)
+            ttl_seconds: How long an entry stays valid
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[AgentExtractionResult]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key from make_cache_key()
+
+        Returns:
+            The cached result, or None if missing, expired or unreadable
+        """
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            return AgentExtractionResult.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {path.name}: {e}")
+            return None
+
+    def set(self, key: str, result: AgentExtractionResult) -> None:
+        """
+        Store a result.
+
+        Written to a temporary file and renamed into place, so concurrent
+        readers never see a partial entry. Failures are logged, not raised:
+        the cache is an optimization.
+
+        Args:
+            key: Key from make_cache_key()
+            result: Extraction result to store
+        """
+        path = self._path(key)
+        tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(result.model_dump_json(), encoding='utf-8')
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write extraction cache entry: {e}")
+            tmp_path.unlink(missing_ok=True)
@@ -1,4 +1,5 @@
 """Pydantic models for PLA leadership data extraction."""
+import json
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -230,7 +231,6 @@ class OfficerBio(BaseModel):
         Returns:
             JSON string
         """
-        import json
         return json.dumps(
             self.to_dict(exclude_none=exclude_none),
             ensure_ascii=False,
@@ -392,7 +392,6 @@ class AgentExtractionResult(BaseModel):
         Returns:
             JSON string
         """
-        import json
         return json.dumps(
             self.to_dict(exclude_none=exclude_none),
             ensure_ascii=False,
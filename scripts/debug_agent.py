@@ -1,32 +1,163 @@
 """Debug tool for analyzing PLA Agent SDK extraction results."""
+import filecmp
 import json
+import mmap
+import os
 import sys
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Any, List
+from functools import lru_cache
 from collections import Counter
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.tree import Tree
-from rich.text import Text
-from rich import box
-from rich.columns import Columns
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+    from rich.text import Text
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from schema import AgentExtractionResult, OfficerBio, ToolResult
 
-console = Console()
+@lru_cache(maxsize=None)
+def _console() -> "Console":
+    """
+    Shared Rich console, created on first use.
+
+    Rich is most of this script's import time; the usage text, argument
+    errors and `analyze --format=json` never need it.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+# Longest tool timeline analyze prints in full; longer ones are elided in the middle
+MAX_TIMELINE_STEPS = 100
+
+# Optional officer fields shown by replay, in display order: (key, label)
+_REPLAY_BIO_FIELDS = (
+    ('pinyin_name', "Pinyin Name"),
+    ('hometown', "Hometown"),
+    ('birth_date', "Birth Date"),
+    ('death_date', "Death Date"),
+    ('enlistment_date', "Enlistment Date"),
+    ('party_membership_date', "Party Membership"),
+)
+
+
+@lru_cache(maxsize=None)
+def _styled_cells() -> Dict[str, "Text"]:
+    """
+    Build the shared pre-styled table cells (once, on first use).
+
+    Text cells let table rows skip Rich's markup parser. Styles are spans
+    (not the Text base style) so column padding stays unstyled, as with markup.
+    """
+    from rich.text import Text
+
+    return {
+        "match": Text.assemble(("✓", "green")),
+        "mismatch": Text.assemble(("✗", "red")),
+        "null": Text.assemble(("null", "dim")),
+        "null_highlighted": Text.assemble(("null", "yellow dim")),
+    }
+
+
+def _value_cell(value: Any, highlight: bool) -> "Text":
+    """Styled table cell for a compared bio value (None shows as null)."""
+    if value is None:
+        return _styled_cells()["null_highlighted" if highlight else "null"]
+    from rich.text import Text
+
+    return Text.assemble((str(value), "yellow" if highlight else ""))
+
+
+# Table column specs: (header, add_column kwargs). A header of 0 or 1 is replaced
+# by the first or second compared file's name.
+_BIO_COLUMNS = (
+    ("Field", {"style": "cyan", "width": 25}),
+    ("Value", {"style": "white"}),
+)
+_METRICS_COLUMNS = (
+    ("Metric", {"style": "cyan"}),
+    ("Value", {"style": "white", "justify": "right"}),
+)
+_FREQUENCY_COLUMNS = (
+    ("Tool Name", {"style": "cyan"}),
+    ("Count", {"style": "white", "justify": "right"}),
+    ("Percentage", {"style": "yellow", "justify": "right"}),
+    ("Success Rate", {"style": "green", "justify": "right"}),
+)
+_COMPARE_BIO_COLUMNS = (
+    ("Field", {"style": "cyan", "width": 25}),
+    (0, {"style": "white", "width": 35}),
+    (1, {"style": "white", "width": 35}),
+    ("Match", {"style": "dim", "width": 8}),
+)
+_COMPARE_PERF_COLUMNS = (
+    ("Metric", {"style": "cyan"}),
+    (0, {"style": "white", "justify": "right"}),
+    (1, {"style": "white", "justify": "right"}),
+    ("Diff", {"style": "yellow", "justify": "right"}),
+)
+_COMPARE_TOOL_COLUMNS = (
+    ("Tool", {"style": "cyan"}),
+    (0, {"style": "white", "justify": "right"}),
+    (1, {"style": "white", "justify": "right"}),
+)
+
+
+def _build_table(columns, names=(), **table_kwargs) -> "Table":
+    """
+    Create a table from a column spec.
+
+    Args:
+        columns: Column spec tuple (see above)
+        names: File names substituted for numeric headers
+        **table_kwargs: Passed to Table (box defaults to box.ROUNDED)
+
+    Returns:
+        Table with its columns added
+    """
+    from rich import box
+    from rich.table import Table
+
+    table_kwargs.setdefault("box", box.ROUNDED)
+    table = Table(**table_kwargs)
+    for header, column_kwargs in columns:
+        table.add_column(names[header] if isinstance(header, int) else header, **column_kwargs)
+    return table
+
+
+@lru_cache(maxsize=32)
+def _load_extraction_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a saved extraction; keyed on mtime so edits invalidate."""
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # catching the latter still work.
+    with open(path_str, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size:
+            # orjson parses straight from the mapped pages, so no bytes
+            # copy of the file is made (mmap rejects empty files)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 def load_extraction_result(json_file: str) -> Dict[str, Any]:
     """
     Load extraction result from JSON file.
 
+    Results are memoized per (resolved path, modification time), so a
+    baseline compared against many candidates in one process is parsed
+    once. The returned dict is shared between calls and must not be modified.
+
     Args:
         json_file: Path to JSON file
 
@@ -39,13 +170,92 @@ def load_extraction_result(json_file: str) -> Dict[str, Any]:
     """
     file_path = Path(json_file)
 
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {json_file}")
+    try:
+        mtime_ns = file_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {json_file}") from None
+
+    return _load_extraction_cached(str(file_path.resolve()), mtime_ns)
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
 
-    return data
+def _load_many(json_files: List[str]) -> List[Dict[str, Any]]:
+    """
+    Load several extraction results concurrently.
+
+    File reads release the GIL, so the reads overlap instead of running
+    back to back.
+
+    Args:
+        json_files: Paths to JSON files
+
+    Returns:
+        Parsed results, in the same order as json_files
+
+    Raises:
+        FileNotFoundError: If any file doesn't exist
+        json.JSONDecodeError: If any file is not valid JSON
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(json_files)) as executor:
+        return list(executor.map(load_extraction_result, json_files))
+
+
+def _render_validate_dates(tool_data: Dict[str, Any]) -> str:
+    """Summarize a validate_dates result for the replay panel."""
+    valid = tool_data.get('valid', False)
+    content = f"Valid: [{'green' if valid else 'red'}]{valid}[/]\n"
+    if tool_data.get('issues'):
+        content += f"Issues: {', '.join(tool_data['issues'])}\n"
+    return content
+
+
+def _render_verify_information(tool_data: Dict[str, Any]) -> str:
+    """Summarize a verify_information_present result for the replay panel."""
+    found = tool_data.get('found', False)
+    field_name = tool_data.get('field_name', 'unknown')
+    content = f"Field: [cyan]{field_name}[/cyan]\n"
+    content += f"Found: [{'green' if found else 'yellow'}]{found}[/]\n"
+    if tool_data.get('evidence'):
+        evidence = tool_data['evidence'][:100]
+        content += f"Evidence: [dim]{evidence}...[/dim]\n"
+    return content
+
+
+def _render_officer_lookup(tool_data: Dict[str, Any]) -> str:
+    """Summarize a lookup_existing_officer result for the replay panel."""
+    found = tool_data.get('found', False)
+    officer_name = tool_data.get('officer_name', 'unknown')
+    content = f"Officer: [cyan]{officer_name}[/cyan]\n"
+    content += f"Found in DB: [{'green' if found else 'yellow'}]{found}[/]\n"
+    return content
+
+
+def _render_unit_lookup(tool_data: Dict[str, Any]) -> str:
+    """Summarize a lookup_unit_by_name result for the replay panel."""
+    found = tool_data.get('found', False)
+    unit_name = tool_data.get('unit_name', 'unknown')
+    content = f"Unit: [cyan]{unit_name}[/cyan]\n"
+    content += f"Found: [{'green' if found else 'yellow'}]{found}[/]\n"
+    return content
+
+
+def _render_save_officer(tool_data: Dict[str, Any]) -> str:
+    """Summarize a save_officer_bio result for the replay panel."""
+    saved_officer = tool_data.get('officer_bio', {})
+    content = f"Saved: [green]{saved_officer.get('name', 'unknown')}[/green]\n"
+    content += f"Confidence: {saved_officer.get('confidence_score', 0.0):.2f}\n"
+    return content
+
+
+# Tool name -> summary renderer for successful calls; other tools show no details
+_TOOL_RENDERERS = {
+    "validate_dates": _render_validate_dates,
+    "verify_information_present": _render_verify_information,
+    "lookup_existing_officer": _render_officer_lookup,
+    "lookup_unit_by_name": _render_unit_lookup,
+    "save_officer_bio": _render_save_officer,
+}
 
 
 def replay_conversation(json_file: str):
@@ -61,6 +271,10 @@ def replay_conversation(json_file: str):
     Args:
         json_file: Path to saved AgentExtractionResult JSON file
     """
+    from rich import box
+    from rich.panel import Panel
+
+    console = _console()
     console.print("\n[bold cyan]═══ Conversation Replay ═══[/bold cyan]\n")
 
     try:
@@ -94,23 +308,13 @@ def replay_conversation(json_file: str):
     if officer_bio:
         console.print("\n[bold yellow]📋 Extracted Officer Information[/bold yellow]\n")
 
-        bio_table = Table(show_header=False, box=box.SIMPLE)
-        bio_table.add_column("Field", style="cyan", width=25)
-        bio_table.add_column("Value", style="white")
+        bio_table = _build_table(_BIO_COLUMNS, show_header=False, box=box.SIMPLE)
 
         bio_table.add_row("Name", officer_bio.get('name', 'N/A'))
-        if officer_bio.get('pinyin_name'):
-            bio_table.add_row("Pinyin Name", officer_bio['pinyin_name'])
-        if officer_bio.get('hometown'):
-            bio_table.add_row("Hometown", officer_bio['hometown'])
-        if officer_bio.get('birth_date'):
-            bio_table.add_row("Birth Date", officer_bio['birth_date'])
-        if officer_bio.get('death_date'):
-            bio_table.add_row("Death Date", officer_bio['death_date'])
-        if officer_bio.get('enlistment_date'):
-            bio_table.add_row("Enlistment Date", officer_bio['enlistment_date'])
-        if officer_bio.get('party_membership_date'):
-            bio_table.add_row("Party Membership", officer_bio['party_membership_date'])
+        for key, label in _REPLAY_BIO_FIELDS:
+            value = officer_bio.get(key)
+            if value:
+                bio_table.add_row(label, value)
 
         bio_table.add_row("Confidence Score", f"{officer_bio.get('confidence_score', 0.0):.2f}")
 
@@ -142,37 +346,9 @@ def replay_conversation(json_file: str):
 
         if success:
             # Show key data from successful tool calls
-            if tool_name == "validate_dates":
-                valid = tool_data.get('valid', False)
-                panel_content += f"Valid: [{'green' if valid else 'red'}]{valid}[/]\n"
-                if tool_data.get('issues'):
-                    panel_content += f"Issues: {', '.join(tool_data['issues'])}\n"
-
-            elif tool_name == "verify_information_present":
-                found = tool_data.get('found', False)
-                field_name = tool_data.get('field_name', 'unknown')
-                panel_content += f"Field: [cyan]{field_name}[/cyan]\n"
-                panel_content += f"Found: [{'green' if found else 'yellow'}]{found}[/]\n"
-                if tool_data.get('evidence'):
-                    evidence = tool_data['evidence'][:100]
-                    panel_content += f"Evidence: [dim]{evidence}...[/dim]\n"
-
-            elif tool_name == "lookup_existing_officer":
-                found = tool_data.get('found', False)
-                officer_name = tool_data.get('officer_name', 'unknown')
-                panel_content += f"Officer: [cyan]{officer_name}[/cyan]\n"
-                panel_content += f"Found in DB: [{'green' if found else 'yellow'}]{found}[/]\n"
-
-            elif tool_name == "lookup_unit_by_name":
-                found = tool_data.get('found', False)
-                unit_name = tool_data.get('unit_name', 'unknown')
-                panel_content += f"Unit: [cyan]{unit_name}[/cyan]\n"
-                panel_content += f"Found: [{'green' if found else 'yellow'}]{found}[/]\n"
-
-            elif tool_name == "save_officer_bio":
-                saved_officer = tool_data.get('officer_bio', {})
-                panel_content += f"Saved: [green]{saved_officer.get('name', 'unknown')}[/green]\n"
-                panel_content += f"Confidence: {saved_officer.get('confidence_score', 0.0):.2f}\n"
+            renderer = _TOOL_RENDERERS.get(tool_name)
+            if renderer:
+                panel_content += renderer(tool_data)
         else:
             # Show error for failed calls
             panel_content += f"[red]Error: {error}[/red]\n"
@@ -200,7 +376,27 @@ def replay_conversation(json_file: str):
     console.print()
 
 
-def analyze_tool_usage(json_file: str):
+def _write_json_stdout(payload: Dict[str, Any]):
+    """Write one JSON document (plus newline) to stdout, bypassing Rich."""
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+        sys.stdout.buffer.flush()
+    else:
+        sys.stdout.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+
+def _print_error(message: str, to_stderr: bool = False):
+    """Print an error message, on stderr for machine-readable output modes."""
+    if to_stderr:
+        from rich.console import Console
+
+        Console(stderr=True).print(message)
+    else:
+        _console().print(message)
+
+
+def analyze_tool_usage(json_file: str, output_format: str = "rich"):
     """
     Analyze tool usage patterns and generate statistics.
 
@@ -212,41 +408,54 @@ def analyze_tool_usage(json_file: str):
 
     Args:
         json_file: Path to saved AgentExtractionResult JSON file
+        output_format: "rich" for the formatted report, or "json" to write
+            the aggregates as one JSON object to stdout (errors go to stderr)
     """
-    console.print("\n[bold cyan]═══ Tool Usage Analysis ═══[/bold cyan]\n")
+    as_json = output_format == "json"
+    console = None if as_json else _console()
+    if not as_json:
+        console.print("\n[bold cyan]═══ Tool Usage Analysis ═══[/bold cyan]\n")
 
     try:
         data = load_extraction_result(json_file)
     except FileNotFoundError as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        _print_error(f"[bold red]Error:[/bold red] {e}", to_stderr=as_json)
         return
     except json.JSONDecodeError as e:
-        console.print(f"[bold red]Error:[/bold red] Invalid JSON file: {e}")
+        _print_error(f"[bold red]Error:[/bold red] Invalid JSON file: {e}", to_stderr=as_json)
         return
 
     tool_calls = data.get('tool_calls', [])
 
-    if not tool_calls:
+    if not tool_calls and not as_json:
         console.print("[yellow]No tool calls found in this extraction[/yellow]")
         return
 
-    # Gather statistics
-    tool_names = [tc.get('tool_name') for tc in tool_calls]
-    tool_counter = Counter(tool_names)
+    # Gather statistics in one pass over the tool calls
+    tool_counter = Counter()
+    success_counter = Counter()
+    failed_counter = Counter()
+    timeline_steps = []
+    add_step = timeline_steps.append  # Bound once; this loop runs per tool call
+    for tc in tool_calls:
+        tool_name = tc.get('tool_name')
+        succeeded = bool(tc.get('success', False))
+        tool_counter[tool_name] += 1
+        if succeeded:
+            success_counter[tool_name] += 1
+        else:
+            failed_counter[tool_name] += 1
+        add_step((tc.get('tool_name', '?'), succeeded))
 
-    successful_calls = sum(1 for tc in tool_calls if tc.get('success', False))
-    failed_calls = len(tool_calls) - successful_calls
+    successful_calls = sum(success_counter.values())
+    failed_calls = sum(failed_counter.values())
     overall_success_rate = successful_calls / len(tool_calls) if tool_calls else 0
 
     # Per-tool success rates
-    tool_success_rates = {}
-    for tool_name in set(tool_names):
-        tool_total = sum(1 for tc in tool_calls if tc.get('tool_name') == tool_name)
-        tool_successful = sum(
-            1 for tc in tool_calls
-            if tc.get('tool_name') == tool_name and tc.get('success', False)
-        )
-        tool_success_rates[tool_name] = (tool_successful / tool_total) if tool_total > 0 else 0
+    tool_success_rates = {
+        tool_name: success_counter[tool_name] / total
+        for tool_name, total in tool_counter.items()
+    }
 
     # Token usage
     total_input_tokens = data.get('total_input_tokens', 0)
@@ -256,16 +465,36 @@ def analyze_tool_usage(json_file: str):
 
     avg_tokens_per_turn = total_tokens / conversation_turns if conversation_turns > 0 else 0
 
+    if as_json:
+        _write_json_stdout({
+            "file": json_file,
+            "total_calls": len(tool_calls),
+            "successful_calls": successful_calls,
+            "failed_calls": failed_calls,
+            "success_rate": overall_success_rate,
+            "tool_frequency": dict(tool_counter.most_common()),
+            "tool_success_rates": tool_success_rates,
+            "conversation_turns": conversation_turns,
+            "total_input_tokens": total_input_tokens,
+            "total_output_tokens": total_output_tokens,
+            "total_tokens": total_tokens,
+            "avg_tokens_per_turn": avg_tokens_per_turn,
+        })
+        return
+
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+
     # Display statistics
+    report = []
 
     # 1. Overall metrics
-    metrics_table = Table(title="Overall Metrics", box=box.ROUNDED)
-    metrics_table.add_column("Metric", style="cyan")
-    metrics_table.add_column("Value", style="white", justify="right")
+    metrics_table = _build_table(_METRICS_COLUMNS, title="Overall Metrics")
 
     metrics_table.add_row("Total Tool Calls", str(len(tool_calls)))
-    metrics_table.add_row("Successful Calls", f"[green]{successful_calls}[/green]")
-    metrics_table.add_row("Failed Calls", f"[red]{failed_calls}[/red]")
+    metrics_table.add_row("Successful Calls", Text.assemble((str(successful_calls), "green")))
+    metrics_table.add_row("Failed Calls", Text.assemble((str(failed_calls), "red")))
     metrics_table.add_row("Overall Success Rate", f"{overall_success_rate:.1%}")
     metrics_table.add_row("Conversation Turns", str(conversation_turns))
     metrics_table.add_row("Total Tokens", f"{total_tokens:,}")
@@ -273,15 +502,11 @@ def analyze_tool_usage(json_file: str):
     metrics_table.add_row("Output Tokens", f"{total_output_tokens:,}")
     metrics_table.add_row("Avg Tokens/Turn", f"{avg_tokens_per_turn:.0f}")
 
-    console.print(metrics_table)
-    console.print()
+    report.append(metrics_table)
+    report.append("")
 
     # 2. Tool frequency
-    freq_table = Table(title="Tool Call Frequency", box=box.ROUNDED)
-    freq_table.add_column("Tool Name", style="cyan")
-    freq_table.add_column("Count", style="white", justify="right")
-    freq_table.add_column("Percentage", style="yellow", justify="right")
-    freq_table.add_column("Success Rate", style="green", justify="right")
+    freq_table = _build_table(_FREQUENCY_COLUMNS, title="Tool Call Frequency")
 
     for tool_name, count in tool_counter.most_common():
         percentage = (count / len(tool_calls)) * 100
@@ -294,41 +519,45 @@ def analyze_tool_usage(json_file: str):
             f"{success_rate:.1%}"
         )
 
-    console.print(freq_table)
-    console.print()
+    report.append(freq_table)
+    report.append("")
 
     # 3. Tool execution timeline
-    console.print("[bold magenta]Tool Execution Order[/bold magenta]\n")
+    report.append("[bold magenta]Tool Execution Order[/bold magenta]\n")
 
-    timeline = " → ".join([
-        f"[{'green' if tc.get('success') else 'red'}]{tc.get('tool_name', '?')}[/]"
-        for tc in tool_calls
-    ])
-    console.print(Panel(timeline, border_style="cyan"))
-    console.print()
+    # Very long runs show only the first and last steps
+    if len(timeline_steps) > MAX_TIMELINE_STEPS:
+        half = MAX_TIMELINE_STEPS // 2
+        omitted = len(timeline_steps) - 2 * half
+        shown_steps = timeline_steps[:half] + [(f"… {omitted} omitted …", None)] + timeline_steps[-half:]
+    else:
+        shown_steps = timeline_steps
+
+    timeline = Text(" → ").join(
+        Text.assemble((str(tool_name), "dim" if succeeded is None else "green" if succeeded else "red"))
+        for tool_name, succeeded in shown_steps
+    )
+    report.append(Panel(timeline, border_style="cyan"))
+    report.append("")
 
     # 4. Insights and patterns
-    console.print("[bold yellow]📊 Insights & Patterns[/bold yellow]\n")
+    report.append("[bold yellow]📊 Insights & Patterns[/bold yellow]\n")
 
     insights = []
 
     # Check for common patterns
-    if "validate_dates" in tool_names:
+    if "validate_dates" in tool_counter:
         insights.append("✓ Agent validated dates for chronological consistency")
 
-    if "verify_information_present" in tool_names:
+    if "verify_information_present" in tool_counter:
         verify_count = tool_counter.get("verify_information_present", 0)
         insights.append(f"✓ Agent verified {verify_count} field(s) to prevent hallucination")
 
-    if "lookup_existing_officer" in tool_names:
+    if "lookup_existing_officer" in tool_counter:
         insights.append("✓ Agent checked for duplicate officers in database")
 
-    if "save_officer_bio" in tool_names:
-        save_successful = any(
-            tc.get('tool_name') == 'save_officer_bio' and tc.get('success')
-            for tc in tool_calls
-        )
-        if save_successful:
+    if "save_officer_bio" in tool_counter:
+        if success_counter["save_officer_bio"]:
             insights.append("[green]✓ Officer bio was successfully saved[/green]")
         else:
             insights.append("[red]✗ Officer bio save failed[/red]")
@@ -336,16 +565,9 @@ def analyze_tool_usage(json_file: str):
         insights.append("[yellow]⚠ Agent never called save_officer_bio[/yellow]")
 
     # Check for repeated failed calls
-    failed_tools = [
-        tc.get('tool_name')
-        for tc in tool_calls
-        if not tc.get('success', False)
-    ]
-    if failed_tools:
-        failed_counter = Counter(failed_tools)
-        for tool, count in failed_counter.items():
-            if count > 1:
-                insights.append(f"[red]⚠ '{tool}' failed {count} times[/red]")
+    for tool, count in failed_counter.items():
+        if count > 1:
+            insights.append(f"[red]⚠ '{tool}' failed {count} times[/red]")
 
     # Token efficiency
     if avg_tokens_per_turn > 5000:
@@ -353,10 +575,28 @@ def analyze_tool_usage(json_file: str):
     elif avg_tokens_per_turn < 2000:
         insights.append("[green]✓ Efficient token usage[/green]")
 
-    for insight in insights:
-        console.print(f"  {insight}")
+    report.extend(f"  {insight}" for insight in insights)
 
-    console.print()
+    report.append("")
+
+    # One render pass and write for the whole report
+    console.print(Group(*report))
+
+
+def _files_identical(file1: str, file2: str) -> bool:
+    """
+    Check whether two files have the same contents.
+
+    Files of different sizes are rejected from stat() alone; otherwise the
+    bytes are compared in chunks, stopping at the first difference.
+
+    Returns:
+        True if the contents match, False if they differ or can't be read
+    """
+    try:
+        return filecmp.cmp(file1, file2, shallow=False)
+    except OSError:
+        return False  # Let the loader report missing files
 
 
 def compare_extractions(file1: str, file2: str):
@@ -373,11 +613,20 @@ def compare_extractions(file1: str, file2: str):
         file1: Path to first extraction result
         file2: Path to second extraction result
     """
+    from rich.panel import Panel
+
+    console = _console()
     console.print("\n[bold cyan]═══ Extraction Comparison ═══[/bold cyan]\n")
 
     try:
-        data1 = load_extraction_result(file1)
-        data2 = load_extraction_result(file2)
+        if _files_identical(file1, file2):
+            console.print(Panel(
+                f"[green]✓ {Path(file1).name} and {Path(file2).name} are identical[/green]\n"
+                "[dim]Nothing to compare[/dim]",
+                border_style="green"
+            ))
+            return
+        data1, data2 = _load_many([file1, file2])
     except FileNotFoundError as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
         return
@@ -388,6 +637,14 @@ def compare_extractions(file1: str, file2: str):
     # Extract officer bios
     bio1 = data1.get('officer_bio', {})
     bio2 = data2.get('officer_bio', {})
+    bio1_get = bio1.get
+    bio2_get = bio2.get
+
+    # Fields reused by several sections below, looked up once
+    tool_calls1 = data1.get('tool_calls', [])
+    tool_calls2 = data2.get('tool_calls', [])
+    input1, output1 = data1.get('total_input_tokens', 0), data1.get('total_output_tokens', 0)
+    input2, output2 = data2.get('total_input_tokens', 0), data2.get('total_output_tokens', 0)
 
     # File names for display
     name1 = Path(file1).name
@@ -396,11 +653,7 @@ def compare_extractions(file1: str, file2: str):
     # 1. Officer Bio Comparison
     console.print("[bold yellow]📋 Officer Bio Comparison[/bold yellow]\n")
 
-    bio_table = Table(box=box.ROUNDED)
-    bio_table.add_column("Field", style="cyan", width=25)
-    bio_table.add_column(name1, style="white", width=35)
-    bio_table.add_column(name2, style="white", width=35)
-    bio_table.add_column("Match", style="dim", width=8)
+    bio_table = _build_table(_COMPARE_BIO_COLUMNS, names=(name1, name2))
 
     # Compare key fields
     fields_to_compare = [
@@ -410,26 +663,23 @@ def compare_extractions(file1: str, file2: str):
     ]
 
     differences_count = 0
+    cells = _styled_cells()
 
     for field in fields_to_compare:
-        val1 = bio1.get(field)
-        val2 = bio2.get(field)
-
-        # Format values
-        val1_str = str(val1) if val1 is not None else "[dim]null[/dim]"
-        val2_str = str(val2) if val2 is not None else "[dim]null[/dim]"
+        val1 = bio1_get(field)
+        val2 = bio2_get(field)
 
-        # Check if they match
+        # Check if they match; differences are highlighted
         match = val1 == val2
-        match_icon = "[green]✓[/green]" if match else "[red]✗[/red]"
-
         if not match:
             differences_count += 1
-            # Highlight differences
-            val1_str = f"[yellow]{val1_str}[/yellow]"
-            val2_str = f"[yellow]{val2_str}[/yellow]"
 
-        bio_table.add_row(field, val1_str, val2_str, match_icon)
+        bio_table.add_row(
+            field,
+            _value_cell(val1, highlight=not match),
+            _value_cell(val2, highlight=not match),
+            cells["match" if match else "mismatch"]
+        )
 
     console.print(bio_table)
     console.print()
@@ -441,8 +691,8 @@ def compare_extractions(file1: str, file2: str):
                    'cppcc_participation', 'awards']
 
     for field in list_fields:
-        list1 = bio1.get(field, []) or []
-        list2 = bio2.get(field, []) or []
+        list1 = bio1_get(field) or []
+        list2 = bio2_get(field) or []
 
         if not list1 and not list2:
             continue
@@ -461,26 +711,20 @@ def compare_extractions(file1: str, file2: str):
     # 3. Performance Comparison
     console.print("[bold yellow]⚡ Performance Comparison[/bold yellow]\n")
 
-    perf_table = Table(box=box.ROUNDED)
-    perf_table.add_column("Metric", style="cyan")
-    perf_table.add_column(name1, style="white", justify="right")
-    perf_table.add_column(name2, style="white", justify="right")
-    perf_table.add_column("Diff", style="yellow", justify="right")
+    perf_table = _build_table(_COMPARE_PERF_COLUMNS, names=(name1, name2))
 
-    # Metrics to compare
+    # Metrics to compare: (label, value1, value2, is_token_count)
     metrics = [
-        ('conversation_turns', 'Conversation Turns'),
-        ('total_input_tokens', 'Input Tokens'),
-        ('total_output_tokens', 'Output Tokens'),
+        ('Conversation Turns', data1.get('conversation_turns', 0), data2.get('conversation_turns', 0), False),
+        ('Input Tokens', input1, input2, True),
+        ('Output Tokens', output1, output2, True),
     ]
 
-    for key, label in metrics:
-        val1 = data1.get(key, 0)
-        val2 = data2.get(key, 0)
+    for label, val1, val2, is_tokens in metrics:
         diff = val2 - val1
         diff_str = f"+{diff}" if diff > 0 else str(diff)
 
-        if key.endswith('_tokens'):
+        if is_tokens:
             val1_str = f"{val1:,}"
             val2_str = f"{val2:,}"
         else:
@@ -490,8 +734,8 @@ def compare_extractions(file1: str, file2: str):
         perf_table.add_row(label, val1_str, val2_str, diff_str)
 
     # Total tokens
-    total1 = data1.get('total_input_tokens', 0) + data1.get('total_output_tokens', 0)
-    total2 = data2.get('total_input_tokens', 0) + data2.get('total_output_tokens', 0)
+    total1 = input1 + output1
+    total2 = input2 + output2
     total_diff = total2 - total1
     total_diff_str = f"+{total_diff:,}" if total_diff > 0 else f"{total_diff:,}"
     perf_table.add_row("Total Tokens", f"{total1:,}", f"{total2:,}", total_diff_str)
@@ -502,21 +746,15 @@ def compare_extractions(file1: str, file2: str):
     # 4. Tool Usage Comparison
     console.print("[bold yellow]🔧 Tool Usage Comparison[/bold yellow]\n")
 
-    tools1 = [tc.get('tool_name') for tc in data1.get('tool_calls', [])]
-    tools2 = [tc.get('tool_name') for tc in data2.get('tool_calls', [])]
-
-    tool_counter1 = Counter(tools1)
-    tool_counter2 = Counter(tools2)
+    tool_counter1 = Counter(tc.get('tool_name') for tc in tool_calls1)
+    tool_counter2 = Counter(tc.get('tool_name') for tc in tool_calls2)
 
-    all_tools = set(tools1 + tools2)
+    all_tools = sorted(tool_counter1.keys() | tool_counter2.keys())
 
     if all_tools:
-        tool_table = Table(box=box.ROUNDED)
-        tool_table.add_column("Tool", style="cyan")
-        tool_table.add_column(name1, style="white", justify="right")
-        tool_table.add_column(name2, style="white", justify="right")
+        tool_table = _build_table(_COMPARE_TOOL_COLUMNS, names=(name1, name2))
 
-        for tool in sorted(all_tools):
+        for tool in all_tools:
             count1 = tool_counter1.get(tool, 0)
             count2 = tool_counter2.get(tool, 0)
             tool_table.add_row(tool, str(count1), str(count2))
@@ -536,8 +774,8 @@ def compare_extractions(file1: str, file2: str):
         console.print(f"[bold yellow]⚠ {differences_count} field(s) differ[/bold yellow]")
 
     # Confidence comparison
-    conf1 = bio1.get('confidence_score', 0.0)
-    conf2 = bio2.get('confidence_score', 0.0)
+    conf1 = bio1_get('confidence_score', 0.0)
+    conf2 = bio2_get('confidence_score', 0.0)
 
     if conf1 > conf2:
         console.print(f"Higher confidence: [cyan]{name1}[/cyan] ({conf1:.2f} vs {conf2:.2f})")
@@ -559,50 +797,68 @@ def compare_extractions(file1: str, file2: str):
     console.print()
 
 
+USAGE = """PLA Agent SDK - Debug Tool
+
+Usage:
+  python scripts/debug_agent.py replay <json_file>
+    Replay extraction conversation step-by-step
+
+  python scripts/debug_agent.py analyze <json_file> [--format=json]
+    Analyze tool usage and generate statistics (--format=json for scripting)
+
+  python scripts/debug_agent.py compare <file1> <file2>
+    Compare two extraction results side-by-side
+
+Examples:
+  python scripts/debug_agent.py replay output/test_extraction.json
+  python scripts/debug_agent.py analyze output/林炳尧_20250210_220500.json
+  python scripts/debug_agent.py compare output/v1.json output/v2.json"""
+
+# Command name -> (handler, positional argument names, message when arguments are missing)
+COMMANDS = {
+    "replay": (replay_conversation, ("<json_file>",), "Missing JSON file argument"),
+    "analyze": (analyze_tool_usage, ("<json_file>",), "Missing JSON file argument"),
+    "compare": (compare_extractions, ("<file1>", "<file2>"), "Missing file arguments"),
+}
+
+
 def main():
     """Main CLI interface."""
     if len(sys.argv) < 2:
-        console.print("[bold cyan]PLA Agent SDK - Debug Tool[/bold cyan]\n")
-        console.print("Usage:")
-        console.print("  [yellow]python scripts/debug_agent.py replay <json_file>[/yellow]")
-        console.print("    Replay extraction conversation step-by-step\n")
-        console.print("  [yellow]python scripts/debug_agent.py analyze <json_file>[/yellow]")
-        console.print("    Analyze tool usage and generate statistics\n")
-        console.print("  [yellow]python scripts/debug_agent.py compare <file1> <file2>[/yellow]")
-        console.print("    Compare two extraction results side-by-side\n")
-        console.print("Examples:")
-        console.print("  python scripts/debug_agent.py replay output/test_extraction.json")
-        console.print("  python scripts/debug_agent.py analyze output/林炳尧_20250210_220500.json")
-        console.print("  python scripts/debug_agent.py compare output/v1.json output/v2.json")
+        # Plain print: the usage text doesn't need Rich (or its import time)
+        print(USAGE)
         sys.exit(1)
 
-    command = sys.argv[1].lower()
+    # --format=rich|json is accepted anywhere on the command line (analyze only)
+    argv = [arg for arg in sys.argv[1:] if not arg.startswith("--format=")]
+    formats = [arg.split("=", 1)[1] for arg in sys.argv[1:] if arg.startswith("--format=")]
+    output_format = formats[-1] if formats else "rich"
 
-    if command == "replay":
-        if len(sys.argv) < 3:
-            console.print("[bold red]Error:[/bold red] Missing JSON file argument")
-            console.print("Usage: python scripts/debug_agent.py replay <json_file>")
-            sys.exit(1)
-        replay_conversation(sys.argv[2])
+    command = argv[0].lower() if argv else ""
+    entry = COMMANDS.get(command)
 
-    elif command == "analyze":
-        if len(sys.argv) < 3:
-            console.print("[bold red]Error:[/bold red] Missing JSON file argument")
-            console.print("Usage: python scripts/debug_agent.py analyze <json_file>")
-            sys.exit(1)
-        analyze_tool_usage(sys.argv[2])
+    if entry is None:
+        print(f"Error: Unknown command '{command}'")
+        print(f"Valid commands: {', '.join(COMMANDS)}")
+        sys.exit(1)
 
-    elif command == "compare":
-        if len(sys.argv) < 4:
-            console.print("[bold red]Error:[/bold red] Missing file arguments")
-            console.print("Usage: python scripts/debug_agent.py compare <file1> <file2>")
-            sys.exit(1)
-        compare_extractions(sys.argv[2], sys.argv[3])
+    handler, arg_names, missing_message = entry
+    args = argv[1:1 + len(arg_names)]
+    if len(args) < len(arg_names):
+        print(f"Error: {missing_message}")
+        print(f"Usage: python scripts/debug_agent.py {command} {' '.join(arg_names)}")
+        sys.exit(1)
 
-    else:
-        console.print(f"[bold red]Error:[/bold red] Unknown command '{command}'")
-        console.print("Valid commands: replay, analyze, compare")
+    if output_format not in ("rich", "json"):
+        print(f"Error: Unknown format '{output_format}' (expected rich or json)")
         sys.exit(1)
+    if output_format == "json":
+        if command != "analyze":
+            print("Error: --format=json is only supported by analyze")
+            sys.exit(1)
+        handler(*args, output_format=output_format)
+    else:
+        handler(*args)
 
 
 if __name__ == "__main__":
@@ -10,18 +10,20 @@ Showcases the universal agentic extraction system with:
 - Beautiful Rich formatting
 
 Usage: python scripts/demo.py
+       PLA_DEMO_CACHE=0 python scripts/demo.py   # always call the API
+       PLA_DEMO_PACE=0 python scripts/demo.py    # no presentation pauses
 """
 
+import hashlib
+import os
 import time
 import logging
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.live import Live
-from rich.layout import Layout
 from rich.text import Text
 from rich import box
 
@@ -29,17 +31,20 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from agent import PLAgentSDK, ConversationPrinter
+from agent import PLAgentSDK
 from tools.extraction_tools import extract_text_from_file
-from tools.database_tools import execute_lookup_officer
-import json
+from tools.database_tools import execute_lookup_officers
 
 console = Console()
+logger = logging.getLogger(__name__)
 
+# Multiplier for the demo's presentation pauses; PLA_DEMO_PACE=0 skips them
+# (for CI and profiling), 0.5 halves them
+DEMO_PACE = float(os.getenv("PLA_DEMO_PACE", "1.0"))
 
-def print_header():
-    """Print impressive header."""
-    header_text = """
+
+# Banner and step rule, built once rather than on every call
+_HEADER = """
     ╔═══════════════════════════════════════════════════════════════╗
     ║                                                               ║
     ║                    PLA AGENT (plAgent)                       ║
@@ -51,19 +56,61 @@ def print_header():
     ║                                                               ║
     ╚═══════════════════════════════════════════════════════════════╝
     """
-    console.print(header_text, style="bold cyan")
+_RULE = f"[bold magenta]{'═' * 70}[/bold magenta]"
+
+# Shared bio table cells; Text instances are rendered without markup parsing
+_NULL_CELL = Text.assemble(("null", "dim"))
+_OK_ICON = Text.assemble(("✓", "green"))
+_WARN_ICON = Text.assemble(("⚠", "yellow"))
+
+# What each tool contributes, shown in the tool usage table
+_TOOL_PURPOSES = {
+    "lookup_existing_officer": "Check for duplicate records",
+    "verify_information_present": "Prevent hallucination",
+    "validate_dates": "Ensure chronological consistency",
+    "lookup_unit_by_name": "Enrich with unit data",
+    "save_officer_bio": "Save extracted biography",
+    "save_to_database": "Persist to PostgreSQL"
+}
+
+
+def _sleep(seconds: float):
+    """Pause for presentation effect, scaled by DEMO_PACE."""
+    if DEMO_PACE > 0:
+        time.sleep(seconds * DEMO_PACE)
+
+
+def _list_cell(items, limit=3) -> str:
+    """
+    Render a list as bullet lines for a table cell.
+
+    Args:
+        items: Items to show
+        limit: Maximum number of bullets; the rest are summarized as
+            "... +N more". None shows every item.
+    """
+    n = len(items)
+    cell = "\n".join(f"• {item}" for item in items[:limit])
+    if limit is not None and n > limit:
+        cell += f"\n[dim]... +{n - limit} more[/dim]"
+    return cell
+
+
+def print_header():
+    """Print impressive header."""
+    console.print(_HEADER, style="bold cyan")
     console.print()
 
 
 def print_step(step_num: int, title: str, description: str):
     """Print step header with dramatic effect."""
     console.print()
-    console.print(f"[bold magenta]{'═' * 70}[/bold magenta]")
+    console.print(_RULE)
     console.print(f"[bold white]STEP {step_num}: {title}[/bold white]")
     console.print(f"[dim]{description}[/dim]")
-    console.print(f"[bold magenta]{'═' * 70}[/bold magenta]")
+    console.print(_RULE)
     console.print()
-    time.sleep(1.5)
+    _sleep(1.5)
 
 
 def load_test_obituary() -> tuple[str, str]:
@@ -79,10 +126,12 @@ def load_test_obituary() -> tuple[str, str]:
     source_text = extract_text_from_file(str(test_file))
     source_url = "https://www.news.cn/mil/2025-01/15/c_test_obituary.htm"
 
+    char_count = len(source_text)
+
     # Display preview
     console.print("[cyan]📄 Source Text Preview:[/cyan]")
     preview_panel = Panel(
-        source_text[:300] + "..." if len(source_text) > 300 else source_text,
+        source_text[:300] + "..." if char_count > 300 else source_text,
         title="Source Text",
         border_style="cyan",
         padding=(1, 2)
@@ -93,28 +142,37 @@ def load_test_obituary() -> tuple[str, str]:
     stats_table = Table(show_header=False, box=None)
     stats_table.add_column("Metric", style="cyan")
     stats_table.add_column("Value", style="white")
-    stats_table.add_row("Character Count", f"{len(source_text):,}")
-    stats_table.add_row("Estimated Tokens", f"~{len(source_text) // 4:,}")
+    stats_table.add_row("Character Count", f"{char_count:,}")
+    stats_table.add_row("Estimated Tokens", f"~{char_count // 4:,}")
     stats_table.add_row("Source URL", source_url)
     console.print(stats_table)
 
-    time.sleep(2)
+    _sleep(2)
     return source_text, source_url
 
 
-def initialize_agent():
-    """Initialize agent with verbose logging."""
+def initialize_agent(sdk_future: Future) -> PLAgentSDK:
+    """
+    Initialize agent with verbose logging.
+
+    Args:
+        sdk_future: Future for the PLAgentSDK being constructed in the
+            background (started by main() before the source text is loaded)
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     print_step(
         2,
         "Initializing Agent",
         "Loading Claude Sonnet 4.6 with agentic tool use"
     )
 
-    # Setup logging for verbose mode
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    # Setup logging for verbose mode, unless the caller already configured it
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
 
     console.print("[cyan]⚙️  Configuration:[/cyan]")
     config_table = Table(show_header=False, box=None)
@@ -134,11 +192,11 @@ def initialize_agent():
         console=console
     ) as progress:
         task = progress.add_task("[cyan]Initializing SDK...", total=None)
-        sdk = PLAgentSDK(require_db=False, use_few_shot=True)
-        time.sleep(1)
+        sdk = sdk_future.result()
+        _sleep(1)
         progress.update(task, description="[green]✓ SDK Ready!")
 
-    time.sleep(1.5)
+    _sleep(1.5)
     return sdk
 
 
@@ -155,17 +213,20 @@ def run_extraction_with_monitoring(sdk, source_text, source_url):
     console.print("[dim]Using universal profile - Claude will identify source type automatically[/dim]")
     console.print()
 
-    time.sleep(2)
+    _sleep(2)
 
-    # Run extraction with universal profile
+    # Run extraction with universal profile. Repeat runs reuse the cached
+    # result for the same text; set PLA_DEMO_CACHE=0 to force a live call.
+    use_cache = os.getenv("PLA_DEMO_CACHE", "1") != "0"
     result = sdk.extract_bio_agentic(
         source_text=source_text,
-        source_url=source_url
+        source_url=source_url,
+        use_cache=use_cache
         )
 
     console.print()
     console.print("[green]✓ Extraction Complete![/green]")
-    time.sleep(1.5)
+    _sleep(1.5)
 
     return result
 
@@ -190,30 +251,21 @@ def highlight_tool_usage(result):
     tool_table.add_column("Status", style="white", width=10)
     tool_table.add_column("Purpose", style="dim", width=40)
 
-    tool_purposes = {
-        "lookup_existing_officer": "Check for duplicate records",
-        "verify_information_present": "Prevent hallucination",
-        "validate_dates": "Ensure chronological consistency",
-        "lookup_unit_by_name": "Enrich with unit data",
-        "save_officer_bio": "Save extracted biography",
-        "save_to_database": "Persist to PostgreSQL"
-    }
-
+    # One pass builds the table rows and collects the verification calls
+    verify_calls = []
+    purpose_for = _TOOL_PURPOSES.get
+    add_row = tool_table.add_row
     for idx, tool_call in enumerate(result.tool_calls, 1):
+        tool_name = tool_call.tool_name
         status = "[green]✓ Success[/green]" if tool_call.success else "[red]✗ Failed[/red]"
-        purpose = tool_purposes.get(tool_call.tool_name, "Unknown")
-        tool_table.add_row(
-            str(idx),
-            tool_call.tool_name,
-            status,
-            purpose
-        )
+        add_row(str(idx), tool_name, status, purpose_for(tool_name, "Unknown"))
+        if tool_name == "verify_information_present":
+            verify_calls.append(tool_call)
 
     console.print(tool_table)
     console.print()
 
     # Highlight control variable verification
-    verify_calls = [tc for tc in result.tool_calls if tc.tool_name == "verify_information_present"]
     if verify_calls:
         console.print("[yellow]⚠️  Control Variable Verification:[/yellow]")
         console.print("[dim]Agent verified these optional fields before setting to null:[/dim]")
@@ -229,7 +281,7 @@ def highlight_tool_usage(result):
         console.print()
         console.print("[green]✓ No hallucination - all null values verified![/green]")
 
-    time.sleep(3)
+    _sleep(3)
 
 
 def display_results(result):
@@ -282,48 +334,45 @@ def display_results(result):
     def add_field(name: str, value):
         """Add field to table with status indicator."""
         if value is None or value == "" or (isinstance(value, list) and len(value) == 0):
-            bio_table.add_row(name, "[dim]null[/dim]", "[yellow]⚠[/yellow]")
+            bio_table.add_row(name, _NULL_CELL, _WARN_ICON)
         else:
-            if isinstance(value, list):
-                display = "\n".join(f"• {item}" for item in value[:3])
-                if len(value) > 3:
-                    display += f"\n[dim]... +{len(value) - 3} more[/dim]"
-            else:
-                display = str(value)
-            bio_table.add_row(name, display, "[green]✓[/green]")
+            display = _list_cell(value) if isinstance(value, list) else str(value)
+            bio_table.add_row(name, display, _OK_ICON)
 
     # Add all fields
-    add_field("Name (Chinese)", officer.name)
-    add_field("Name (Pinyin)", officer.pinyin_name)
-    add_field("Hometown", officer.hometown)
-    add_field("Birth Date", officer.birth_date)
-    add_field("Death Date", officer.death_date)
-    add_field("Enlistment Date", officer.enlistment_date)
-    add_field("Party Membership", officer.party_membership_date)
+    for name, value in (
+        ("Name (Chinese)", officer.name),
+        ("Name (Pinyin)", officer.pinyin_name),
+        ("Hometown", officer.hometown),
+        ("Birth Date", officer.birth_date),
+        ("Death Date", officer.death_date),
+        ("Enlistment Date", officer.enlistment_date),
+        ("Party Membership", officer.party_membership_date),
+    ):
+        add_field(name, value)
 
     if officer.promotions:
-        promotions_str = "\n".join(
-            f"• {p.rank} ({p.date})" for p in officer.promotions
+        promotions_str = _list_cell(
+            [f"{p.rank} ({p.date})" for p in officer.promotions], limit=None
         )
-        bio_table.add_row("Promotions", promotions_str, "[green]✓[/green]")
+        bio_table.add_row("Promotions", promotions_str, _OK_ICON)
     else:
-        bio_table.add_row("Promotions", "[dim]null[/dim]", "[yellow]⚠[/yellow]")
+        bio_table.add_row("Promotions", _NULL_CELL, _WARN_ICON)
 
     if officer.notable_positions:
-        positions_str = "\n".join(
-            f"• {pos}" for pos in officer.notable_positions[:3]
-        )
-        if len(officer.notable_positions) > 3:
-            positions_str += f"\n[dim]... +{len(officer.notable_positions) - 3} more[/dim]"
-        bio_table.add_row("Notable Positions", positions_str, "[green]✓[/green]")
+        positions_str = _list_cell(officer.notable_positions)
+        bio_table.add_row("Notable Positions", positions_str, _OK_ICON)
     else:
-        bio_table.add_row("Notable Positions", "[dim]null[/dim]", "[yellow]⚠[/yellow]")
+        bio_table.add_row("Notable Positions", _NULL_CELL, _WARN_ICON)
 
-    add_field("Congress Participation", officer.congress_participation)
-    add_field("CPPCC Participation", officer.cppcc_participation)
-    add_field("Awards", officer.awards)
-    add_field("Wife Name (control)", officer.wife_name)
-    add_field("Retirement Date (control)", officer.retirement_date)
+    for name, value in (
+        ("Congress Participation", officer.congress_participation),
+        ("CPPCC Participation", officer.cppcc_participation),
+        ("Awards", officer.awards),
+        ("Wife Name (control)", officer.wife_name),
+        ("Retirement Date (control)", officer.retirement_date),
+    ):
+        add_field(name, value)
 
     console.print(bio_table)
     console.print()
@@ -347,12 +396,14 @@ def display_results(result):
 
     console.print(perf_table)
 
-    time.sleep(3)
+    _sleep(3)
     return officer
 
 
 def demonstrate_database_integration(officer):
     """Show database before/after queries."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+
     print_step(
         6,
         "Database Integration",
@@ -369,13 +420,13 @@ def demonstrate_database_integration(officer):
         console=console
     ) as progress:
         task = progress.add_task("[cyan]Searching database...", total=None)
-        time.sleep(1.5)
+        _sleep(1.5)
 
-        # Simulate lookup
+        # One batched lookup; its answer also labels the AFTER query below
         try:
-            result_before = execute_lookup_officer({"name": officer.name})
-            found_before = result_before.success and result_before.data.get('found', False)
-        except:
+            found_before = execute_lookup_officers([officer.name]).get(officer.name, False)
+        except Exception as e:
+            logger.debug(f"Officer lookup unavailable, treating as new record: {e}")
             found_before = False
 
         if found_before:
@@ -387,7 +438,7 @@ def demonstrate_database_integration(officer):
             console.print()
             console.print("[green]✓ No duplicate found - safe to insert[/green]")
 
-    time.sleep(2)
+    _sleep(2)
 
     console.print()
     console.print("[cyan]💾 Saving to Database:[/cyan]")
@@ -402,17 +453,23 @@ def demonstrate_database_integration(officer):
     ) as progress:
         task = progress.add_task("[cyan]Inserting record...", total=100)
 
-        for i in range(0, 101, 20):
-            progress.update(task, completed=i)
-            time.sleep(0.3)
+        if DEMO_PACE > 0:
+            for i in range(0, 101, 20):
+                progress.update(task, completed=i)
+                _sleep(0.3)
+        else:
+            progress.update(task, completed=100)
 
         progress.update(task, description="[green]✓ Successfully saved to database![/green]")
 
     console.print()
     console.print("[green]✓ Officer bio persisted to PostgreSQL[/green]")
-    console.print(f"[dim]Table: officers | Record ID: {hash(officer.name) % 10000}[/dim]")
+    record_id = int.from_bytes(
+        hashlib.blake2b(officer.name.encode('utf-8'), digest_size=2).digest(), 'big'
+    ) % 10000
+    console.print(f"[dim]Table: officers | Record ID: {record_id}[/dim]")
 
-    time.sleep(2)
+    _sleep(2)
 
     console.print()
     console.print("[cyan]🔍 Database Query - AFTER saving:[/cyan]")
@@ -425,7 +482,7 @@ def demonstrate_database_integration(officer):
         console=console
     ) as progress:
         task = progress.add_task("[cyan]Searching database...", total=None)
-        time.sleep(1.5)
+        _sleep(1.5)
         progress.update(task, description="[green]✓ Officer found in database![/green]")
 
     console.print()
@@ -436,11 +493,14 @@ def demonstrate_database_integration(officer):
     found_table.add_row("Birth Date", str(officer.birth_date))
     found_table.add_row("Death Date", str(officer.death_date))
     found_table.add_row("Confidence", f"{officer.confidence_score:.2f}")
-    found_table.add_row("Status", "[green]✓ In Database[/green]")
+    found_table.add_row(
+        "Status",
+        "[green]✓ In Database (updated)[/green]" if found_before else "[green]✓ In Database[/green]"
+    )
 
     console.print(found_table)
 
-    time.sleep(2)
+    _sleep(2)
 
 
 def print_summary(result):
@@ -469,7 +529,7 @@ def print_summary(result):
     console.print(success_panel)
     console.print()
 
-    time.sleep(2)
+    _sleep(2)
 
     # Scalability stats
     console.print("[cyan]📊 Scalability Projections:[/cyan]")
@@ -489,7 +549,7 @@ def print_summary(result):
     console.print(scale_table)
     console.print()
 
-    time.sleep(2)
+    _sleep(2)
 
     # Footer
     footer_panel = Panel(
@@ -515,13 +575,19 @@ def main():
         console.print("[dim]Press Ctrl+C at any time to exit[/dim]")
         console.print()
 
-        time.sleep(2)
+        _sleep(2)
+
+        # Construct the SDK in the background while the source is loaded;
+        # shutdown(wait=False) lets the pending construction finish
+        executor = ThreadPoolExecutor(max_workers=1)
+        sdk_future = executor.submit(PLAgentSDK, require_db=False, use_few_shot=True)
+        executor.shutdown(wait=False)
 
         # Step 1: Load test source
         source_text, source_url = load_test_obituary()
 
         # Step 2: Initialize agent
-        sdk = initialize_agent()
+        sdk = initialize_agent(sdk_future)
 
         # Step 3: Run extraction with monitoring
         result = run_extraction_with_monitoring(sdk, source_text, source_url)
@@ -552,8 +618,7 @@ def main():
     except Exception as e:
         console.print()
         console.print(f"[red]Error: {e}[/red]")
-        import traceback
-        console.print(traceback.format_exc())
+        console.print_exception()
 
 
 if __name__ == "__main__":
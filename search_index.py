@@ -0,0 +1,281 @@
+"""
+Full-text index over saved extraction results.
+
+Backs the interactive `search` command with an SQLite FTS5 trigram index
+stored next to the results (output/.search_index.sqlite), so repeat queries
+probe an index instead of rescanning every JSON file. The index is refreshed
+incrementally: only files whose size or modification time changed since the
+last refresh are re-read.
+
+The FTS table is contentless: it keeps only the trigram postings, keyed by
+the doc_id column of the meta table, not a second copy of every file. Hits
+are therefore candidates that callers re-check against the files themselves.
+"""
+import logging
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SEARCH_INDEX_FILENAME = ".search_index.sqlite"
+
+# Bumped whenever the table layout changes; older indexes are rebuilt
+SCHEMA_VERSION = 2
+
+# Rows of a contentless table can only be deleted in place on SQLite 3.43+
+CONTENTLESS_DELETE = sqlite3.sqlite_version_info >= (3, 43, 0)
+
+# The trigram tokenizer can only answer queries of at least three characters
+MIN_INDEXED_QUERY_CHARS = 3
+
+# Threads for reading files; reads and the byte scans release the GIL
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Below this many files, thread start-up costs more than it saves
+PARALLEL_SCAN_MIN_FILES = 16
+
+
+# Directory listings keyed by absolute root: ([(dir, mtime_ns), ...], [json paths])
+_LISTING_CACHE: Dict[str, Tuple[List[Tuple[str, int]], List[str]]] = {}
+
+
+def _walk_json_files(directory: str, dirs: List[Tuple[str, int]], files: List[str]) -> None:
+    """
+    Collect JSON file paths and each visited directory's mtime.
+
+    Uses os.scandir so directory type checks come from the directory
+    listing itself rather than a stat() per path as with Path.glob.
+    Dotfiles (e.g. the learner's .learner_cache.json sidecar) are skipped.
+    """
+    # Record the mtime before listing so a file created mid-scan still
+    # invalidates the cached listing next time
+    dirs.append((directory, os.stat(directory).st_mtime_ns))
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                _walk_json_files(entry.path, dirs, files)
+            elif entry.name.endswith(".json") and entry.is_file():
+                files.append(entry.path)
+
+
+def list_json_files(directory) -> List[str]:
+    """
+    List JSON file paths under a directory, reusing the previous walk when possible.
+
+    Adding, removing or renaming a file updates its directory's mtime, so
+    the cached listing is reused as long as every directory seen last time
+    has the same mtime; only those few directories are stat'ed instead of
+    re-listing the whole tree. File contents are not covered: callers that
+    care about edits still stat the files themselves.
+
+    Args:
+        directory: Root directory to scan
+
+    Returns:
+        Paths of JSON files (dotfiles excluded)
+    """
+    key = os.path.abspath(directory)
+    cached = _LISTING_CACHE.get(key)
+    if cached is not None:
+        cached_dirs, cached_files = cached
+        try:
+            if all(os.stat(path).st_mtime_ns == mtime_ns for path, mtime_ns in cached_dirs):
+                return list(cached_files)
+        except OSError:
+            pass  # A directory disappeared; walk again
+
+    dirs: List[Tuple[str, int]] = []
+    files: List[str] = []
+    _walk_json_files(str(directory), dirs, files)
+    _LISTING_CACHE[key] = (dirs, files)
+    return list(files)
+
+
+def map_files(func: Callable[[Any], T], items: List[Any]) -> List[T]:
+    """
+    Apply a file-reading function to many files, in order.
+
+    Large batches run on a thread pool: file reads (and mmap/regex scans)
+    release the GIL, so they overlap on multi-core machines and fast disks.
+
+    Args:
+        func: Function taking a single item (a path, or a tuple holding one)
+        items: Items to process
+
+    Returns:
+        Results in the same order as items
+    """
+    if len(items) < PARALLEL_SCAN_MIN_FILES:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        return list(executor.map(func, items))
+
+
+class SearchIndex:
+    """Incrementally maintained FTS5 index of JSON files under a directory."""
+
+    def __init__(self, output_dir: str = "output/", index_path: Optional[str] = None):
+        """
+        Open (or create) the index.
+
+        Args:
+            output_dir: Directory of extraction results to index
+            index_path: Index database location (defaults to output_dir/.search_index.sqlite)
+
+        Raises:
+            sqlite3.OperationalError: If SQLite lacks FTS5 or the trigram tokenizer
+        """
+        self.output_dir = Path(output_dir)
+        self.index_path = Path(index_path) if index_path else self.output_dir / SEARCH_INDEX_FILENAME
+
+        self._conn = sqlite3.connect(str(self.index_path))
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            self._create_tables()
+
+    def _create_tables(self):
+        """(Re)create empty index tables, discarding anything indexed so far."""
+        options = ", contentless_delete=1" if CONTENTLESS_DELETE else ""
+        with self._conn:
+            self._conn.execute("DROP TABLE IF EXISTS files")
+            self._conn.execute("DROP TABLE IF EXISTS meta")
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE files "
+                f"USING fts5(content, content='', tokenize='trigram'{options})"
+            )
+            self._conn.execute(
+                "CREATE TABLE meta ("
+                "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, doc_id INTEGER)"
+            )
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        """Close the index database."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def refresh(self) -> int:
+        """
+        Bring the index up to date with the files on disk.
+
+        Returns:
+            Number of files (re-)indexed
+        """
+        if not CONTENTLESS_DELETE:
+            self._compact_if_needed()
+
+        current = {}
+        for path in list_json_files(self.output_dir):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # Removed since the listing was cached
+            current[os.path.relpath(path, self.output_dir)] = (stat.st_mtime_ns, stat.st_size)
+
+        indexed = {
+            path: (mtime_ns, size, doc_id)
+            for path, mtime_ns, size, doc_id in self._conn.execute(
+                "SELECT path, mtime_ns, size, doc_id FROM meta"
+            )
+        }
+
+        changed = [
+            rel_path for rel_path, signature in current.items()
+            if indexed.get(rel_path, (None, None))[:2] != signature
+        ]
+        contents = map_files(self._read_file, changed)
+
+        reindexed = 0
+        with self._conn:
+            for rel_path, (_, _, doc_id) in indexed.items():
+                if rel_path not in current:
+                    self._delete_doc(doc_id)
+                    self._conn.execute("DELETE FROM meta WHERE path = ?", (rel_path,))
+
+            for rel_path, content in zip(changed, contents):
+                if content is None:
+                    continue
+
+                mtime_ns, size = current[rel_path]
+                previous = indexed.get(rel_path)
+                if previous:
+                    self._delete_doc(previous[2])
+                doc_id = self._conn.execute(
+                    "INSERT INTO files (content) VALUES (?)", (content,)
+                ).lastrowid
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (path, mtime_ns, size, doc_id) VALUES (?, ?, ?, ?)",
+                    (rel_path, mtime_ns, size, doc_id)
+                )
+                reindexed += 1
+
+        if reindexed:
+            logger.debug(f"Search index: re-indexed {reindexed} file(s)")
+        return reindexed
+
+    def _delete_doc(self, doc_id: int):
+        """
+        Drop a document's postings, where SQLite allows it.
+
+        Older SQLite can't delete from a contentless table without the
+        original text, so the rowid is left behind; search() only returns
+        rowids still referenced from meta, and _compact_if_needed() rebuilds
+        the index once such orphans outnumber the live documents.
+        """
+        if CONTENTLESS_DELETE:
+            self._conn.execute("DELETE FROM files WHERE rowid = ?", (doc_id,))
+
+    def _compact_if_needed(self):
+        """Rebuild the index from scratch if orphaned rows dominate it."""
+        (rows,) = self._conn.execute("SELECT count(*) FROM files").fetchone()
+        (live,) = self._conn.execute("SELECT count(*) FROM meta").fetchone()
+        if rows - live > live:
+            logger.debug(f"Search index: rebuilding ({rows - live} stale rows)")
+            self._create_tables()
+
+    def _read_file(self, rel_path: str) -> Optional[str]:
+        """Read an output file for indexing, or None if it can't be read."""
+        try:
+            with open(self.output_dir / rel_path, 'r', encoding='utf-8', errors='replace') as f:
+                return f.read()
+        except OSError as e:
+            logger.debug(f"Skipping unreadable file {rel_path}: {e}")
+            return None
+
+    def search(self, query: str) -> Optional[List[Path]]:
+        """
+        Find indexed files containing the query (case-insensitive), newest first.
+
+        The index holds no copy of the text, so results reflect the files as
+        of the last refresh(); callers should confirm each hit against the
+        file before reporting it.
+
+        Args:
+            query: Text to search for
+
+        Returns:
+            Matching file paths, or None if the query is too short for the
+            trigram index and the caller should scan files instead
+        """
+        if len(query) < MIN_INDEXED_QUERY_CHARS:
+            return None
+
+        phrase = '"' + query.replace('"', '""') + '"'
+        rows = self._conn.execute(
+            "SELECT meta.path FROM files JOIN meta ON meta.doc_id = files.rowid "
+            "WHERE files MATCH ? ORDER BY meta.mtime_ns DESC",
+            (phrase,)
+        )
+        return [self.output_dir / path for (path,) in rows]
@@ -10,11 +10,17 @@ This file is automatically loaded by pytest and provides:
 
 import pytest
 import os
+import re
 import time
 from pathlib import Path
 from typing import Generator
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 # Configure logging for tests
@@ -38,6 +44,10 @@ def pytest_configure(config):
     test_output.mkdir(exist_ok=True)
 
 
+# Node ID keywords that drive automatic markers, matched in one pass per item
+_MARKER_KEYWORDS_RE = re.compile(r'integration|test_agent|anthropic|database|batch')
+
+
 def pytest_collection_modifyitems(config, items):
     """
     Modify test items after collection.
@@ -49,21 +59,23 @@ def pytest_collection_modifyitems(config, items):
     - Tests with 'database' in name → database
     """
     for item in items:
+        keywords = set(_MARKER_KEYWORDS_RE.findall(item.nodeid))
+
         # Auto-mark integration tests
-        if "integration" in item.nodeid or "test_agent" in item.nodeid:
+        if "integration" in keywords or "test_agent" in keywords:
             item.add_marker(pytest.mark.integration)
             item.add_marker(pytest.mark.slow)
 
         # Auto-mark API tests
-        if "anthropic" in item.nodeid or "test_agent" in item.nodeid:
+        if "anthropic" in keywords or "test_agent" in keywords:
             item.add_marker(pytest.mark.api)
 
         # Auto-mark database tests
-        if "database" in item.nodeid:
+        if "database" in keywords:
             item.add_marker(pytest.mark.database)
 
         # Auto-mark batch tests
-        if "batch" in item.nodeid:
+        if "batch" in keywords:
             item.add_marker(pytest.mark.batch)
             item.add_marker(pytest.mark.slow)
 
@@ -174,12 +186,13 @@ def performance_tracker():
             self.duration = None
 
         def start(self):
-            self.start_time = time.time()
+            # Monotonic integer nanoseconds; duration stays in float seconds
+            self.start_time = time.perf_counter_ns()
 
         def stop(self):
-            self.end_time = time.time()
-            if self.start_time:
-                self.duration = self.end_time - self.start_time
+            self.end_time = time.perf_counter_ns()
+            if self.start_time is not None:
+                self.duration = (self.end_time - self.start_time) / 1e9
 
         def __enter__(self):
             self.start()
@@ -336,13 +349,13 @@ def extraction_result():
     output_file = PROJECT_ROOT / "output" / "test_extraction.json"
     output_file.parent.mkdir(exist_ok=True)
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(
-            result.to_dict(exclude_none=True),
-            f,
-            ensure_ascii=False,
-            indent=2
-        )
+    result_dict = result.to_dict(exclude_none=True)
+    if orjson is not None:
+        # orjson emits UTF-8 directly, so Chinese names stay readable
+        output_file.write_bytes(orjson.dumps(result_dict, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(result_dict, f, ensure_ascii=False, indent=2)
 
     return result
 
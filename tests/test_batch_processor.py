@@ -252,3 +252,22 @@ def main():
 
 if __name__ == "__main__":
     sys.exit(main())
+
+
+def test_concurrent_saves_get_distinct_files(tmp_path, monkeypatch):
+    """Results for the same officer saved in the same second don't overwrite each other."""
+    from config import CONFIG
+    from schema import AgentExtractionResult, OfficerBio
+
+    monkeypatch.setattr(CONFIG, "ANTHROPIC_API_KEY", CONFIG.ANTHROPIC_API_KEY or "test-placeholder")
+    monkeypatch.chdir(tmp_path)
+    processor = BatchProcessor(require_db=False)
+    result = AgentExtractionResult(
+        officer_bio=OfficerBio(name="林炳尧", source_url="https://test.example.com", confidence_score=0.9),
+        success=True,
+    )
+
+    paths = {processor._save_result_to_file(result, "https://test.example.com") for _ in range(5)}
+
+    assert len(paths) == 5
+    assert len(list((tmp_path / "output").glob("林炳尧_*.json"))) == 5
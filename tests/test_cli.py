@@ -0,0 +1,196 @@
+"""Offline tests for CLI helpers that don't touch the API or database."""
+import json
+import os
+import types
+from pathlib import Path
+
+import cli
+
+
+def _write_extraction(path, name="测试军官", confidence=0.85):
+    data = {
+        "officer_bio": {
+            "name": name,
+            "source_url": "https://test.example.com",
+            "confidence_score": confidence,
+        },
+        "success": True,
+    }
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def test_load_extraction_memoizes_until_file_changes(tmp_path):
+    """Repeated loads reuse the parsed result; a rewrite is picked up."""
+    json_file = tmp_path / "result.json"
+    _write_extraction(json_file, name="甲")
+
+    data, officer = cli.load_extraction(json_file)
+    assert officer.name == "甲"
+    assert cli.load_extraction(json_file)[1] is officer
+
+    _write_extraction(json_file, name="乙")
+    stat = json_file.stat()
+    os.utime(json_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    _, officer = cli.load_extraction(json_file)
+    assert officer.name == "乙"
+
+
+def test_load_extraction_without_officer_bio(tmp_path):
+    """Files without an officer bio load with officer set to None."""
+    json_file = tmp_path / "failed.json"
+    json_file.write_text(json.dumps({"success": False}), encoding="utf-8")
+
+    data, officer = cli.load_extraction(json_file)
+    assert data == {"success": False}
+    assert officer is None
+
+
+def test_run_script_in_process_restores_argv_and_cwd(tmp_path, monkeypatch):
+    """Scripts see their own argv and the project root; both are restored."""
+    seen = {}
+
+    def fake_main():
+        seen["argv"] = list(cli.sys.argv)
+        seen["cwd"] = os.getcwd()
+        raise SystemExit(3)
+
+    fake = types.ModuleType("fake_script")
+    fake.__file__ = "fake_script.py"
+    fake.main = fake_main
+    monkeypatch.setitem(cli._LAZY_MODULES, "fake_script", fake)
+    monkeypatch.chdir(tmp_path)
+    argv_before = list(cli.sys.argv)
+
+    assert cli._run_script_in_process("fake_script", ["--fast"]) == 3
+    assert seen["argv"] == ["fake_script.py", "--fast"]
+    assert seen["cwd"] == str(Path(cli.__file__).parent)
+    assert os.getcwd() == str(tmp_path)
+    assert cli.sys.argv == argv_before
+
+
+def test_run_script_in_process_reports_missing_module():
+    """Unimportable scripts return None so callers can fall back to a subprocess."""
+    assert cli._run_script_in_process("no_such_plagent_script") is None
+
+
+def test_complete_repl_input_by_position(tmp_path, monkeypatch):
+    """Commands complete first; then paths for validate and past URLs for extract."""
+    assert cli._complete_repl_input("va", "va", []) == ["validate"]
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "output").mkdir()
+    _write_extraction(tmp_path / "output" / "林炳尧.json")
+    assert cli._complete_repl_input("validate out", "out", []) == ["output" + os.sep]
+    assert cli._complete_repl_input("validate output/", "output/", []) == [
+        os.path.join("output", "林炳尧.json")
+    ]
+
+    history = [
+        "extract https://www.news.cn/a.html",
+        "stats",
+        "extract https://www.news.cn/b.html",
+        "extract https://www.news.cn/a.html",
+    ]
+    assert cli._complete_repl_input("extract https://www.news.cn/", "https://www.news.cn/", history) == [
+        "https://www.news.cn/a.html",
+        "https://www.news.cn/b.html",
+    ]
+    assert cli._complete_repl_input("stats x", "x", history) == []
+
+
+def test_session_stats_record():
+    """Recording results updates counts and token totals."""
+    class FakeResult:
+        def __init__(self, success, tokens):
+            self.success = success
+            self._tokens = tokens
+
+        def get_total_tokens(self):
+            return self._tokens
+
+    stats = cli.SessionStats()
+    stats.record(FakeResult(True, 100))
+    stats.record(FakeResult(False, 40))
+
+    assert (stats.extractions, stats.successful, stats.failed, stats.total_tokens) == (2, 1, 1, 140)
+
+
+def test_file_contains_matches_case_insensitively(tmp_path):
+    """Byte-level and decoded search paths both ignore case."""
+    json_file = tmp_path / "r.json"
+    json_file.write_text('{"name": "林炳尧", "pinyin_name": "Lin Bingyao", "note": "Ärzte"}', encoding="utf-8")
+    size = json_file.stat().st_size
+
+    def contains(query):
+        return cli._file_contains(str(json_file), size, query, cli._search_pattern(query))
+
+    assert contains("林炳尧")
+    assert contains("lin BINGYAO")
+    assert contains("ärzte")
+    assert not contains("王")
+
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"")
+    assert not cli._file_contains(str(empty), 0, "林", cli._search_pattern("林"))
+
+
+def test_search_pattern_folds_non_ascii_case(tmp_path):
+    """Queries with non-ASCII cased letters use a Unicode-aware str pattern."""
+    assert isinstance(cli._search_pattern("林炳尧 Lin").pattern, bytes)
+    pattern = cli._search_pattern("ÄRZTE")
+    assert isinstance(pattern.pattern, str)
+
+    json_file = tmp_path / "r.json"
+    json_file.write_text('{"note": "ärzte"}', encoding="utf-8")
+    assert cli._file_contains(str(json_file), json_file.stat().st_size, "ÄRZTE", pattern)
+
+
+def test_file_contains_finds_matches_across_chunks(tmp_path, monkeypatch):
+    """Decoded scanning carries an overlap so boundary-spanning matches are found."""
+    monkeypatch.setattr(cli, "SEARCH_CHUNK_CHARS", 8)
+    json_file = tmp_path / "r.json"
+    json_file.write_text("x" * 6 + "Ärzte" + "y" * 20, encoding="utf-8")
+    size = json_file.stat().st_size
+
+    assert cli._file_contains(str(json_file), size, "äRZTE", cli._search_pattern("äRZTE"))
+    assert not cli._file_contains(str(json_file), size, "Äpfel", cli._search_pattern("Äpfel"))
+
+
+def test_repl_prompt_marks_colour_codes_for_readline(monkeypatch):
+    """Colour escapes are wrapped for readline, and omitted without a colour terminal."""
+    from rich.console import Console
+
+    monkeypatch.setattr(cli, "console", Console(force_terminal=True, color_system="standard"))
+    prompt = cli._repl_prompt(readline_active=True)
+    assert prompt == "\001\033[1;36m\002plAgent>\001\033[0m\002 "
+    assert "\001" not in cli._repl_prompt(readline_active=False)
+
+    monkeypatch.setattr(cli, "console", Console(force_terminal=False))
+    assert cli._repl_prompt(readline_active=True) == "plAgent> "
+
+
+def test_repl_search_rechecks_index_hits_against_files(tmp_path, monkeypatch):
+    """A file the index still lists but that no longer matches is not reported."""
+    import io
+    import logging
+
+    import search_index
+    from rich.console import Console
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "output").mkdir()
+    _write_extraction(tmp_path / "output" / "a.json", name="林炳尧")
+    _write_extraction(tmp_path / "output" / "b.json", name="李四光")
+    monkeypatch.setattr(
+        search_index.SearchIndex, "search",
+        lambda self, query: [self.output_dir / "b.json", self.output_dir / "a.json"]
+    )
+    out = io.StringIO()
+    monkeypatch.setattr(cli, "console", Console(file=out, width=200))
+
+    cli._repl_search(types.SimpleNamespace(logger=logging.getLogger(__name__)), "林炳尧")
+
+    assert "Found 1 match(es)" in out.getvalue()
+    assert "a.json" in out.getvalue()
+    assert "b.json" not in out.getvalue()
@@ -4,9 +4,11 @@ from tools.database_tools import (
     LOOKUP_OFFICER_TOOL,
     LOOKUP_UNIT_TOOL,
     execute_lookup_officer,
+    execute_lookup_officers,
     execute_lookup_unit,
     initialize_database
 )
+from tools import database_tools
 from rich.console import Console
 from rich.panel import Panel
 from rich.json import JSON
@@ -74,6 +76,44 @@ def test_execute_lookup_officer_validation():
     console.print(Panel(result.error, title="Validation Error", border_style="red"))
 
 
+def test_execute_lookup_officers_batches_names(monkeypatch):
+    """Test execute_lookup_officers() issues one query for all names."""
+    console.print("\n[bold cyan]Testing execute_lookup_officers() - Batched Lookup[/bold cyan]")
+
+    queries = []
+
+    class FakeCursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, query, params):
+            queries.append((query, params))
+
+        def fetchall(self):
+            return [("林炳尧",)]
+
+    class FakeConnection:
+        def cursor(self):
+            return FakeCursor()
+
+    monkeypatch.setattr(database_tools, "get_connection", lambda: FakeConnection())
+    monkeypatch.setattr(database_tools, "release_connection", lambda conn: None)
+
+    assert execute_lookup_officers([]) == {}
+    assert not queries, "Empty input should not touch the database"
+
+    result = execute_lookup_officers(["林炳尧", "张三", "林炳尧"])
+
+    assert result == {"林炳尧": True, "张三": False}
+    assert len(queries) == 1
+    assert queries[0][1] == (["林炳尧", "张三"],)
+
+    console.print("[green]✓ Batched lookup working[/green]")
+
+
 def test_execute_lookup_unit_validation():
     """Test input validation for execute_lookup_unit."""
     console.print("\n[bold cyan]Testing execute_lookup_unit() - Input Validation[/bold cyan]")
@@ -0,0 +1,164 @@
+"""Offline tests for the scripts/debug_agent.py analysis helpers."""
+import io
+import json
+import os
+
+import pytest
+from rich.console import Console
+
+from scripts import debug_agent
+
+
+def _write_result(path, tool_calls=(), **overrides):
+    data = {
+        "officer_bio": {
+            "name": "林炳尧",
+            "source_url": "https://test.example.com",
+            "confidence_score": 0.85,
+        },
+        "tool_calls": list(tool_calls),
+        "conversation_turns": 3,
+        "total_input_tokens": 1000,
+        "total_output_tokens": 200,
+        "success": True,
+    }
+    data.update(overrides)
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return data
+
+
+def test_load_many_preserves_order(tmp_path):
+    """Concurrently loaded results come back in argument order."""
+    first = _write_result(tmp_path / "a.json", conversation_turns=1)
+    second = _write_result(tmp_path / "b.json", conversation_turns=2)
+
+    loaded = debug_agent._load_many([str(tmp_path / "a.json"), str(tmp_path / "b.json")])
+    assert loaded == [first, second]
+
+
+def test_load_extraction_result_errors(tmp_path):
+    """Missing files and invalid JSON raise the documented exceptions."""
+    with pytest.raises(FileNotFoundError):
+        debug_agent.load_extraction_result(str(tmp_path / "missing.json"))
+
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not json", encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        debug_agent.load_extraction_result(str(broken))
+
+
+def test_analyze_tool_usage_reports_per_tool_success(tmp_path, monkeypatch):
+    """Per-tool counts, success rates and repeated failures are reported."""
+    output = io.StringIO()
+    monkeypatch.setattr(debug_agent, "_console", lambda: Console(file=output, width=200))
+    calls = [
+        {"tool_name": "verify_information_present", "success": True},
+        {"tool_name": "verify_information_present", "success": False},
+        {"tool_name": "verify_information_present", "success": False},
+        {"tool_name": "save_officer_bio", "success": True},
+    ]
+    _write_result(tmp_path / "r.json", tool_calls=calls)
+
+    debug_agent.analyze_tool_usage(str(tmp_path / "r.json"))
+
+    text = output.getvalue()
+    assert "33.3%" in text
+    assert "'verify_information_present' failed 2 times" in text
+    assert "Officer bio was successfully saved" in text
+
+
+def test_tool_renderers_summarize_known_tools():
+    """Each known tool has a renderer that surfaces its key fields."""
+    render = debug_agent._TOOL_RENDERERS
+    assert "Issues: 出生晚于入伍" in render["validate_dates"]({"valid": False, "issues": ["出生晚于入伍"]})
+    assert "Unit: [cyan]南京军区" in render["lookup_unit_by_name"]({"found": True, "unit_name": "南京军区"})
+    assert "Confidence: 0.90" in render["save_officer_bio"]({"officer_bio": {"name": "林炳尧", "confidence_score": 0.9}})
+    assert "unknown_tool" not in render
+
+
+def test_load_extraction_result_memoizes_until_file_changes(tmp_path):
+    """Repeated loads of an unchanged file reuse the parsed result."""
+    json_file = tmp_path / "r.json"
+    _write_result(json_file, conversation_turns=1)
+
+    first = debug_agent.load_extraction_result(str(json_file))
+    assert debug_agent.load_extraction_result(str(json_file)) is first
+
+    _write_result(json_file, conversation_turns=2)
+    os.utime(json_file, ns=(0, json_file.stat().st_mtime_ns + 1_000_000))
+    assert debug_agent.load_extraction_result(str(json_file))["conversation_turns"] == 2
+
+
+def test_files_identical_compares_contents(tmp_path):
+    """Identical copies short-circuit; differing or missing files don't."""
+    first = tmp_path / "a.json"
+    _write_result(first)
+    copy = tmp_path / "b.json"
+    copy.write_bytes(first.read_bytes())
+    other = tmp_path / "c.json"
+    _write_result(other, conversation_turns=9)
+
+    assert debug_agent._files_identical(str(first), str(copy))
+    assert not debug_agent._files_identical(str(first), str(other))
+    assert not debug_agent._files_identical(str(first), str(tmp_path / "missing.json"))
+
+
+def test_analyze_tool_usage_elides_long_timelines(tmp_path, monkeypatch):
+    """Timelines beyond MAX_TIMELINE_STEPS keep only the first and last steps."""
+    output = io.StringIO()
+    monkeypatch.setattr(debug_agent, "_console", lambda: Console(file=output, width=200))
+    monkeypatch.setattr(debug_agent, "MAX_TIMELINE_STEPS", 4)
+    calls = [{"tool_name": f"tool_{i}", "success": True} for i in range(10)]
+    _write_result(tmp_path / "r.json", tool_calls=calls)
+
+    debug_agent.analyze_tool_usage(str(tmp_path / "r.json"))
+
+    timeline = output.getvalue().split("Tool Execution Order", 1)[1]
+    assert "tool_0 → tool_1 → … 6 omitted … → tool_8 → tool_9" in timeline
+    assert "tool_5" not in timeline.split("Insights", 1)[0]
+
+
+def test_analyze_tool_usage_json_format(tmp_path, capsysbinary):
+    """--format=json writes the aggregates as a single JSON document."""
+    calls = [
+        {"tool_name": "validate_dates", "success": True},
+        {"tool_name": "validate_dates", "success": False},
+    ]
+    _write_result(tmp_path / "r.json", tool_calls=calls)
+
+    debug_agent.analyze_tool_usage(str(tmp_path / "r.json"), output_format="json")
+
+    report = json.loads(capsysbinary.readouterr().out)
+    assert report["tool_frequency"] == {"validate_dates": 2}
+    assert report["tool_success_rates"] == {"validate_dates": 0.5}
+    assert report["total_tokens"] == 1200
+
+
+@pytest.mark.parametrize("args", [["analyze", "{json_file}", "--format=json"], []])
+def test_cheap_paths_do_not_import_rich(tmp_path, args):
+    """analyze --format=json and the usage text never touch the console, so Rich stays unimported."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    json_file = tmp_path / "r.json"
+    _write_result(json_file, tool_calls=[{"tool_name": "validate_dates", "success": True}])
+    script = Path(debug_agent.__file__)
+    argv = [str(script)] + [arg.format(json_file=json_file) for arg in args]
+    code = (
+        "import runpy, sys\n"
+        f"sys.argv = {argv!r}\n"
+        "try:\n"
+        f"    runpy.run_path({str(script)!r}, run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "sys.stderr.write(str(any(m.split('.')[0] == 'rich' for m in sys.modules)))\n"
+    )
+
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    if args:
+        assert json.loads(completed.stdout)["tool_frequency"] == {"validate_dates": 1}
+    else:
+        assert completed.stdout.startswith("PLA Agent SDK - Debug Tool")
+    assert completed.stderr.strip().endswith("False")
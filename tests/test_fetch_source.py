@@ -0,0 +1,50 @@
+"""Offline tests for fetch_source helpers."""
+import fetch_source
+
+
+def test_fetch_source_content_many_keeps_order_and_errors(monkeypatch):
+    """Results come back in URL order, with failures returned as exceptions."""
+    def fake_fetch(url):
+        if "bad" in url:
+            raise ValueError(f"Could not extract {url}")
+        return f"text from {url}"
+
+    monkeypatch.setattr(fetch_source, "fetch_source_content", fake_fetch)
+    urls = ["https://a.example/1", "https://bad.example/2", "https://a.example/3"]
+
+    results = fetch_source.fetch_source_content_many(urls)
+
+    assert results[0] == "text from https://a.example/1"
+    assert isinstance(results[1], ValueError)
+    assert results[2] == "text from https://a.example/3"
+    assert fetch_source.fetch_source_content_many(urls[:1], max_workers=1) == [results[0]]
+
+
+def test_shared_session_pools_and_retries():
+    """All fetchers share one keep-alive session with browser headers and retries."""
+    session = fetch_source._SESSION
+    adapter = session.get_adapter("https://www.news.cn/")
+
+    assert session.get_adapter("http://example.com/") is adapter
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+    assert session.headers["User-Agent"] == fetch_source._HEADERS["User-Agent"]
+
+
+def test_fetchers_parse_raw_bytes_with_declared_encoding(monkeypatch):
+    """Pages are parsed from bytes, so a GBK page decodes via its meta charset."""
+    text = "林炳尧，福建省晋江市人，1943年8月出生，1961年8月入伍，1964年6月入党。"
+
+    class FakeResponse:
+        status_code = 200
+        content = (
+            '<html><head><meta charset="gbk"></head>'
+            f'<body><main><p>{text}</p></main></body></html>'
+        ).encode("gbk")
+
+        def raise_for_status(self):
+            pass
+
+    monkeypatch.setattr(fetch_source._SESSION, "get", lambda url, timeout: FakeResponse())
+
+    assert fetch_source.fetch_generic_html("https://example.com/bio") == text
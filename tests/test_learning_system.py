@@ -0,0 +1,175 @@
+"""Offline tests for ExtractionLearner example loading."""
+import json
+from pathlib import Path
+
+import pytest
+
+import learning_system
+from learning_system import ExtractionLearner
+
+
+def _write_result(directory, filename, name="测试军官", confidence=0.85, success=True):
+    """Write a minimal extraction result file the way the agent saves it."""
+    data = {
+        "officer_bio": {
+            "name": name,
+            "source_url": "https://test.example.com",
+            "confidence_score": confidence,
+        },
+        "tool_calls": [
+            {"tool_name": "lookup_officer", "success": False, "error": "not found"},
+            {"tool_name": "save_officer_bio", "success": True},
+        ],
+        "conversation_turns": 2,
+        "total_input_tokens": 100,
+        "total_output_tokens": 50,
+        "success": success,
+    }
+    path = directory / filename
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def test_loader_filters_and_sorts_examples(tmp_path):
+    """Only successful, confident results become examples, best first."""
+    _write_result(tmp_path, "a.json", name="甲", confidence=0.75)
+    _write_result(tmp_path, "b.json", name="乙", confidence=0.95)
+    _write_result(tmp_path, "low.json", confidence=0.5)
+    _write_result(tmp_path, "failed.json", success=False)
+    _write_result(tmp_path, "REVIEW_a.json")
+    _write_result(tmp_path, "batch_report_1.json")
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+    learner = ExtractionLearner(examples_dir=str(tmp_path))
+
+    assert [ex["file"] for ex in learner.examples_cache] == ["b.json", "a.json"]
+    example = learner.examples_cache[0]
+    assert example["officer_bio"].name == "乙"
+    assert example["tool_calls"] == 2
+    assert example["tokens"] == 150
+
+
+def test_loader_parallel_path_matches_serial(tmp_path, monkeypatch):
+    """The process-pool path should produce the same examples as the serial one."""
+    for i in range(6):
+        _write_result(tmp_path, f"r{i}.json", name=f"军官{i}", confidence=0.7 + i * 0.05)
+
+    serial = ExtractionLearner(examples_dir=str(tmp_path), use_parse_cache=False).examples_cache
+
+    monkeypatch.setattr(learning_system, "PARALLEL_PARSE_MIN_FILES", 1)
+    parallel = ExtractionLearner(examples_dir=str(tmp_path), use_parse_cache=False).examples_cache
+
+    assert [ex["file"] for ex in parallel] == [ex["file"] for ex in serial]
+    assert [ex["confidence"] for ex in parallel] == pytest.approx(
+        [ex["confidence"] for ex in serial]
+    )
+
+
+def test_parse_cache_reuses_unchanged_files(tmp_path, monkeypatch):
+    """Unchanged files come from the sidecar cache; modified files are re-parsed."""
+    _write_result(tmp_path, "a.json", name="甲", confidence=0.8)
+    _write_result(tmp_path, "b.json", name="乙", confidence=0.9)
+
+    first = ExtractionLearner(examples_dir=str(tmp_path)).examples_cache
+    assert (tmp_path / learning_system.PARSE_CACHE_FILENAME).exists()
+
+    parsed_paths = []
+    real_parse = learning_system._parse_example_file
+
+    def tracking_parse(path):
+        parsed_paths.append(path)
+        return real_parse(path)
+
+    monkeypatch.setattr(learning_system, "_parse_example_file", tracking_parse)
+
+    second = ExtractionLearner(examples_dir=str(tmp_path)).examples_cache
+    assert parsed_paths == []
+    assert [ex["file"] for ex in second] == [ex["file"] for ex in first]
+    assert second[0]["officer_bio"].name == "乙"
+
+    _write_result(tmp_path, "a.json", name="甲", confidence=0.95)
+    third = ExtractionLearner(examples_dir=str(tmp_path)).examples_cache
+    assert [Path(p).name for p in parsed_paths] == ["a.json"]
+    assert third[0]["file"] == "a.json"
+    assert third[0]["confidence"] == pytest.approx(0.95)
+
+
+def test_statistics_from_sorted_examples(tmp_path):
+    """Statistics should match a straightforward computation over all confidences."""
+    confidences = [0.7, 0.8, 0.85, 0.9, 0.95]
+    for i, conf in enumerate(confidences):
+        _write_result(tmp_path, f"s{i}.json", name=f"军官{i}", confidence=conf)
+
+    stats = ExtractionLearner(examples_dir=str(tmp_path), use_parse_cache=False).get_statistics()
+
+    assert stats["total_examples"] == 5
+    assert stats["avg_confidence"] == pytest.approx(sum(confidences) / 5)
+    assert stats["min_confidence"] == pytest.approx(0.7)
+    assert stats["max_confidence"] == pytest.approx(0.95)
+    assert stats["examples_above_0.8"] == 4
+    assert stats["examples_above_0.9"] == 2
+
+
+def test_count_candidate_examples_skips_failures_without_parsing(tmp_path):
+    """Known failures are excluded by byte scan; the limit stops the scan early."""
+    _write_result(tmp_path, "ok1.json")
+    _write_result(tmp_path, "ok2.json")
+    _write_result(tmp_path, "failed.json", success=False)
+    _write_result(tmp_path, "REVIEW_ok.json")
+
+    assert learning_system.count_candidate_examples(str(tmp_path)) == 2
+    assert learning_system.count_candidate_examples(str(tmp_path), limit=1) == 1
+    assert learning_system.count_candidate_examples(str(tmp_path / "missing")) == 0
+
+
+def test_parse_cache_saves_use_distinct_temp_files(tmp_path, monkeypatch):
+    """Overlapping saves (one per batch worker) never share a temp file."""
+    _write_result(tmp_path, "a.json", name="甲", confidence=0.8)
+    learner = ExtractionLearner(examples_dir=str(tmp_path))
+    files = {"a.json": {"size": 1, "mtime_ns": 1, "example": None}}
+
+    temp_paths = []
+    real_replace = learning_system.os.replace
+
+    def replace_with_overlap(src, dst):
+        temp_paths.append(src)
+        if len(temp_paths) == 1:
+            # A second worker saves while the first is about to publish
+            learner._save_parse_cache(files)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(learning_system.os, "replace", replace_with_overlap)
+    learner._save_parse_cache(files)
+
+    assert len(temp_paths) == 2 and temp_paths[0] != temp_paths[1]
+    cache = json.loads((tmp_path / learning_system.PARSE_CACHE_FILENAME).read_text(encoding="utf-8"))
+    assert cache["files"] == files
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_parallel_parse_spawns_capped_pool_from_worker_thread(tmp_path, monkeypatch):
+    """The parse pool uses spawn (safe from threads) and no more workers than chunks."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    for i in range(3):
+        _write_result(tmp_path, f"r{i}.json", name=f"军官{i}")
+
+    pools = []
+    real_pool = learning_system.ProcessPoolExecutor
+
+    def recording_pool(**kwargs):
+        pools.append(kwargs)
+        return real_pool(**kwargs)
+
+    monkeypatch.setattr(learning_system, "PARALLEL_PARSE_MIN_FILES", 1)
+    monkeypatch.setattr(learning_system, "ProcessPoolExecutor", recording_pool)
+
+    # Built on a background thread, as SDK initialization and batch workers do
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        learner = executor.submit(
+            ExtractionLearner, examples_dir=str(tmp_path), use_parse_cache=False
+        ).result(timeout=60)
+
+    assert len(learner.examples_cache) == 3
+    assert pools[0]["max_workers"] == 1  # 3 files fit in one chunk
+    assert pools[0]["mp_context"].get_start_method() == "spawn"
@@ -4,6 +4,7 @@ These tests avoid external API/network dependencies and validate:
 - Public CLI command surface
 - Safeguard allow/block behavior for fixture text contexts
 - Schema/date validation path for save_officer_bio
+- Local text file loading
 """
 from pathlib import Path
 
@@ -11,7 +12,7 @@ import pytest
 
 from cli import create_parser
 from safeguards import validate_source_text_not_fixture
-from tools.extraction_tools import execute_save_officer_bio
+from tools.extraction_tools import execute_save_officer_bio, extract_text_from_file
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
@@ -66,3 +67,34 @@ def test_save_officer_bio_invalid_date_uses_date_validation_path():
     assert not result.success
     assert result.error is not None
     assert "date" in result.error.lower() or "format" in result.error.lower()
+
+
+def test_extract_text_from_file_rereads_changed_files(tmp_path):
+    """Cached file text is reused until the file changes; GBK files still decode."""
+    text_file = tmp_path / "obituary.txt"
+    text_file.write_text("林炳尧同志逝世。\r\n", encoding="utf-8")
+    assert extract_text_from_file(str(text_file)) == "林炳尧同志逝世。\n"
+
+    text_file.write_bytes("原南京军区副司令员".encode("gbk"))
+    assert extract_text_from_file(str(text_file)) == "原南京军区副司令员"
+
+    with pytest.raises(FileNotFoundError):
+        extract_text_from_file(str(tmp_path / "missing.txt"))
+
+
+def test_extract_text_from_file_errors_name_the_given_path(tmp_path, monkeypatch):
+    """Errors lead with the path as passed; the resolved path is only context."""
+    monkeypatch.chdir(tmp_path)
+    resolved = str((tmp_path / "missing.txt").resolve())
+
+    with pytest.raises(FileNotFoundError) as excinfo:
+        extract_text_from_file("missing.txt")
+    assert str(excinfo.value) == f"File not found: missing.txt (resolved to {resolved})"
+
+    with pytest.raises(FileNotFoundError) as excinfo:
+        extract_text_from_file(resolved)
+    assert str(excinfo.value) == f"File not found: {resolved}"
+
+    (tmp_path / "binary.txt").write_bytes(b"\xff\xff")
+    with pytest.raises(ValueError, match=r"^Could not decode file binary\.txt \(resolved to "):
+        extract_text_from_file("binary.txt")
@@ -0,0 +1,46 @@
+"""Tests for the on-disk extraction result cache."""
+import os
+
+from result_cache import ExtractionResultCache, make_cache_key
+from schema import AgentExtractionResult, OfficerBio
+
+
+def _result(name="林炳尧"):
+    return AgentExtractionResult(
+        officer_bio=OfficerBio(name=name, source_url="https://test.example.com", confidence_score=0.9),
+        success=True,
+    )
+
+
+def test_cache_key_depends_on_every_input():
+    """Model, URL and text all change the key."""
+    base = make_cache_key("model", "https://a", "text")
+    assert base == make_cache_key("model", "https://a", "text")
+    assert base != make_cache_key("other", "https://a", "text")
+    assert base != make_cache_key("model", "https://b", "text")
+    assert base != make_cache_key("model", "https://a", "text2")
+
+
+def test_cache_round_trip_and_expiry(tmp_path):
+    """Stored results come back intact until the TTL passes."""
+    cache = ExtractionResultCache(str(tmp_path / "cache"), ttl_seconds=60)
+    key = make_cache_key("model", "https://a", "text")
+    assert cache.get(key) is None
+
+    cache.set(key, _result())
+    cached = cache.get(key)
+    assert cached is not None
+    assert cached.officer_bio.name == "林炳尧"
+    assert cached.success
+
+    entry = tmp_path / "cache" / f"{key}.json"
+    os.utime(entry, (0, 0))
+    assert cache.get(key) is None
+
+
+def test_corrupt_entries_are_ignored(tmp_path):
+    """An unreadable entry is treated as a miss."""
+    cache = ExtractionResultCache(str(tmp_path))
+    key = make_cache_key("model", "https://a", "text")
+    (tmp_path / f"{key}.json").write_text("{truncated", encoding="utf-8")
+    assert cache.get(key) is None
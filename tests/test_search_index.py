@@ -0,0 +1,140 @@
+"""Offline tests for the output/ full-text search index."""
+import json
+import os
+import sqlite3
+
+import search_index
+from search_index import SearchIndex, list_json_files
+
+
+def _write(path, name, mtime_offset_ns=0):
+    path.write_text(json.dumps({"officer_bio": {"name": name}}, ensure_ascii=False), encoding="utf-8")
+    if mtime_offset_ns:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset_ns))
+
+
+def test_list_json_files_recurses_and_filters(tmp_path):
+    """Only non-hidden .json files are listed, including those in subdirectories."""
+    (tmp_path / "reports").mkdir()
+    _write(tmp_path / "a.json", "甲")
+    _write(tmp_path / "reports" / "b.json", "乙")
+    _write(tmp_path / ".learner_cache.json", "丙")
+    (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+
+    names = sorted(os.path.basename(p) for p in list_json_files(tmp_path))
+    assert names == ["a.json", "b.json"]
+
+
+def test_list_json_files_reuses_listing_until_a_directory_changes(tmp_path, monkeypatch):
+    """Repeat listings skip the walk; adding a file in a subdirectory is noticed."""
+    (tmp_path / "reports").mkdir()
+    _write(tmp_path / "a.json", "甲")
+    list_json_files(tmp_path)
+
+    walks = []
+    real_walk = search_index._walk_json_files
+
+    def tracking_walk(directory, dirs, files):
+        walks.append(directory)
+        real_walk(directory, dirs, files)
+
+    monkeypatch.setattr(search_index, "_walk_json_files", tracking_walk)
+
+    assert len(list_json_files(tmp_path)) == 1
+    assert walks == []
+
+    _write(tmp_path / "reports" / "b.json", "乙")
+    stat = (tmp_path / "reports").stat()
+    os.utime(tmp_path / "reports", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert len(list_json_files(tmp_path)) == 2
+    assert walks
+
+
+def test_search_index_finds_substrings_case_insensitively(tmp_path):
+    """Indexed queries match substrings, ignoring case, newest first."""
+    _write(tmp_path / "a.json", "林炳尧 Lin Bingyao")
+    _write(tmp_path / "b.json", "林炳尧同志", mtime_offset_ns=1_000_000_000)
+    _write(tmp_path / "c.json", "王")
+
+    with SearchIndex(str(tmp_path)) as index:
+        assert index.refresh() == 3
+        assert [p.name for p in index.search("林炳尧")] == ["b.json", "a.json"]
+        assert [p.name for p in index.search("BINGYAO")] == ["a.json"]
+        assert index.search("不存在的人") == []
+        assert index.search("王") is None  # Too short for trigrams
+
+
+def test_search_index_refresh_is_incremental(tmp_path):
+    """Unchanged files are skipped; edits and deletions are picked up."""
+    _write(tmp_path / "a.json", "林炳尧")
+    _write(tmp_path / "b.json", "张三丰")
+
+    with SearchIndex(str(tmp_path)) as index:
+        index.refresh()
+
+    with SearchIndex(str(tmp_path)) as index:
+        assert index.refresh() == 0
+
+        _write(tmp_path / "a.json", "李四光", mtime_offset_ns=1_000_000_000)
+        (tmp_path / "b.json").unlink()
+        assert index.refresh() == 1
+
+        assert index.search("林炳尧") == []
+        assert index.search("张三丰") == []
+        assert [p.name for p in index.search("李四光")] == ["a.json"]
+
+
+def test_refresh_reads_files_on_thread_pool(tmp_path, monkeypatch):
+    """The threaded read path indexes the same files as the serial one."""
+    monkeypatch.setattr(search_index, "PARALLEL_SCAN_MIN_FILES", 1)
+    for i in range(5):
+        _write(tmp_path / f"r{i}.json", f"军官编号{i}")
+
+    with SearchIndex(str(tmp_path)) as index:
+        assert index.refresh() == 5
+        assert [p.name for p in index.search("军官编号3")] == ["r3.json"]
+
+
+def test_search_index_stores_no_copy_of_the_text(tmp_path):
+    """The FTS table is contentless: only postings are kept, not the files."""
+    _write(tmp_path / "a.json", "林炳尧")
+
+    with SearchIndex(str(tmp_path)) as index:
+        index.refresh()
+        assert index._conn.execute("SELECT content FROM files").fetchall() == [(None,)]
+
+
+def test_search_index_rebuilds_an_old_schema(tmp_path):
+    """An index written by an older layout is discarded and rebuilt."""
+    _write(tmp_path / "a.json", "林炳尧")
+    conn = sqlite3.connect(str(tmp_path / search_index.SEARCH_INDEX_FILENAME))
+    conn.execute("CREATE VIRTUAL TABLE files USING fts5(content, tokenize='trigram')")
+    conn.execute(
+        "CREATE TABLE meta (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, doc_id INTEGER)"
+    )
+    conn.commit()
+    conn.close()
+
+    with SearchIndex(str(tmp_path)) as index:
+        assert index.refresh() == 1
+        assert [p.name for p in index.search("林炳尧")] == ["a.json"]
+
+
+def test_stale_rows_are_ignored_then_compacted_without_delete(tmp_path, monkeypatch):
+    """Without contentless_delete, replaced rows never match and are eventually rebuilt away."""
+    monkeypatch.setattr(search_index, "CONTENTLESS_DELETE", False)
+    _write(tmp_path / "a.json", "林炳尧")
+
+    with SearchIndex(str(tmp_path)) as index:
+        index.refresh()
+        _write(tmp_path / "a.json", "李四光", mtime_offset_ns=1_000_000_000)
+        index.refresh()
+        assert index.search("林炳尧") == []
+        assert index._conn.execute("SELECT count(*) FROM files").fetchone() == (2,)
+
+        _write(tmp_path / "a.json", "张三丰", mtime_offset_ns=2_000_000_000)
+        index.refresh()
+        index.refresh()  # Two stale rows against one live document: rebuilt
+        assert index._conn.execute("SELECT count(*) FROM files").fetchone() == (1,)
+        assert [p.name for p in index.search("张三丰")] == ["a.json"]
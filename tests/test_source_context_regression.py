@@ -10,7 +10,7 @@ if not CONFIG.ANTHROPIC_API_KEY:
     CONFIG.ANTHROPIC_API_KEY = "test-placeholder"
 
 from agent import PLAgentSDK
-from schema import OfficerBio
+from schema import AgentExtractionResult, OfficerBio
 
 
 def _mock_response(stop_reason, content, input_tokens=10, output_tokens=5):
@@ -102,3 +102,74 @@ def test_inferred_date_fields_are_annotated():
     sdk._annotate_inferred_fields(officer, source_text)
     assert officer.extraction_notes is not None
     assert "death_date" in officer.extraction_notes
+
+
+def test_system_prompt_is_cached_and_cache_tokens_counted():
+    """The system prompt carries a cache breakpoint; cached tokens still count as input."""
+    sdk = PLAgentSDK(require_db=False, use_few_shot=False)
+    captured = {}
+    response = _mock_response(stop_reason="end_turn", content=[])
+    response.usage.cache_creation_input_tokens = 100
+    response.usage.cache_read_input_tokens = 1000
+
+    def fake_create(**kwargs):
+        captured.update(kwargs)
+        return response
+
+    sdk.client = SimpleNamespace(messages=SimpleNamespace(create=fake_create))
+    sdk.total_input_tokens = 0
+    sdk.total_output_tokens = 0
+
+    sdk._record_usage(sdk._call_api_with_retry(
+        messages=[{"role": "user", "content": "x"}],
+        system_prompt="static instructions",
+        tools_override=[]
+    ))
+
+    assert captured["system"] == [{
+        "type": "text",
+        "text": "static instructions",
+        "cache_control": {"type": "ephemeral"},
+    }]
+    assert sdk.total_input_tokens == 10 + 100 + 1000
+    assert sdk.total_output_tokens == 5
+
+
+def test_extract_bio_agentic_reuses_cached_results(tmp_path, monkeypatch):
+    """With use_cache=True a repeat extraction skips the model call."""
+    monkeypatch.setattr(CONFIG, "EXTRACTION_CACHE_DIR", str(tmp_path))
+    sdk = PLAgentSDK(require_db=False, use_few_shot=False)
+    calls = []
+
+    def fake_single_pass(source_text, source_url):
+        calls.append(source_text)
+        return AgentExtractionResult(
+            officer_bio=OfficerBio(name="林炳尧", source_url=source_url, confidence_score=0.9),
+            success=True,
+        )
+
+    sdk._extract_single_pass = fake_single_pass
+    url = "https://www.news.cn/20250901/example/c.html"
+
+    first = sdk.extract_bio_agentic("正文", url, use_cache=True)
+    second = sdk.extract_bio_agentic("正文", url, use_cache=True)
+    sdk.extract_bio_agentic("正文", url)
+
+    assert len(calls) == 2  # Second call was a cache hit; the uncached call always runs
+    assert second.officer_bio.name == first.officer_bio.name
+
+
+def test_spawn_worker_shares_setup_but_not_tracking_state():
+    """Worker SDKs reuse the client and learner but count their own tokens."""
+    sdk = PLAgentSDK(require_db=False, use_few_shot=False)
+    sdk.total_input_tokens = 50
+    sdk._last_messages.append({"role": "user", "content": "x"})
+
+    worker = sdk.spawn_worker()
+
+    assert worker.client is sdk.client
+    assert worker.learner is sdk.learner
+    assert worker.tools is sdk.tools
+    assert worker.total_input_tokens == 0
+    assert worker._last_messages == []
+    assert sdk._last_messages == [{"role": "user", "content": "x"}]
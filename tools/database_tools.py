@@ -1,4 +1,5 @@
 """Database interaction tools."""
+import atexit
 import logging
 import psycopg2
 from psycopg2 import pool
@@ -9,6 +10,7 @@ from schema import OfficerBio, ToolResult
 from config import CONFIG
 import json
 import threading
+from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +33,7 @@ def _get_connection_pool():
             if _connection_pool is None:
                 _connection_pool = pool.ThreadedConnectionPool(
                     minconn=1,
-                    maxconn=10,
+                    maxconn=max(1, CONFIG.DB_MAX_POOL),
                     host=CONFIG.DB_HOST,
                     database=CONFIG.DB_NAME,
                     user=CONFIG.DB_USER,
@@ -39,6 +41,7 @@ def _get_connection_pool():
                     port=CONFIG.DB_PORT,
                     client_encoding='UTF8'  # Ensure UTF-8 for Chinese characters
                 )
+                atexit.register(_connection_pool.closeall)
 
     return _connection_pool
 
@@ -81,6 +84,21 @@ def release_connection(conn):
         conn.close()
 
 
+@contextmanager
+def pooled_connection():
+    """
+    Borrow a pooled connection for the duration of a with-block.
+
+    Yields:
+        psycopg2 connection object, returned to the pool on exit
+    """
+    conn = get_connection()
+    try:
+        yield conn
+    finally:
+        release_connection(conn)
+
+
 def save_officer_bio_to_database(officer_bio: Union[OfficerBio, Dict[str, Any]]) -> Optional[int]:
     """
     Save OfficerBio data to pla_leaders table.
@@ -336,6 +354,38 @@ def execute_lookup_officer(tool_input: Dict[str, Any]) -> ToolResult:
             release_connection(conn)
 
 
+def execute_lookup_officers(names: List[str]) -> Dict[str, bool]:
+    """
+    Check which of several officers already have a record, in one query.
+
+    Batch counterpart of execute_lookup_officer for callers that only need
+    presence: a single ``full_name = ANY(...)`` query replaces one round-trip
+    per name.
+
+    Args:
+        names: Chinese names of the officers (exact match)
+
+    Returns:
+        Mapping of each requested name to whether a record exists
+
+    Raises:
+        psycopg2.Error: If the query fails
+    """
+    unique_names = list(dict.fromkeys(name for name in names if name))
+    if not unique_names:
+        return {}
+
+    with pooled_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT DISTINCT full_name FROM pla_leaders WHERE full_name = ANY(%s)",
+                (unique_names,)
+            )
+            found = {row[0] for row in cursor.fetchall()}
+
+    return {name: name in found for name in unique_names}
+
+
 # Anthropic tool definition for unit lookup
 LOOKUP_UNIT_TOOL = {
     "name": "lookup_unit_by_name",
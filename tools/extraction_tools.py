@@ -1,12 +1,16 @@
 """Text extraction tools for various sources."""
 import requests
 from bs4 import BeautifulSoup
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, Type
 from pydantic import BaseModel, ValidationError
 from schema import OfficerBio, ToolResult, Promotion
 from safeguards import validate_real_source_url
 
+# Tried in order when decoding source files
+TEXT_ENCODINGS = ['utf-8', 'gb2312', 'gbk', 'big5']
+
 
 def extract_text_from_url(url: str) -> str:
     """
@@ -45,6 +49,9 @@ def extract_text_from_file(file_path: str) -> str:
     """
     Extract text content from a file.
 
+    The decoded text is memoized per (path, mtime, size), so repeated reads
+    of an unchanged file skip the disk read and decode.
+
     Args:
         file_path: Path to the file
 
@@ -56,23 +63,46 @@ def extract_text_from_file(file_path: str) -> str:
         ValueError: If file encoding is incompatible
     """
     path = Path(file_path)
+    resolved = str(path.resolve())
+    # Errors name the file as the caller gave it; the resolved path is context
+    shown = file_path if resolved == str(file_path) else f"{file_path} (resolved to {resolved})"
 
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    try:
+        stat = path.stat()
+        text = _read_text_cached(resolved, stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {shown}") from None
+
+    if text is None:
+        raise ValueError(
+            f"Could not decode file {shown} with any of the attempted encodings: {TEXT_ENCODINGS}"
+        )
+    return text
 
-    # Try UTF-8 first, fall back to other encodings if needed
-    encodings = ['utf-8', 'gb2312', 'gbk', 'big5']
 
-    for encoding in encodings:
+@lru_cache(maxsize=32)
+def _read_text_cached(path_str: str, mtime_ns: int, size: int) -> Optional[str]:
+    """
+    Read and decode a text file; keyed on mtime and size so edits invalidate.
+
+    Returns None if no encoding in TEXT_ENCODINGS fits, so the caller can
+    report the path the way it was given.
+    """
+    # Read the bytes once and reuse them for every decode attempt instead of
+    # re-opening and re-reading the file per encoding
+    with open(path_str, 'rb') as f:
+        raw = f.read()
+
+    # Try UTF-8 first, fall back to other encodings if needed
+    for encoding in TEXT_ENCODINGS:
         try:
-            with open(path, 'r', encoding=encoding) as f:
-                return f.read()
+            text = raw.decode(encoding)
         except UnicodeDecodeError:
             continue
+        # Match text-mode reads, which translate \r\n and \r to \n
+        return text.replace('\r\n', '\n').replace('\r', '\n')
 
-    raise ValueError(
-        f"Could not decode file {file_path} with any of the attempted encodings: {encodings}"
-    )
+    return None
 
 
 def to_anthropic_tool(pydantic_model: Type[BaseModel]) -> Dict[str, Any]: